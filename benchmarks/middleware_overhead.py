@@ -0,0 +1,156 @@
+# benchmarks/middleware_overhead.py
+import sys
+import time
+import asyncio
+import logging
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import httpx
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import create_async_engine
+
+# 미들웨어 요청당 오버헤드 측정
+#   python benchmarks/middleware_overhead.py [--requests 1000] [--rounds 3] [path ...]
+# - repo 루트에서 실행 (.env 사용), .env의 Redis가 실행 중이어야 한다. (세션, 캐시)
+# - DB는 임시 SQLite 파일(aiosqlite)에 사용자 1명 + 게시글을 넣고 primary 엔진을 바꿔서 사용 (MySQL 불필요)
+# - 그 사용자로 서명한 access token을 보내므로 /posts는 인증 + 목록 조회(캐시)까지 실행된다.
+# - main.app(등록된 미들웨어 그대로)과, 같은 app에서 CORS를 제외한 사용자 미들웨어를 뺀 app을
+#   httpx.ASGITransport로 번갈아 호출해서 요청당 지연 시간 차이를 출력 (네트워크/서버 프로세스 없음)
+DEFAULT_PATHS = ("/", "/posts")
+POSTS = 50
+
+
+class SessionStateOnly:
+    """
+    미들웨어를 뺀 app에서도 라우트가 동작하도록 request.state.session만 채우는 최소 ASGI 래퍼
+    (Depends(get_session)이 필요로 함, 쿠키/저장/로깅 없음)
+    """
+    def __init__(self, app, session_store):
+        self.app = app
+        self.session_store = session_store
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            scope.setdefault("state", {})["session"] = self.session_store.open(None)
+        await self.app(scope, receive, send)
+
+
+def without_user_middleware(app: FastAPI, session_store):
+    """CORS만 남긴 같은 app (라우터/예외 핸들러 공유) + request.state.session"""
+    bare = FastAPI()
+    bare.router = app.router
+    bare.exception_handlers = app.exception_handlers
+    bare.user_middleware = [m for m in app.user_middleware if m.cls is CORSMiddleware]
+    return SessionStateOnly(bare, session_store)
+
+
+async def seed_database(directory: str):
+    """임시 SQLite에 사용자 1명 + 게시글을 넣고 primary 엔진으로 지정, access token 반환"""
+    import common.model.models_registry  # noqa: F401 (모든 모델 등록)
+    import database.mysql_connection as mysql_connection
+    from common.model.base_model import Base
+    from auth.service import AuthService
+    from auth.schemas.request import LoginUserSchema
+    from post.model import PostModel
+    from user.model import UserModel
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{Path(directory) / 'benchmark.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(UserModel), [{"id": 1, "nickname": "bench", "email": "bench@example.com", "password": "hashed"}])
+        await conn.execute(insert(PostModel), [
+            {"title": f"게시글 {i}", "content": "content", "author_id": 1, "likeCount": 0, "commentCount": 0}
+            for i in range(POSTS)
+        ])
+    # RoutingSession.get_bind가 사용하는 primary 엔진 (복제본은 .env에 없다고 가정)
+    mysql_connection.async_engine = engine
+
+    token = AuthService(None, None).sign_token(LoginUserSchema(id=1, email="bench@example.com"), is_refresh=False)
+    return engine, token
+
+
+async def measure(app, path: str, requests: int, headers: dict) -> list[float]:
+    """요청별 소요 시간(초)"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        # 첫 요청(미들웨어 스택 생성, 세션/캐시 채우기, import 지연 등)은 제외
+        for _ in range(20):
+            await client.get(path, headers=headers)
+        timings = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            await client.get(path, headers=headers)
+            timings.append(time.perf_counter() - start)
+        return timings
+
+
+def summarize(timings: list[float]) -> tuple[float, float]:
+    """(중앙값, p95) 마이크로초"""
+    ordered = sorted(timings)
+    return statistics.median(ordered) * 1e6, ordered[int(len(ordered) * 0.95)] * 1e6
+
+
+async def run(paths: tuple[str, ...], requests: int, rounds: int, directory: str):
+    engine, token = await seed_database(directory)
+
+    from main import app
+    from cache.redis_connection import redis
+    from common.middleware.session import RedisSessionStore
+
+    # 클라이언트 쪽 요청 로그는 측정 대상이 아니므로 제외 (앱의 요청 로그는 미들웨어 비용에 포함)
+    # aiosqlite의 DEBUG 로그도 벤치마크용 DB에서만 나오는 것이므로 제외
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("aiosqlite").setLevel(logging.WARNING)
+    names = [m.cls.__name__ for m in app.user_middleware if m.cls is not CORSMiddleware]
+    bare = without_user_middleware(app, RedisSessionStore(redis))
+    headers = {"Authorization": f"Bearer {token}"}
+
+    # 앱 로그와 섞이지 않도록 결과는 마지막에 한 번에 출력
+    lines = [
+        f"미들웨어: {', '.join(names) or '(없음)'}",
+        f"{'path':<10}{'status':>8}{'with p50':>12}{'bare p50':>12}{'overhead':>12}{'with p95':>12}",
+    ]
+    try:
+        for path in paths:
+            # 두 app 모두 같은 응답을 내는지 먼저 확인 (인증 실패로 빨리 끝나는 경로를 재지 않도록)
+            statuses = []
+            for target in (app, bare):
+                async with httpx.AsyncClient(transport=httpx.ASGITransport(app=target), base_url="http://benchmark") as client:
+                    statuses.append((await client.get(path, headers=headers)).status_code)
+            if statuses[0] != statuses[1]:
+                raise SystemExit(f"{path}: 응답 상태가 다릅니다. (with {statuses[0]}, bare {statuses[1]})")
+
+            # 순서 영향(GC, 캐시)을 줄이기 위해 두 app을 번갈아 rounds번 측정
+            with_timings, bare_timings = [], []
+            for _ in range(rounds):
+                with_timings += await measure(app, path, requests, headers)
+                bare_timings += await measure(bare, path, requests, headers)
+            with_p50, with_p95 = summarize(with_timings)
+            bare_p50, _ = summarize(bare_timings)
+            lines.append(f"{path:<10}{statuses[0]:>8}{with_p50:>10.1f}us{bare_p50:>10.1f}us{with_p50 - bare_p50:>10.1f}us{with_p95:>10.1f}us")
+        print("\n".join(lines))
+    finally:
+        # 이벤트 루프가 닫힌 뒤 풀 연결이 정리되며 나는 경고 방지
+        await redis.connection_pool.disconnect()
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="미들웨어 요청당 오버헤드 측정")
+    parser.add_argument("--requests", type=int, default=1000, help="round당 path별 요청 수")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("paths", nargs="*", default=list(DEFAULT_PATHS))
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run(tuple(args.paths), args.requests, args.rounds, directory))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# benchmarks/pagination_projection.py
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+import common.model.models_registry  # noqa: F401 (모든 모델 등록)
+from common.model.base_model import Base
+from common.file.file_model import FileModel
+from common.file.enums.file_model_type_enum import FileModelType
+from common.pagination.service import CommonService
+from post.model import PostModel
+from post.query.default_options import get_post_list_query, POST_LIST_PROJECTION
+from post.schemas.request import PaginatePostSchema
+from post.schemas.response import PostSchema, PaginatedPostSchema
+from user.model import UserModel
+
+# CommonService.paginate: ORM 경로(base_query=post_list 프로필) vs 컬럼 프로젝션 경로 (GET /posts 첫 페이지)
+#   python benchmarks/pagination_projection.py [--posts 2000] [--requests 300] [--rounds 3]
+# - repo 루트에서 실행 (.env 사용), 임시 SQLite 파일(aiosqlite)에 게시글/작성자/파일(게시글당 2개)을 넣고 측정
+# - 측정 구간: paginate → PostSchema 변환 → 응답 JSON 직렬화 (PostService.build_paginated_posts와 같은 과정)
+# - 요청마다 새 세션 (요청 간 identity map 재사용 없음)
+TAKES = (20, 200)
+FILES_PER_POST = 2
+
+
+async def seed(engine, posts: int):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        users = max(posts // 10, 1)
+        await conn.execute(insert(UserModel), [
+            {"id": i + 1, "nickname": f"user{i}", "email": f"user{i}@example.com", "password": "hashed"}
+            for i in range(users)
+        ])
+        await conn.execute(insert(PostModel), [
+            {"id": i + 1, "title": f"게시글 {i}", "content": "content", "author_id": i % users + 1,
+             "likeCount": i % 97, "commentCount": 0}
+            for i in range(posts)
+        ])
+        await conn.execute(insert(FileModel), [
+            {"path": f"/files/{post_id}-{order}", "original_name": f"{post_id}-{order}.pdf", "size": 1,
+             "type": FileModelType.PDF, "order": order, "post_id": post_id}
+            for post_id in range(1, posts + 1)
+            for order in range(FILES_PER_POST)
+        ])
+
+
+async def render(engine, take: int, projection: bool) -> bytes:
+    async with AsyncSession(engine, expire_on_commit=False, autoflush=False) as session:
+        options = {"projection": POST_LIST_PROJECTION} if projection else {"base_query": get_post_list_query()}
+        result = await CommonService().paginate(PaginatePostSchema(take=take), PostModel, session, path="posts", **options)
+        response = PaginatedPostSchema(
+            posts=[PostSchema.model_validate(post) for post in result.data],
+            count=result.count,
+            cursor=result.cursor,
+            next=result.next,
+            prev=result.prev,
+        )
+        return response.model_dump_json(exclude_none=True).encode("utf-8")
+
+
+async def measure(engine, take: int, projection: bool, requests: int) -> list[float]:
+    """요청별 소요 시간(초), 처음 20번은 워밍업으로 제외"""
+    for _ in range(20):
+        await render(engine, take, projection)
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        await render(engine, take, projection)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def summarize(timings: list[float]) -> tuple[float, float]:
+    """(중앙값, p95) 마이크로초"""
+    ordered = sorted(timings)
+    return statistics.median(ordered) * 1e6, ordered[int(len(ordered) * 0.95)] * 1e6
+
+
+async def run(posts: int, requests: int, rounds: int):
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{Path(directory) / 'bench.db'}")
+        try:
+            await seed(engine, posts)
+            lines = [f"{'take':>6}{'orm p50':>12}{'proj p50':>12}{'speedup':>10}{'orm p95':>12}{'proj p95':>12}"]
+            for take in TAKES:
+                # 두 경로가 같은 응답을 만드는지 먼저 확인
+                if await render(engine, take, projection=False) != await render(engine, take, projection=True):
+                    raise SystemExit(f"take={take}: ORM / 프로젝션 응답이 다릅니다.")
+                # 순서 영향(GC, 캐시)을 줄이기 위해 두 경로를 번갈아 rounds번 측정
+                orm_timings, projection_timings = [], []
+                for _ in range(rounds):
+                    orm_timings += await measure(engine, take, False, requests)
+                    projection_timings += await measure(engine, take, True, requests)
+                orm_p50, orm_p95 = summarize(orm_timings)
+                projection_p50, projection_p95 = summarize(projection_timings)
+                lines.append(
+                    f"{take:>6}{orm_p50:>10.0f}us{projection_p50:>10.0f}us{orm_p50 / projection_p50:>9.2f}x"
+                    f"{orm_p95:>10.0f}us{projection_p95:>10.0f}us"
+                )
+            print("\n".join(lines))
+        finally:
+            await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="paginate ORM 경로 vs 컬럼 프로젝션 경로")
+    parser.add_argument("--posts", type=int, default=2000, help="넣을 게시글 수")
+    parser.add_argument("--requests", type=int, default=300, help="round당 take별 요청 수")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.posts, args.requests, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""post cursor sort indexes
+
+Revision ID: d41e7a2c9b13
+Revises: 050c04c6b485
+Create Date: 2026-10-18 18:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41e7a2c9b13'
+down_revision: Union[str, None] = '050c04c6b485'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 커서 페이지네이션 (likeCount, id) / (created_at, id) 행 값 비교용 복합 인덱스
+    op.create_index('ix_post_likeCount_id', 'post', ['likeCount', 'id'], unique=False)
+    op.create_index('ix_post_created_at_id', 'post', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_post_created_at_id', table_name='post')
+    op.drop_index('ix_post_likeCount_id', table_name='post')
@@ -0,0 +1,32 @@
+"""post title fulltext ngram
+
+Revision ID: e5b8c3f1a720
+Revises: d41e7a2c9b13
+Create Date: 2026-10-18 19:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8c3f1a720'
+down_revision: Union[str, None] = 'd41e7a2c9b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # where__title__search 전문 검색용 FULLTEXT 인덱스 (ngram parser, MySQL 전용 옵션)
+    op.create_index(
+        'ft_post_title', 'post', ['title'], unique=False,
+        mysql_prefix='FULLTEXT', mysql_with_parser='ngram',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ft_post_title', table_name='post')
@@ -0,0 +1,33 @@
+"""repository query indexes
+
+Revision ID: f2a9d6b4c815
+Revises: e5b8c3f1a720
+Create Date: 2026-10-18 19:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a9d6b4c815'
+down_revision: Union[str, None] = 'e5b8c3f1a720'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # database/query_plan.py 점검에서 풀 스캔 / filesort로 나온 file 테이블 조회
+    op.create_index('ix_file_owner_type_owner_id', 'file', ['owner_type', 'owner_id'], unique=False)
+    op.create_index('ix_file_original_name', 'file', ['original_name'], unique=False)
+    op.create_index('ix_file_post_id_order_id', 'file', ['post_id', 'order', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_file_post_id_order_id', table_name='file')
+    op.drop_index('ix_file_original_name', table_name='file')
+    op.drop_index('ix_file_owner_type_owner_id', table_name='file')
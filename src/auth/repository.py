@@ -1,6 +1,12 @@
 from redis.asyncio import Redis
 from typing import Optional
 import time  
+from auth.utils.token_blacklist import (
+    token_blacklist,
+    get_token_id,
+    BLACKLIST_CHANNEL,
+    BLACKLIST_KEY_PREFIX,
+)
 
 
 class AuthRepository:
@@ -22,9 +28,22 @@ class AuthRepository:
         await self.redis.delete(f"refresh:{user_id}")
 
     async def is_blacklisted(self, token: str) -> bool:
-        return await self.redis.exists(f"blacklist:{token}") == 1
+        token_id = get_token_id(token)
+
+        # pub/sub으로 동기화된 메모리 목록 사용 (동기화가 끊긴 경우에만 Redis 직접 조회)
+        if token_blacklist.is_synced:
+            return token_blacklist.contains(token_id)
+        return await self.redis.exists(f"{BLACKLIST_KEY_PREFIX}{token_id}") == 1
 
     async def blacklist_token(self, token: str, exp: int):
         ttl = exp - int(time.time())
         if ttl > 0:
-            await self.redis.setex(f"blacklist:{token}", ttl, "1")
+            token_id = get_token_id(token)
+
+            # 저장과 동시에 다른 워커들에게 알림
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.setex(f"{BLACKLIST_KEY_PREFIX}{token_id}", ttl, "1")
+                pipe.publish(BLACKLIST_CHANNEL, f"{token_id}:{exp}")
+                await pipe.execute()
+
+            token_blacklist.add(token_id, exp)
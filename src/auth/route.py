@@ -15,7 +15,7 @@ from auth.schemas.request import (
 )
 
 from database.dependencies import get_db
-from cache.dependencies import get_redis
+from cache.dependencies import get_redis, get_session
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
@@ -35,6 +35,7 @@ async def post_login_email(
     response: Response,
     # 로그인 API - Basic Token 인증
     _1: None = Depends(basic_token),
+    _2: None = Depends(get_session),  # 세션 장바구니 병합용 세션 로드
     db: AsyncSession = Depends(get_db),
     redis: Redis = Depends(get_redis),
     
@@ -83,6 +84,7 @@ async def register_user(
     request: Request,
     user_data: RegisterUserSchema,
     response: Response,
+    _: None = Depends(get_session),  # 세션 장바구니 병합용 세션 로드
     db: AsyncSession = Depends(get_db),
     redis: Redis = Depends(get_redis),
 ):
@@ -150,6 +152,7 @@ async def login_login_id(
     request : Request,
     response: Response,
     _1: None = Depends(basic_token),  # login_id 기반 BasicAuth
+    _2: None = Depends(get_session),  # 세션 장바구니 병합용 세션 로드
     db: AsyncSession = Depends(get_db),
     redis: Redis = Depends(get_redis),
 ):
@@ -170,6 +173,7 @@ async def login_phone(
     request : Request,
     response: Response,
     _1: None = Depends(basic_token),  # phone 기반 BasicAuth
+    _2: None = Depends(get_session),  # 세션 장바구니 병합용 세션 로드
     db: AsyncSession = Depends(get_db),
     redis: Redis = Depends(get_redis),
 ):
@@ -191,6 +195,7 @@ async def register_user_login_id(
     request: Request,
     user_data: RegisterUserSchema,
     response: Response,
+    _: None = Depends(get_session),  # 세션 장바구니 병합용 세션 로드
     db: AsyncSession = Depends(get_db),
     redis: Redis = Depends(get_redis),
 ):
@@ -212,6 +217,7 @@ async def register_user_phone(
     request: Request,
     user_data: RegisterUserSchema,
     response: Response,
+    _: None = Depends(get_session),  # 세션 장바구니 병합용 세션 로드
     db: AsyncSession = Depends(get_db),
     redis: Redis = Depends(get_redis),
 ):
@@ -1,5 +1,4 @@
 import base64
-import bcrypt
 # from jose import jwt, JWTError  
 import jwt  # python-jose 대신 pyjwt 사용
 from jwt import ExpiredSignatureError, InvalidTokenError
@@ -23,6 +22,8 @@ from auth.schemas.request import LoginUserSchema
 from auth.repository import AuthRepository
 from cart.repository import CartRepository
 from cache.session_service import SessionService
+from auth.utils.token_cache import decode_verified_token
+from auth.utils.password_hasher import password_hasher
 
 class AuthService:
     def __init__(self, db: AsyncSession, redis: Redis):
@@ -97,9 +98,9 @@ class AuthService:
             raise UnauthorizedException("잘못된 Basic Token 입니다.")
 
     def verify_token(self, token: str) -> dict:
-        """JWT 검증"""
+        """JWT 검증 (검증된 토큰 캐시 사용)"""
         try:
-            payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.ALGORITHM])
+            payload = decode_verified_token(token)
             return payload
         except jwt.ExpiredSignatureError:
             raise UnauthorizedException("토큰이 만료되었습니다.")
@@ -134,13 +135,14 @@ class AuthService:
     async def authenticate_with_field(
         self, field: str, identifier: str, password: str
     ) -> UserSchema:
-        """필드 기반 사용자 인증"""
+        """필드 기반 사용자 인증 (password 해시가 필요하므로 사용자 캐시가 아닌 DB 조회)"""
         user = await self.user_repository.get_user_by_field(field, identifier)
 
         if not user:
             raise NotFoundException("User")
 
-        if not bcrypt.checkpw(password.encode("utf-8"), user.password.encode("utf-8")):
+        # bcrypt 검증은 전용 스레드 풀에서 실행 (이벤트 루프 블로킹 방지)
+        if not await password_hasher.verify(password, user.password):
             raise UnauthorizedException("비밀번호가 일치하지 않습니다.")
         
         return UserSchema.model_validate(user)
@@ -202,14 +204,8 @@ class AuthService:
             if value and await self.user_repository.get_user_by_field(field, value):
                 raise ConflictException(f"이미 등록된 {field}입니다.")
 
-        # 환경 변수에서 BCRYPT_ROUNDS 값 가져오기
-        rounds = settings.BCRYPT_ROUNDS  
-        
-        # 비밀번호 해싱은 서비스에서 처리
-        hashed_password = bcrypt.hashpw(
-            user_data.password.encode("utf-8"), 
-            bcrypt.gensalt(rounds=rounds)
-        ).decode("utf-8")
+        # 비밀번호 해싱은 서비스에서 처리 (BCRYPT_ROUNDS, 전용 스레드 풀에서 실행)
+        hashed_password = await password_hasher.hash(user_data.password)
 
 
         # Pydantic -> SQLAlchemy 변환 (UserModel.create() 사용)
@@ -248,9 +244,9 @@ class AuthService:
 
 @staticmethod
 def decode_jwt_token(token: str) -> TokenPayloadSchema:
-    """JWT 토큰을 검증하고, 사용자 정보(id, email)를 추출"""
+    """JWT 토큰을 검증하고, 사용자 정보(id, email)를 추출 (검증된 토큰 캐시 사용)"""
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.ALGORITHM])
+        payload = decode_verified_token(token)
         
         return TokenPayloadSchema(
             id=int(payload["sub"]),                      
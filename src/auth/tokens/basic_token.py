@@ -53,10 +53,7 @@ async def basic_token(
     if not user:
         raise HTTPException(status_code=401, detail="이메일 또는 비밀번호가 올바르지 않습니다.")
 
-    # # Redis에 캐싱 (dict 형태로)
-    # redis_key = f"user:{user.id}"
-    # user_dict = UserSchema.model_validate(user).model_dump()
-    # await redis.setex(redis_key, 3600, json.dumps(user_dict))
+    # 비밀번호 검증은 사용자 캐시(user/cache.py)를 거치지 않고 DB에서 (캐시에는 password 해시를 두지 않음)
 
     await db.rollback()
     request.state.user = user
@@ -1,12 +1,13 @@
 from fastapi import Depends, HTTPException, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from auth.service import AuthService
-from user.repository import UserRepository
+from user.cache import user_cache
 from sqlalchemy.ext.asyncio import AsyncSession
 from auth.repository import AuthRepository
 from user.schemas.response import UserSchema
 from database.dependencies import get_db
-from cache.dependencies import get_redis
+from cache.dependencies import get_redis, get_session
+from common.middleware.session import RedisSession
 from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
 import logging
@@ -20,6 +21,7 @@ async def bearer_token(
     auth_header: HTTPAuthorizationCredentials = Depends(security),  #  자동으로 Authorization 헤더 파싱
     db: AsyncSession = Depends(get_db),
     redis: Redis = Depends(get_redis),
+    session: RedisSession = Depends(get_session),
 ):
     """
      공통 인증 처리 (Bearer 토큰 검증 + 사용자 정보 로딩 + request.state 주입)
@@ -31,7 +33,6 @@ async def bearer_token(
 
     auth_service = AuthService(db, redis)                          #  JWT 검증 로직을 담당하는 서비스
     auth_repository = AuthRepository(redis)                    #  토큰 블랙리스트 조회용 Redis 또는 DB
-    user_repository = UserRepository(db)                    #  사용자 정보 DB 조회용 Repository
 
     # 1. Authorization 헤더 확인
     if not auth_header:
@@ -52,7 +53,6 @@ async def bearer_token(
         raise HTTPException(status_code=401, detail="토큰에 사용자 ID가 없습니다.")
 
     # 5. 세션에서 사용자 정보 조회
-    session = request.state.session
     user_dict = session.get("user")
 
     user_data = None
@@ -62,13 +62,13 @@ async def bearer_token(
         except Exception as e:
             logger.warning(f"세션 사용자 정보 파싱 실패: {e}")
 
-    # 6. 세션에 없으면 DB에서 조회 후 세션에 저장
+    # 6. 세션에 없으면 사용자 캐시(없으면 DB)에서 조회 후 세션에 저장
     if not user_data:
-        user_model = await user_repository.get_user_by_id(user_id)
-        if not user_model:
+        user_record = await user_cache.get_user(db, "id", user_id)
+        if not user_record:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
 
-        user_data = UserSchema.model_validate(user_model)  # SQLAlchemy → Pydantic 변환
+        user_data = UserSchema.model_validate(user_record.model_dump())  # password 제외한 UserSchema 필드만
         try:
             session["user"] = user_data.model_dump()  #  Redis 세션 갱신
         except Exception as e:
@@ -0,0 +1,119 @@
+import asyncio
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+import bcrypt
+from fastapi import status
+from common.const.settings import settings
+from common.exceptions.base import AppException
+from common.metrics.registry import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasher:
+    """
+    bcrypt 해싱/검증을 이벤트 루프 밖의 전용 스레드 풀에서 실행
+    - bcrypt는 GIL을 풀고 계산하므로 스레드 풀에서 병렬로 처리된다.
+    - 대기 중인 작업이 max_pending을 넘으면 바로 503을 돌려줘서 로그인 폭주가 다른 요청을 막지 않게 한다.
+    - 대기 시간(queue wait)과 해싱 시간(hash time)을 기록
+    """
+    def __init__(self, pool_size: int, max_pending: int):
+        self.pool_size = pool_size
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+
+        self.completed = 0
+        self.rejected = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+        self.hash_time_total = 0.0
+        self.hash_time_max = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix="bcrypt")
+        return self._executor
+
+    async def _run(self, func: Callable, *args):
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            logger.warning(f" bcrypt 대기열 초과: pending={self._pending}")
+            raise AppException(
+                code="SERVICE_BUSY",
+                message="요청이 많아 잠시 후 다시 시도해주세요.",
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
+        submitted = time.perf_counter()
+
+        def job():
+            started = time.perf_counter()
+            result = func(*args)
+            return result, started - submitted, time.perf_counter() - started
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result, queue_wait, hash_time = await loop.run_in_executor(self._get_executor(), job)
+        finally:
+            self._pending -= 1
+
+        self.completed += 1
+        self.queue_wait_total += queue_wait
+        self.queue_wait_max = max(self.queue_wait_max, queue_wait)
+        self.hash_time_total += hash_time
+        self.hash_time_max = max(self.hash_time_max, hash_time)
+        return result
+
+    async def hash(self, password: str) -> str:
+        """비밀번호 해싱 (BCRYPT_ROUNDS 사용)"""
+        hashed = await self._run(
+            bcrypt.hashpw,
+            password.encode("utf-8"),
+            bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+        )
+        return hashed.decode("utf-8")
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """비밀번호 검증"""
+        return await self._run(
+            bcrypt.checkpw,
+            password.encode("utf-8"),
+            hashed_password.encode("utf-8")
+        )
+
+    def stats(self) -> dict:
+        return {
+            "pool_size": self.pool_size,
+            "pending": self._pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "queue_wait_seconds_total": self.queue_wait_total,
+            "queue_wait_seconds_max": self.queue_wait_max,
+            "hash_seconds_total": self.hash_time_total,
+            "hash_seconds_max": self.hash_time_max,
+        }
+
+    def collect(self) -> list[tuple[str, str, str, float]]:
+        """/metrics용 값"""
+        return [
+            ("bcrypt_pending", "gauge", "bcrypt jobs waiting or running", self._pending),
+            ("bcrypt_completed_total", "counter", "bcrypt jobs completed", self.completed),
+            ("bcrypt_rejected_total", "counter", "bcrypt jobs rejected by queue-depth limit", self.rejected),
+            ("bcrypt_queue_wait_seconds_total", "counter", "Total time bcrypt jobs waited for a worker", self.queue_wait_total),
+            ("bcrypt_queue_wait_seconds_max", "gauge", "Longest time a bcrypt job waited for a worker", self.queue_wait_max),
+            ("bcrypt_hash_seconds_total", "counter", "Total bcrypt hashing time", self.hash_time_total),
+            ("bcrypt_hash_seconds_max", "gauge", "Longest bcrypt hashing time", self.hash_time_max),
+        ]
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(settings.BCRYPT_POOL_SIZE, settings.BCRYPT_MAX_PENDING)
+metrics.register_collector(password_hasher.collect)
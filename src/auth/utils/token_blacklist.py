@@ -0,0 +1,119 @@
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Optional
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+# 로그아웃된 토큰을 모든 워커에 알리는 Redis pub/sub 채널
+BLACKLIST_CHANNEL = "auth:blacklist"
+BLACKLIST_KEY_PREFIX = "blacklist:"
+
+
+def get_token_id(token: str) -> str:
+    """블랙리스트 key로 사용할 토큰 식별자 (원문 JWT 대신 sha256 digest)"""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class TokenBlacklist:
+    """
+    워커 프로세스마다 보관하는 로그아웃 토큰 목록 (token_id -> exp)
+    - 앱 시작 시 Redis의 blacklist:* 키로 채우고, 이후에는 pub/sub 채널로 동기화
+    - 요청마다 Redis EXISTS를 호출하지 않고 메모리에서 바로 확인한다.
+    - exp가 지난 토큰은 어차피 JWT 검증에서 거절되므로 목록에서 제거
+    - 동기화가 끊긴 동안(is_synced=False)에는 호출하는 쪽에서 Redis로 직접 확인해야 한다.
+    """
+    def __init__(self):
+        self._entries: dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.is_synced = False
+
+    def add(self, token_id: str, exp: float):
+        self.prune()
+        if exp > time.time():
+            self._entries[token_id] = exp
+
+    def contains(self, token_id: str) -> bool:
+        exp = self._entries.get(token_id)
+        if exp is None:
+            return False
+        if exp <= time.time():
+            self._entries.pop(token_id, None)
+            return False
+        return True
+
+    def prune(self):
+        now = time.time()
+        for token_id in [k for k, exp in self._entries.items() if exp <= now]:
+            del self._entries[token_id]
+
+    async def load(self, redis: Redis):
+        """Redis에 남아있는 blacklist:* 키를 TTL과 함께 가져와서 목록을 채운다."""
+        keys = [key async for key in redis.scan_iter(match=f"{BLACKLIST_KEY_PREFIX}*", count=500)]
+        if not keys:
+            return
+
+        async with redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.ttl(key)
+            ttls = await pipe.execute()
+
+        now = time.time()
+        for key, ttl in zip(keys, ttls):
+            if ttl is None or ttl <= 0:
+                continue
+            token_id = (key.decode("utf-8") if isinstance(key, bytes) else key)[len(BLACKLIST_KEY_PREFIX):]
+            # 이전 형식(blacklist:<원문 JWT>)으로 저장된 키도 token_id로 변환
+            if "." in token_id:
+                token_id = get_token_id(token_id)
+            self._entries[token_id] = now + ttl
+
+    async def start(self, redis: Redis):
+        """pub/sub 구독 태스크 시작 (lifespan에서 호출)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen(redis))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.is_synced = False
+
+    async def _listen(self, redis: Redis):
+        while True:
+            pubsub = redis.pubsub()
+            try:
+                # 구독을 먼저 하고 나서 목록을 불러와야 그 사이의 로그아웃을 놓치지 않는다.
+                await pubsub.subscribe(BLACKLIST_CHANNEL)
+                await self.load(redis)
+                self.is_synced = True
+                logger.info(f" 토큰 블랙리스트 동기화 시작: {len(self._entries)}개")
+
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    data = message["data"]
+                    data = data.decode("utf-8") if isinstance(data, bytes) else data
+                    token_id, exp = data.rsplit(":", 1)
+                    self.add(token_id, float(exp))
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.is_synced = False
+                logger.warning(f" 토큰 블랙리스트 동기화 끊김, 1초 후 재시도: {e}")
+                await asyncio.sleep(1)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+
+token_blacklist = TokenBlacklist()
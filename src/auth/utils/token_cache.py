@@ -0,0 +1,94 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional
+import jwt
+from common.const.settings import settings
+from common.metrics.registry import metrics
+
+
+class VerifiedTokenCache:
+    """
+    서명 검증이 끝난 JWT payload를 보관하는 워커 단위 LRU 캐시
+    - key: 토큰의 sha256 digest (원문 토큰은 메모리에 보관하지 않음)
+    - 토큰의 exp 시각이 지나면 자동으로 무효화 → 다시 jwt.decode에서 만료 예외 발생
+    - 미들웨어 인증(decode_jwt_token)과 bearer_token(verify_token)이 같은 캐시를 사용하므로
+      같은 토큰은 워커당 한 번만 HMAC 검증된다.
+    """
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[dict, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        key = self._digest(token)
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        payload, exp = entry
+        if exp <= time.time():
+            # 만료된 토큰은 캐시에서 제거하고 다시 검증하도록 miss 처리
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return dict(payload)
+
+    def set(self, token: str, payload: dict):
+        exp = payload.get("exp")
+
+        # exp가 없는 토큰은 언제 무효화할지 알 수 없으므로 캐싱하지 않는다.
+        if self.max_size <= 0 or exp is None:
+            return
+
+        key = self._digest(token)
+        self._entries[key] = (dict(payload), float(exp))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def collect(self) -> list[tuple[str, str, str, float]]:
+        """/metrics용 값"""
+        return [
+            ("jwt_cache_hits_total", "counter", "Verified JWT cache hits", self.hits),
+            ("jwt_cache_misses_total", "counter", "Verified JWT cache misses", self.misses),
+            ("jwt_cache_size", "gauge", "Verified JWT cache entries", len(self._entries)),
+        ]
+
+
+token_cache = VerifiedTokenCache(settings.JWT_CACHE_MAX_SIZE)
+metrics.register_collector(token_cache.collect)
+
+
+def decode_verified_token(token: str) -> dict:
+    """
+    캐시에 있으면 검증된 payload를 그대로 반환하고, 없으면 jwt.decode로 검증 후 캐싱
+    - 검증 실패 시 jwt.ExpiredSignatureError / jwt.InvalidTokenError 그대로 발생
+    """
+    payload = token_cache.get(token)
+    if payload is None:
+        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.ALGORITHM])
+        token_cache.set(token, payload)
+    return payload
@@ -1,6 +1,16 @@
 # src/cache/dependencies.py
+from fastapi import Request
 from redis.asyncio import Redis
 from cache.redis_connection import redis
+from common.middleware.session import RedisSession
 
 async def get_redis() -> Redis:
     return redis
+
+async def get_session(request: Request) -> RedisSession:
+    """
+    request.state.session을 redis에서 로드해서 반환 (요청당 처음 한 번만 HGETALL)
+    - 세션을 읽거나 쓰는 핸들러/의존성은 반드시 이 의존성을 거쳐야 한다.
+    """
+    session: RedisSession = request.state.session
+    return await session.load()
@@ -0,0 +1,39 @@
+# src/cache/generation.py
+import logging
+from typing import Iterable
+from cache.redis_connection import redis
+
+logger = logging.getLogger(__name__)
+
+# 테이블별 세대(generation) 번호: 해당 테이블에 쓰기가 커밋될 때마다 INCR
+# - 캐시 key에 세대 번호를 넣어두면 쓰기 한 번으로 관련 캐시 전체가 O(1)로 무효화된다. (key scan 없음)
+# - 이전 세대 번호로 만든 캐시 항목(count:*, post_list:* 등)은 각자의 TTL로 자연 만료
+# - 세대 번호 key(gen:*)는 TTL 없이 유지: 만료되어 0부터 다시 세면 이전 번호가 재사용되어
+#   예전 캐시 항목/ETag(게시글 목록)가 다른 내용과 다시 일치할 수 있다.
+GENERATION_KEY_PREFIX = "gen:"
+
+
+async def get_generation(table: str) -> int:
+    value = await redis.get(f"{GENERATION_KEY_PREFIX}{table}")
+    return int(value) if value else 0
+
+
+async def get_generations(tables: Iterable[str]) -> list[int]:
+    """여러 테이블의 세대 번호를 MGET 한 번으로 조회 (목록 캐시 key용)"""
+    values = await redis.mget([f"{GENERATION_KEY_PREFIX}{table}" for table in tables])
+    return [int(value) if value else 0 for value in values]
+
+
+async def bump_generations(tables: Iterable[str]):
+    """커밋된 쓰기의 테이블 세대 번호 증가 (get_db에서 커밋 후 호출)"""
+    tables = sorted(set(tables))
+    if not tables:
+        return
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            for table in tables:
+                pipe.incr(f"{GENERATION_KEY_PREFIX}{table}")
+            await pipe.execute()
+    except Exception as e:
+        # 캐시 무효화 실패는 응답을 막지 않는다. (현재 세대의 캐시 항목은 각자의 TTL로 만료)
+        logger.warning(f" 캐시 세대 갱신 실패 {tables}: {e}")
@@ -0,0 +1,213 @@
+# src/cache/read_through.py
+import math
+import time
+import random
+import asyncio
+import logging
+from typing import Awaitable, Callable, Iterable, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from cache.two_tier import TwoTierCache, delete_keys
+from cache.single_flight import SingleFlight
+from common.const.settings import settings
+from common.metrics.registry import metrics
+from database.mysql_connection import PENDING_CACHE_KEYS
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[[], Awaitable[Optional[bytes]]]
+# (값, version) - version은 값과 같이 저장해서 hit 때 그대로 돌려주는 문자열 (응답 ETag 등)
+Entry = tuple[bytes, str]
+EntryLoader = Callable[[], Awaitable[Optional[Entry]]]
+
+_caches: list["ReadThroughCache"] = []
+
+
+class ReadThroughCache:
+    """
+    직렬화된 응답(bytes)을 보관하는 Redis read-through 캐시
+    - 저장 값: "{fresh_until} {조회 소요 시간} {version}\\n{payload}", Redis TTL = ttl + stale_ttl
+    - version: 값을 만들 때 같이 계산한 버전(ETag 등), get_entry로 조회하면 hit 때 DB 없이 반환
+    - fresh_until 이전이면 hit, 이후 stale 구간에서는 stale 값을 바로 반환하고
+      백그라운드에서 갱신 (stale-while-revalidate, refresh 함수를 넘긴 경우만)
+    - 확률적 조기 갱신(XFetch): 만료가 가까울수록, 조회가 오래 걸리는 값일수록 높은 확률로
+      요청 하나가 만료 전에 미리 갱신 → 한 시점에 모든 요청이 miss 나는 것을 방지
+    - miss는 single-flight로 합쳐서 같은 key의 동시 miss는 loader 한 번만 실행
+    - 저장소는 2단 캐시 (워커 local → Redis, prefix "{name}:")
+    - Redis 장애 시 캐시 없이 loader로 조회 (응답을 막지 않음)
+    """
+    def __init__(self, name: str, ttl: int, stale_ttl: int = 0, enabled: bool = True):
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.enabled = enabled
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.early_refreshes = 0
+        self.errors = 0
+        self.early_refresh_beta = settings.CACHE_EARLY_REFRESH_BETA
+        self.flight = SingleFlight(name)
+        self._refreshing: dict[str, asyncio.Task] = {}
+        self.store = TwoTierCache(name, prefix=f"{name}:")
+        _caches.append(self)
+
+    def key(self, *parts) -> str:
+        return ":".join([self.name, *map(str, parts)])
+
+    async def get(self, key: str, load: Loader, refresh: Optional[Loader] = None) -> Optional[bytes]:
+        """
+        캐시 조회, 없으면 load() 결과를 저장 후 반환 (None은 저장하지 않음)
+        - refresh: stale 값 갱신용 loader (요청 세션이 닫힌 뒤 실행되므로 자체 세션을 사용해야 함)
+        """
+        entry = await self.get_entry(key, _entry_loader(load), _entry_loader(refresh) if refresh else None)
+        return entry[0] if entry else None
+
+    async def get_entry(self, key: str, load: EntryLoader, refresh: Optional[EntryLoader] = None) -> Optional[Entry]:
+        """get과 같지만 loader가 (값, version)을 반환하고, 캐시 hit이면 저장해 둔 version을 같이 반환 (ETag용)"""
+        if not self.enabled:
+            return await load()
+
+        try:
+            cached = await self.store.get(key)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f" 캐시 조회 실패 {key}: {e}")
+            return await load()
+
+        if cached is not None:
+            fresh_until, delta, version, payload = self._parse(cached)
+            now = time.time()
+            if fresh_until > now and not self._should_refresh_early(fresh_until, delta, now):
+                self.hits += 1
+                return payload, version
+            if refresh is not None:
+                if fresh_until > now:
+                    self.early_refreshes += 1
+                else:
+                    self.stale_hits += 1
+                self._schedule_refresh(key, refresh)
+                return payload, version
+            if fresh_until > now:
+                # 갱신 함수가 없으면 조기 갱신에 당첨된 이 요청만 직접 조회
+                self.early_refreshes += 1
+
+        self.misses += 1
+        return await self.flight.do(
+            key,
+            lambda: self._load_and_set(key, load),
+            recheck=lambda: self._get_fresh(key),
+        )
+
+    @staticmethod
+    def _parse(cached: bytes) -> tuple[float, float, str, bytes]:
+        header, _, payload = cached.partition(b"\n")
+        # 이전 형식("{fresh_until}\n", "{fresh_until} {delta}\n")도 읽을 수 있도록 빈 필드 채움
+        parts = header.decode("utf-8").split(" ", 2)
+        fresh_until, delta, version = parts + ["0", ""][len(parts) - 1:]
+        return float(fresh_until), float(delta), version, payload
+
+    def _should_refresh_early(self, fresh_until: float, delta: float, now: float) -> bool:
+        if self.early_refresh_beta <= 0 or delta <= 0:
+            return False
+        return now - delta * self.early_refresh_beta * math.log(1.0 - random.random()) >= fresh_until
+
+    async def _get_fresh(self, key: str) -> Optional[Entry]:
+        """다른 워커가 채운 값 확인용 (single-flight lock 대기 중)"""
+        try:
+            cached = await self.store.get(key)
+        except Exception:
+            return None
+        if cached is None:
+            return None
+        fresh_until, _, version, payload = self._parse(cached)
+        return (payload, version) if fresh_until > time.time() else None
+
+    async def _load_and_set(self, key: str, load: EntryLoader) -> Optional[Entry]:
+        start = time.perf_counter()
+        entry = await load()
+        if entry is not None:
+            value, version = entry
+            await self.set(key, value, delta=time.perf_counter() - start, version=version)
+        return entry
+
+    async def set(self, key: str, value: bytes, delta: float = 0.0, version: str = ""):
+        try:
+            await self.store.set(
+                key,
+                f"{time.time() + self.ttl:.3f} {delta:.4f} {version}\n".encode("utf-8") + value,
+                ex=self.ttl + self.stale_ttl,
+            )
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f" 캐시 저장 실패 {key}: {e}")
+
+    def _schedule_refresh(self, key: str, refresh: EntryLoader):
+        # 워커당 key별 갱신은 한 번만 (진행 중이면 stale 값만 반환)
+        if key in self._refreshing:
+            return
+        task = asyncio.create_task(self._refresh(key, refresh))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _refresh(self, key: str, refresh: EntryLoader):
+        try:
+            entry = await self.flight.do(key, lambda: self._load_and_set(key, refresh))
+        except Exception as e:
+            logger.warning(f" 캐시 갱신 실패 {key}: {e}")
+            return
+        if entry is None:
+            await delete_cache_keys([key])
+
+    async def invalidate_after_commit(self, session: AsyncSession, *keys: str):
+        """
+        쓰기 트랜잭션 안에서 호출: 지금 바로 삭제 + 커밋 후 get_db에서 한 번 더 삭제
+        - 커밋 전에 다른 요청이 이전 값을 다시 채운 경우까지 정리 (delete - commit - delete)
+        """
+        if not self.enabled or not keys:
+            return
+        await delete_cache_keys(keys)
+        session.info.setdefault(PENDING_CACHE_KEYS, set()).update(keys)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.early_refreshes + self.misses
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "early_refreshes": self.early_refreshes,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_ratio": (self.hits + self.stale_hits + self.early_refreshes) / lookups if lookups else 0.0,
+        }
+
+
+def _entry_loader(load: Loader) -> EntryLoader:
+    async def load_entry() -> Optional[Entry]:
+        value = await load()
+        return (value, "") if value is not None else None
+    return load_entry
+
+
+async def delete_cache_keys(keys: Iterable[str]):
+    keys = list(keys)
+    if not keys:
+        return
+    try:
+        await delete_keys(keys)
+    except Exception as e:
+        # 삭제 실패는 응답을 막지 않는다. (TTL로 만료)
+        logger.warning(f" 캐시 삭제 실패 {keys}: {e}")
+
+
+def collect_cache_metrics():
+    for cache in _caches:
+        labels = {"cache": cache.name}
+        stats = cache.stats()
+        yield "read_cache_hits_total", "counter", "Read-through cache fresh hits", stats["hits"], labels
+        yield "read_cache_stale_hits_total", "counter", "Read-through cache stale hits served while refreshing", stats["stale_hits"], labels
+        yield "read_cache_early_refreshes_total", "counter", "Read-through cache probabilistic early refreshes", stats["early_refreshes"], labels
+        yield "read_cache_misses_total", "counter", "Read-through cache misses", stats["misses"], labels
+        yield "read_cache_errors_total", "counter", "Read-through cache Redis errors", stats["errors"], labels
+        yield "read_cache_hit_ratio", "gauge", "Read-through cache hit ratio since start", stats["hit_ratio"], labels
+
+
+metrics.register_collector(collect_cache_metrics)
@@ -1,8 +1,71 @@
 # database/redis_connection.py
+import time
+import logging
 from redis.asyncio import Redis, BlockingConnectionPool
+from redis.exceptions import ConnectionError
 from common.const.settings import settings
+from common.metrics.registry import metrics
 
-pool = BlockingConnectionPool(
+logger = logging.getLogger(__name__)
+
+redis_pool_wait = metrics.histogram(
+    "redis_pool_wait_seconds",
+    "Time spent waiting for a pooled Redis connection",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0),
+)
+redis_pool_timeouts = metrics.counter(
+    "redis_pool_timeouts_total",
+    "Redis connection checkouts that hit the pool timeout",
+)
+redis_pool_connections_created = metrics.counter(
+    "redis_pool_connections_created_total",
+    "New Redis connections created by the pool",
+)
+
+
+class InstrumentedBlockingConnectionPool(BlockingConnectionPool):
+    """
+    대기 시간 / timeout / 연결 생성 수를 기록하는 BlockingConnectionPool
+    - 모든 커넥션이 사용 중이면 get_connection이 timeout(초)까지 기다리므로 그 구간을 측정
+    """
+    async def get_connection(self, command_name, *keys, **options):
+        start = time.perf_counter()
+        try:
+            return await super().get_connection(command_name, *keys, **options)
+        except ConnectionError as e:
+            if str(e) == "No connection available.":
+                redis_pool_timeouts.inc()
+            raise
+        finally:
+            redis_pool_wait.observe(time.perf_counter() - start)
+
+    def make_connection(self):
+        redis_pool_connections_created.inc()
+        return super().make_connection()
+
+    def stats(self) -> dict:
+        return {
+            "max_connections": self.max_connections,
+            "in_use": len(self._in_use_connections),
+            "available": len(self._available_connections),
+            "timeout": self.timeout,
+        }
+
+    def collect(self):
+        stats = self.stats()
+        yield "redis_pool_in_use", "gauge", "Redis connections currently in use", stats["in_use"]
+        yield "redis_pool_available", "gauge", "Idle Redis connections in the pool", stats["available"]
+        yield "redis_pool_max_connections", "gauge", "Configured max_connections", stats["max_connections"]
+
+    def log_status(self):
+        stats = self.stats()
+        logger.info(
+            f" Redis pool max_connections={stats['max_connections']} timeout={stats['timeout']}s "
+            f"in_use={stats['in_use']} available={stats['available']}"
+        )
+
+
+pool = InstrumentedBlockingConnectionPool(
     host=settings.REDIS_HOST,
     port=settings.REDIS_PORT,
     db=settings.REDIS_DB,
@@ -12,6 +75,8 @@ pool = BlockingConnectionPool(
 
 redis = Redis(connection_pool=pool, decode_responses=True)
 
+metrics.register_collector(pool.collect)
+
 # 💡 동작 흐름
 # 클라이언트 요청이 들어옴
 
@@ -0,0 +1,129 @@
+# src/cache/single_flight.py
+import uuid
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Optional
+from cache.redis_connection import redis
+from common.const.settings import settings
+from common.metrics.registry import metrics
+
+logger = logging.getLogger(__name__)
+
+# 캐시 miss 요청 합치기 (single-flight)
+# - 워커 안: key별 Future를 공유해서 같은 key의 동시 miss는 loader 한 번의 결과를 같이 기다린다.
+# - 워커 간(선택): Redis 짧은 lock (SET NX PX), lock을 못 잡은 워커는 recheck(캐시 재조회)로
+#   다른 워커가 채운 값을 기다리고, lock 시간이 지나도 값이 없으면 직접 loader 실행
+LOCK_KEY_PREFIX = "flight:"
+LOCK_POLL_INTERVAL = 0.05
+
+# 자신이 잡은 lock만 해제 (만료 후 다른 워커가 잡은 lock은 그대로)
+_RELEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+_flights: list["SingleFlight"] = []
+
+
+class SingleFlight:
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: dict[str, asyncio.Future] = {}
+        self.leaders = 0
+        self.coalesced = 0
+        self.lock_waits = 0
+        self.lock_timeouts = 0
+        _flights.append(self)
+
+    async def do(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        recheck: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> Any:
+        """
+        같은 key로 진행 중인 loader가 있으면 그 결과를 기다리고, 없으면 직접 실행
+        - recheck: 워커 간 lock을 못 잡았을 때 캐시를 다시 읽는 함수 (None이 아니면 그 값을 사용)
+          넘긴 경우에만 Redis lock 사용 (SINGLE_FLIGHT_REDIS_LOCK)
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 선두 요청이 취소된 경우는 이 요청이 다시 시도 (자신이 취소된 경우는 그대로 전파)
+                if future.cancelled() and not asyncio.current_task().cancelling():
+                    return await self.do(key, loader, recheck)
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.leaders += 1
+        try:
+            result = await self._run(key, loader, recheck)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 기다리는 요청이 없어도 "exception was never retrieved" 경고가 나지 않도록
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _run(self, key: str, loader, recheck):
+        if recheck is None or not settings.SINGLE_FLIGHT_REDIS_LOCK:
+            return await loader()
+
+        lock_key = f"{LOCK_KEY_PREFIX}{key}"
+        token = uuid.uuid4().hex
+        ttl = settings.SINGLE_FLIGHT_LOCK_TTL
+        try:
+            acquired = await redis.set(lock_key, token, nx=True, px=int(ttl * 1000))
+        except Exception as e:
+            logger.warning(f" single-flight lock 실패 {key}: {e}")
+            return await loader()
+
+        if acquired:
+            try:
+                return await loader()
+            finally:
+                try:
+                    await redis.eval(_RELEASE_SCRIPT, 1, lock_key, token)
+                except Exception as e:
+                    logger.warning(f" single-flight lock 해제 실패 {key}: {e}")
+
+        # 다른 워커가 loader 실행 중 → 캐시에 값이 생길 때까지 대기
+        self.lock_waits += 1
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + ttl
+        while loop.time() < deadline:
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+            value = await recheck()
+            if value is not None:
+                return value
+        self.lock_timeouts += 1
+        return await loader()
+
+    def collect(self):
+        labels = {"flight": self.name}
+        yield "single_flight_leaders_total", "counter", "Loader executions started by single-flight", self.leaders, labels
+        yield "single_flight_coalesced_total", "counter", "Concurrent misses that awaited an in-flight loader", self.coalesced, labels
+        yield "single_flight_lock_waits_total", "counter", "Misses that waited on another worker's Redis lock", self.lock_waits, labels
+        yield "single_flight_lock_timeouts_total", "counter", "Redis lock waits that ran the loader after the lock TTL", self.lock_timeouts, labels
+        yield "single_flight_in_flight", "gauge", "Keys with a loader currently running", len(self._inflight), labels
+
+
+def collect_single_flight_metrics():
+    for flight in _flights:
+        yield from flight.collect()
+
+
+metrics.register_collector(collect_single_flight_metrics)
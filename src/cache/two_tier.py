@@ -0,0 +1,281 @@
+# src/cache/two_tier.py
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Iterable, Optional
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+from cache.redis_connection import redis
+from common.const.settings import settings
+from common.metrics.registry import metrics
+
+logger = logging.getLogger(__name__)
+
+# 2단 캐시: 워커 프로세스 LRU(local) → Redis(redis)
+# - local 값은 Redis 서버 지원 client-side caching(CLIENT TRACKING BCAST)으로 일관성을 유지한다.
+#   캐시 prefix의 key가 어디서든 변경/삭제/만료되면 __redis__:invalidate 채널로 key 목록이 오고 local에서 제거
+# - CLIENT TRACKING을 쓸 수 없으면(Redis 6 미만, 프록시 등) pub/sub 채널로 대체: 쓰기/삭제하는 쪽이 key를 publish
+# - 동기화가 끊긴 동안(is_synced=False)에는 local을 비우고 Redis만 사용
+TRACKING_CHANNEL = "__redis__:invalidate"
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+_tiers: list["TwoTierCache"] = []
+
+
+class LocalLRU:
+    """크기 제한 + 항목별 만료 시각이 있는 LRU (이벤트 루프 스레드에서만 사용하므로 lock 없음)"""
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes):
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: str):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TwoTierCache:
+    """
+    prefix 단위 2단 캐시 (값은 bytes)
+    - get: local → Redis (Redis hit이면 local에 채움)
+    - set/delete: Redis에 쓰고 local에서는 제거 (다른 워커는 invalidation 메시지로 제거)
+    """
+    def __init__(
+        self,
+        name: str,
+        prefix: str,
+        max_size: int = settings.LOCAL_CACHE_MAX_SIZE,
+        local_ttl: float = settings.LOCAL_CACHE_TTL,
+    ):
+        self.name = name
+        self.prefix = prefix
+        self.local = LocalLRU(max_size if settings.LOCAL_CACHE_ENABLED else 0, local_ttl)
+        self.local_hits = 0
+        self.local_misses = 0
+        self.redis_hits = 0
+        self.redis_misses = 0
+        _tiers.append(self)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        use_local = cache_invalidator.is_synced
+        if use_local:
+            value = self.local.get(key)
+            if value is not None:
+                self.local_hits += 1
+                return value
+            self.local_misses += 1
+
+        # GET 도중에 invalidation이 오면 받은 값이 이미 오래된 값일 수 있으므로 local에 넣지 않는다.
+        epoch = cache_invalidator.epoch
+        value = await redis.get(key)
+        if value is None:
+            self.redis_misses += 1
+            return None
+
+        self.redis_hits += 1
+        value = value.encode("utf-8") if isinstance(value, str) else value
+        if use_local and epoch == cache_invalidator.epoch:
+            self.local.set(key, value)
+        return value
+
+    async def set(self, key: str, value: bytes, ex: int):
+        await redis.set(key, value, ex=ex)
+        self.local.pop(key)
+        await cache_invalidator.publish([key])
+
+    async def set_many(self, mapping: dict[str, bytes], ex: int):
+        async with redis.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, value, ex=ex)
+            await pipe.execute()
+        for key in mapping:
+            self.local.pop(key)
+        await cache_invalidator.publish(list(mapping))
+
+    def collect(self):
+        labels = {"cache": self.name}
+        yield "two_tier_cache_hits_total", "counter", "Two-tier cache hits by tier", self.local_hits, {**labels, "tier": "local"}
+        yield "two_tier_cache_hits_total", "counter", "Two-tier cache hits by tier", self.redis_hits, {**labels, "tier": "redis"}
+        yield "two_tier_cache_misses_total", "counter", "Two-tier cache misses by tier", self.local_misses, {**labels, "tier": "local"}
+        yield "two_tier_cache_misses_total", "counter", "Two-tier cache misses by tier", self.redis_misses, {**labels, "tier": "redis"}
+        yield "two_tier_cache_local_size", "gauge", "Entries in the per-worker local tier", len(self.local), labels
+
+
+def invalidate_local(keys: Optional[Iterable[str]] = None):
+    """local tier에서 key 제거 (None이면 전체)"""
+    if keys is None:
+        for tier in _tiers:
+            tier.local.clear()
+        return
+    for key in keys:
+        for tier in _tiers:
+            if key.startswith(tier.prefix):
+                tier.local.pop(key)
+
+
+async def delete_keys(keys: Iterable[str]):
+    """Redis + 이 워커의 local에서 바로 삭제 (다른 워커는 invalidation 메시지로 제거)"""
+    keys = list(keys)
+    if not keys:
+        return
+    invalidate_local(keys)
+    await redis.delete(*keys)
+    await cache_invalidator.publish(keys)
+
+
+class CacheInvalidator:
+    """
+    local tier 무효화 메시지 수신 (워커당 하나, lifespan에서 start/stop)
+    - tracking: 전용 연결 2개 (수신 연결 SUBSCRIBE __redis__:invalidate,
+      추적 연결 CLIENT TRACKING ON REDIRECT <수신 연결 id> BCAST PREFIX ...)
+    - pubsub: CLIENT TRACKING이 거절되면 cache:invalidate 채널 구독, 쓰는 쪽에서 key publish
+    """
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self.is_synced = False
+        self.mode: Optional[str] = None
+        # invalidation을 받을 때마다 증가 (Redis GET 도중 무효화 감지용)
+        self.epoch = 0
+        self.invalidations = 0
+
+    async def start(self, client: Redis):
+        if self._task is None and settings.LOCAL_CACHE_ENABLED and _tiers:
+            self._task = asyncio.create_task(self._listen(client))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._set_synced(False)
+
+    async def publish(self, keys: list[str]):
+        # tracking 모드에서는 Redis가 알려주므로 publish 불필요
+        if self.mode == "pubsub" and keys:
+            await redis.publish(INVALIDATION_CHANNEL, "\n".join(keys))
+
+    def invalidate(self, keys: Optional[list]):
+        self.epoch += 1
+        self.invalidations += 1
+        if keys is None:
+            invalidate_local()
+            return
+        invalidate_local(key.decode("utf-8") if isinstance(key, bytes) else key for key in keys)
+
+    def _set_synced(self, synced: bool):
+        if not synced:
+            self.epoch += 1
+            invalidate_local()
+        self.is_synced = synced
+
+    async def _listen(self, client: Redis):
+        while True:
+            try:
+                if self.mode != "pubsub":
+                    await self._listen_tracking(client)
+                else:
+                    await self._listen_pubsub(client)
+            except asyncio.CancelledError:
+                raise
+            except ResponseError as e:
+                logger.warning(f" CLIENT TRACKING 사용 불가, pub/sub 무효화로 전환: {e}")
+                self.mode = "pubsub"
+            except Exception as e:
+                logger.warning(f" local 캐시 무효화 연결 끊김, 1초 후 재시도: {e}")
+                await asyncio.sleep(1)
+            finally:
+                self._set_synced(False)
+
+    async def _listen_tracking(self, client: Redis):
+        # 전용 연결은 풀 밖에서 직접 생성 (풀의 max_connections / 생성 수 지표에 포함되지 않도록)
+        pool = client.connection_pool
+        listener = pool.connection_class(**pool.connection_kwargs)
+        tracker = pool.connection_class(**pool.connection_kwargs)
+        try:
+            await listener.connect()
+            await listener.send_command("CLIENT", "ID")
+            client_id = await listener.read_response()
+            await listener.send_command("SUBSCRIBE", TRACKING_CHANNEL)
+            await listener.read_response()
+
+            await tracker.connect()
+            prefixes = [arg for tier in _tiers for arg in ("PREFIX", tier.prefix)]
+            await tracker.send_command("CLIENT", "TRACKING", "ON", "REDIRECT", client_id, "BCAST", *prefixes)
+            response = await tracker.read_response()
+            if isinstance(response, ResponseError):
+                raise response
+
+            self.mode = "tracking"
+            self._set_synced(True)
+            logger.info(f" local 캐시 무효화 시작 (CLIENT TRACKING): {[tier.prefix for tier in _tiers]}")
+
+            while True:
+                message = await listener.read_response()
+                # [b"message", b"__redis__:invalidate", [key, ...] | None(FLUSHALL)]
+                if isinstance(message, list) and len(message) == 3 and message[0] == b"message":
+                    self.invalidate(message[2])
+        finally:
+            await listener.disconnect()
+            await tracker.disconnect()
+
+    async def _listen_pubsub(self, client: Redis):
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            self._set_synced(True)
+            logger.info(" local 캐시 무효화 시작 (pub/sub)")
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                data = message["data"]
+                data = data.decode("utf-8") if isinstance(data, bytes) else data
+                self.invalidate(data.split("\n"))
+        finally:
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
+
+    def collect(self):
+        yield "two_tier_cache_invalidations_total", "counter", "Local tier invalidation messages received", self.invalidations
+        yield "two_tier_cache_synced", "gauge", "1 if local tier invalidation is connected", 1 if self.is_synced else 0
+
+
+cache_invalidator = CacheInvalidator()
+
+
+def collect_two_tier_metrics():
+    for tier in _tiers:
+        yield from tier.collect()
+    yield from cache_invalidator.collect()
+
+
+metrics.register_collector(collect_two_tier_metrics)
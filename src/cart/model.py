@@ -1,6 +1,6 @@
 from __future__ import annotations
 from sqlalchemy import ForeignKey, Integer
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, backref
 from common.model.base_model import Base
 from typing import List, TYPE_CHECKING
 
@@ -13,10 +13,10 @@ class CartModel(Base):
     user_id: Mapped[int] = mapped_column(
         ForeignKey("user.id", ondelete="CASCADE"), nullable=False, unique=True
     )
-    user = relationship("UserModel", backref="cart", lazy="selectin")
+    user = relationship("UserModel", backref=backref("cart", lazy="raise"), lazy="raise")
 
     items: Mapped[List["CartItemModel"]] = relationship(
-        back_populates="cart", cascade="all, delete-orphan" , lazy="selectin"
+        back_populates="cart", cascade="all, delete-orphan" , lazy="raise"
     )
 
 
@@ -27,6 +27,6 @@ class CartItemModel(Base):
     product_id: Mapped[int] = mapped_column(ForeignKey("product.id"), nullable=False)
     quantity: Mapped[int] = mapped_column(Integer, default=1)
 
-    cart: Mapped["CartModel"] = relationship("CartModel", back_populates="items", lazy="selectin")       
-    product: Mapped["ProductModel"] = relationship("ProductModel", back_populates="cart_items" , lazy="selectin")
+    cart: Mapped["CartModel"] = relationship("CartModel", back_populates="items", lazy="raise")       
+    product: Mapped["ProductModel"] = relationship("ProductModel", back_populates="cart_items" , lazy="raise")
 
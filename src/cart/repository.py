@@ -1,5 +1,5 @@
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from common.model.load_profiles import load_profile
 from cart.model import CartModel, CartItemModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,7 +12,7 @@ class CartRepository:
         """카트 조회 (없으면 None 반환)"""
         cart = await self.db.scalar(
             select(CartModel)
-            .options(selectinload(CartModel.items))
+            .options(*load_profile("cart_view"))
             .where(CartModel.user_id == user_id)
         )
         return cart
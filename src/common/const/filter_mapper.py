@@ -69,6 +69,7 @@ from sqlalchemy import (
     literal
 )
 from sqlalchemy.sql.elements import BinaryExpression
+from common.pagination.search import search
 
 FILTER_MAPPER = {
     "not": lambda col, v: not_(col == v),
@@ -83,4 +84,6 @@ FILTER_MAPPER = {
     "in": lambda col, v: col.in_(v if isinstance(v, list) else v.split(",")),
     "between": lambda col, v: col.between(*v.split(",")),
     "is_null": lambda col, v: col.is_(None) if v else col.is_not(None),
+    # FULLTEXT(ngram) 검색, MySQL 외에는 ILIKE (common/pagination/search.py)
+    "search": lambda col, v: search(col, v),
 }
@@ -10,6 +10,22 @@ class Settings(BaseSettings):
     ALGORITHM: str
     BCRYPT_ROUNDS: int
 
+    # 비밀번호 해싱(bcrypt) 전용 스레드 풀 크기 / 대기 가능한 최대 작업 수
+    BCRYPT_POOL_SIZE: int = Field(
+        default=4,
+        description="bcrypt 해싱/검증을 실행하는 전용 스레드 수"
+    )
+    BCRYPT_MAX_PENDING: int = Field(
+        default=64,
+        description="bcrypt 작업 최대 대기 수 (초과 시 503 응답)"
+    )
+
+    # 검증된 JWT payload 캐시 크기 (워커 프로세스당 LRU 항목 수)
+    JWT_CACHE_MAX_SIZE: int = Field(
+        default=10000,
+        description="검증된 JWT payload를 보관하는 인메모리 LRU 최대 항목 수 (0이면 비활성화)"
+    )
+
     # 서버 설정
     PROTOCOL: str
     HOST: str
@@ -17,6 +33,14 @@ class Settings(BaseSettings):
 
     # 데이터베이스 설정
     DATABASE_CONN: str
+    DATABASE_REPLICA_CONNS: str = Field(
+        default="",
+        description="읽기 전용 복제본 접속 URL 목록 (쉼표 구분, 비어있으면 모든 쿼리를 primary로)"
+    )
+    DB_STICKY_PRIMARY_SECONDS: int = Field(
+        default=5,
+        description="쓰기 이후 같은 클라이언트의 조회를 primary로 고정하는 시간(초, 복제 지연 대비)"
+    )
     UPLOAD_DIR: str
     SECRET_KEY: str
 
@@ -39,6 +63,20 @@ class Settings(BaseSettings):
         description="로그 레벨 설정 (DEBUG, INFO, WARNING, ERROR, CRITICAL)"
     )
 
+    # 로그 처리 방식 (queue | sync) - logger_config.py에서 사용
+    LOG_MODE: str = Field(
+        default="queue",
+        description="queue: QueueHandler + 리스너 스레드에서 출력, sync: 요청 스레드에서 바로 출력"
+    )
+    LOG_FORMAT: str = Field(
+        default="text",
+        description="text: 사람이 읽는 형식, json: 필드 단위 구조화 로그 (orjson)"
+    )
+    LOG_SAMPLE_RATES: str = Field(
+        default="",
+        description="로거별 INFO 이하 샘플링 비율 (예: common.middleware.logging=0.1), WARNING 이상은 항상 기록"
+    )
+
     # CORS (Cross-Origin Resource Sharing)
     ALLOWED_ORIGINS: list[str] = []
 
@@ -48,6 +86,92 @@ class Settings(BaseSettings):
         description="Redis 세션 유지 시간 (초). 운영 환경에서는 30일로 자동 설정됨"
     )
 
+    # /metrics 엔드포인트 노출 여부 (Prometheus text format)
+    METRICS_ENABLED: bool = Field(
+        default=False,
+        description="True면 /metrics 엔드포인트를 등록"
+    )
+
+    # 페이지 번호 페이지네이션 total 계산 방식
+    PAGINATION_COUNT_STRATEGY: str = Field(
+        default="exact",
+        description="exact: 매번 COUNT, cached: Redis에 필터별 COUNT 캐시(쓰기 시 무효화), estimated: MySQL 통계/EXPLAIN 추정치"
+    )
+    PAGINATION_COUNT_CACHE_TTL: int = Field(
+        default=60,
+        description="cached 전략의 COUNT 캐시 유지 시간(초)"
+    )
+    PAGINATION_CONCURRENT_COUNT: bool = Field(
+        default=False,
+        description="True면 COUNT를 별도 세션(커넥션)에서 페이지 조회와 동시에 실행"
+    )
+
+    # 2단 캐시의 워커 local tier (Redis CLIENT TRACKING 또는 pub/sub으로 무효화)
+    LOCAL_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="False면 local tier 없이 Redis만 사용"
+    )
+    LOCAL_CACHE_MAX_SIZE: int = Field(
+        default=10000,
+        description="캐시(prefix)별 local tier 최대 항목 수"
+    )
+    LOCAL_CACHE_TTL: int = Field(
+        default=30,
+        description="local tier 항목 최대 유지 시간(초), 무효화 메시지를 놓친 경우의 상한"
+    )
+
+    # 캐시 miss 합치기 / 조기 갱신 (cache/single_flight.py, cache/read_through.py)
+    SINGLE_FLIGHT_REDIS_LOCK: bool = Field(
+        default=False,
+        description="True면 워커 간에도 Redis lock으로 같은 key의 miss를 한 번만 조회"
+    )
+    SINGLE_FLIGHT_LOCK_TTL: float = Field(
+        default=3.0,
+        description="워커 간 lock 유지 시간(초), 이 시간 안에 값이 채워지지 않으면 직접 조회"
+    )
+    CACHE_EARLY_REFRESH_BETA: float = Field(
+        default=1.0,
+        description="확률적 조기 갱신 강도 (XFetch beta, 0이면 사용 안 함), 클수록 만료 전에 일찍 갱신"
+    )
+
+    # 게시글 상세 Redis read-through 캐시 (직렬화된 PostSchema)
+    POST_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="False면 게시글 상세를 항상 DB에서 조회"
+    )
+    POST_CACHE_TTL: int = Field(
+        default=60,
+        description="게시글 상세 캐시가 fresh로 취급되는 시간(초)"
+    )
+    POST_CACHE_STALE_TTL: int = Field(
+        default=30,
+        description="TTL 이후 stale 값을 반환하면서 백그라운드 갱신하는 시간(초), 0이면 사용 안 함"
+    )
+
+    # 게시글 목록(GET /posts) 페이지 캐시 (post/user/file 세대 번호가 key에 포함되어 쓰기 시 자동 무효화)
+    POST_LIST_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="False면 게시글 목록을 항상 DB에서 조회"
+    )
+    POST_LIST_CACHE_TTL: int = Field(
+        default=30,
+        description="게시글 목록 페이지 캐시 유지 시간(초)"
+    )
+
+    # 사용자 레코드 캐시 (토큰 인증 / 로그인 / 사용자 조회, id와 유니크 로그인 필드별 key)
+    USER_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="False면 사용자 조회를 항상 DB에서 수행"
+    )
+    USER_CACHE_TTL: int = Field(
+        default=300,
+        description="사용자 레코드 캐시 유지 시간(초)"
+    )
+    USER_CACHE_NEGATIVE_TTL: int = Field(
+        default=10,
+        description="존재하지 않는 사용자 조회 결과를 캐싱하는 시간(초)"
+    )
+
     # 환경 구분
     ENV: str = Field(
         default="development",
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from sqlalchemy import String, Integer, ForeignKey, Enum as SqlEnum, DateTime, func
+from sqlalchemy import String, Integer, ForeignKey, Enum as SqlEnum, DateTime, func, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from common.model.base_model import Base
 from typing import Optional
@@ -11,6 +11,14 @@ if TYPE_CHECKING:
 
 class FileModel(Base):
     __tablename__ = "file"
+    __table_args__ = (
+        # get_files_by_owner / delete_files_by_owner (owner_type, owner_id) 조회
+        Index("ix_file_owner_type_owner_id", "owner_type", "owner_id"),
+        # get_file_by_uuid: 저장 파일명이 "{uuid}{확장자}" 이므로 접두사 LIKE로 인덱스 사용
+        Index("ix_file_original_name", "original_name"),
+        # 게시글 파일 목록 (post_id IN (...) ORDER BY post_id, order, id) filesort 없이 조회
+        Index("ix_file_post_id_order_id", "post_id", "order", "id"),
+    )
 
     path: Mapped[str] = mapped_column(String(255), nullable=False)
     original_name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -27,4 +35,4 @@ class FileModel(Base):
 
     # ✅ (선택) 특정 모델 연결도 추가 (PostModel 관계 사용 시)
     post_id: Mapped[Optional[int]] = mapped_column(ForeignKey("post.id", ondelete="CASCADE"), nullable=True)
-    post: Mapped[Optional["PostModel"]] = relationship("PostModel", back_populates="files", lazy="selectin")
\ No newline at end of file
+    post: Mapped[Optional["PostModel"]] = relationship("PostModel", back_populates="files", lazy="raise")
\ No newline at end of file
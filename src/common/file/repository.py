@@ -56,7 +56,8 @@ class FileRepository:
     async def get_file_by_uuid(self, uuid: str) -> Optional[FileModel]:
         db = self.db
 
-        stmt = select(FileModel).where(FileModel.original_name.like(f"%{uuid}%"))
+        # 파일명은 "{uuid}{확장자}" → 접두사 LIKE (ix_file_original_name 사용, '%uuid%'는 풀 스캔)
+        stmt = select(FileModel).where(FileModel.original_name.like(f"{uuid}%"))
         result = await db.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -18,5 +18,5 @@ class ImageModel(Base):
     path: Mapped[str] = mapped_column(String(255), nullable=False)
     
     post_id: Mapped[Optional[int]] = mapped_column(ForeignKey("post.id", ondelete="CASCADE"), nullable=True)
-    post: Mapped[Optional["PostModel"]] = relationship("PostModel", back_populates="images", lazy="selectin")
+    post: Mapped[Optional["PostModel"]] = relationship("PostModel", back_populates="images", lazy="raise")
 
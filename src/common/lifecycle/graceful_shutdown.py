@@ -1,4 +1,5 @@
 from common.lifecycle.scheduler_runner import scheduler 
+from auth.utils.password_hasher import password_hasher
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,6 +13,8 @@ async def graceful_shutdown_tasks():
     except Exception as e:
         logger.warning(f"APScheduler 종료 중 오류 발생: {e}")
 
+    password_hasher.shutdown()  # bcrypt 스레드 풀 정리
+
     # TODO: 여기에 실제 종료 전 정리할 작업 추가
     # 예: 
     # - 백그라운드 작업 큐 종료 (예: Celery Worker / TaskQueue 중단)
@@ -2,19 +2,21 @@ from fastapi import FastAPI
 from contextlib import asynccontextmanager
 import logging
 
-from database.mysql_connection import async_engine
-from cache.redis_connection import redis
+from database.mysql_connection import async_engine, replica_engines
+from cache.redis_connection import redis, pool as redis_pool
 from common.lifecycle.startup_check import test_db_connection, test_redis_connection
 from common.lifecycle.graceful_shutdown import graceful_shutdown_tasks  # 필요 시
 from common.lifecycle.scheduler_runner import start_scheduler 
 from database.init_db import init_db
+from auth.utils.token_blacklist import token_blacklist
+from cache.two_tier import cache_invalidator
 
 logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
 
-    import database.event_hooks
+    from database.event_hooks import log_pool_status
     
     logger.info("🚀 Starting up...")
 
@@ -25,7 +27,17 @@ async def lifespan(app: FastAPI):
          # DB 테이블 생성 (모델 import는 models_registry.py에서 이미 처리됨)
         await init_db()
 
+        # 로그아웃 토큰 블랙리스트 메모리 동기화 (Redis pub/sub)
+        await token_blacklist.start(redis)
+
+        # 2단 캐시 local tier 무효화 수신 (CLIENT TRACKING, 안 되면 pub/sub)
+        await cache_invalidator.start(redis)
+
         start_scheduler()  
+
+        # 커넥션 풀 설정/상태 (연결 확인 이후 시점)
+        log_pool_status()
+        redis_pool.log_status()
         logger.info("🔗 All services connected.")
     except Exception as e:
         logger.critical("❌ Startup failed due to service connection error")
@@ -34,7 +46,11 @@ async def lifespan(app: FastAPI):
     yield  # 앱 실행 중...
 
     logger.info("📴 Shutting down...")
+    await token_blacklist.stop()
+    await cache_invalidator.stop()
     await async_engine.dispose()
+    for engine in replica_engines:
+        await engine.dispose()
     await redis.close()
     await graceful_shutdown_tasks() # 추후, 필요시 실제 종료 전 정리할 작업 추가
     logger.info("✅ Cleanup done. Bye 👋")
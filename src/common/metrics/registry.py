@@ -0,0 +1,184 @@
+from bisect import bisect_left
+from typing import Callable, Iterable
+
+# Prometheus 기본 버킷 (초 단위)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+# 메트릭 값은 워커 프로세스 단위로 집계된다. (멀티 워커면 Prometheus에서 워커별로 수집 후 합산)
+# 모든 기록은 이벤트 루프 스레드에서 await 없이 끝나므로 별도 lock이 필요 없다.
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(label_names: tuple[str, ...], label_values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(label_names, label_values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name: str, description: str, label_names: Iterable[str] = ()):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *label_values, amount: float = 1):
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        for label_values, value in self._values.items():
+            lines.append(f"{self.name}{_format_labels(self.label_names, label_values)} {_format_value(value)}")
+        return lines
+
+
+class Gauge:
+    def __init__(self, name: str, description: str, label_names: Iterable[str] = ()):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *label_values, amount: float = 1):
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def dec(self, *label_values, amount: float = 1):
+        self._values[label_values] = self._values.get(label_values, 0) - amount
+
+    def set(self, value: float, *label_values):
+        self._values[label_values] = value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} gauge"]
+        for label_values, value in self._values.items():
+            lines.append(f"{self.name}{_format_labels(self.label_names, label_values)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """
+    누적 버킷 히스토그램
+    - observe는 버킷 위치를 bisect로 찾아서 카운트 하나만 증가 (렌더링할 때 누적합 계산)
+    """
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Iterable[str] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        # label_values -> [버킷별 카운트(+Inf 포함)..., sum, count]
+        self._series: dict[tuple, list] = {}
+
+    def observe(self, value: float, *label_values):
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        bounds = self.buckets + (float("inf"),)
+        for label_values, series in self._series.items():
+            cumulative = 0
+            for bound, count in zip(bounds, series):
+                cumulative += count
+                labels = _format_labels(self.label_names, label_values, f'le="{_format_value(float(bound))}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, label_values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series[-2])}")
+            lines.append(f"{self.name}_count{labels} {series[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    메트릭 등록소 + Prometheus text format 렌더링
+    - counter/gauge/histogram: 요청 처리 중에 직접 기록
+    - collector: /metrics 요청 시점에 값을 읽어오는 콜백 (캐시 hit/miss, 풀 상태 등)
+    """
+    def __init__(self):
+        self._metrics: list = []
+        self._collectors: list[Callable[[], Iterable[tuple[str, str, str, float]]]] = []
+
+    def counter(self, name: str, description: str, label_names: Iterable[str] = ()) -> Counter:
+        metric = Counter(name, description, label_names)
+        self._metrics.append(metric)
+        return metric
+
+    def gauge(self, name: str, description: str, label_names: Iterable[str] = ()) -> Gauge:
+        metric = Gauge(name, description, label_names)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        label_names: Iterable[str] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, description, label_names, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[tuple]]):
+        """
+        collector는 (name, type(counter|gauge), description, value[, labels]) 튜플 목록을 반환
+        - labels는 {"pool": "primary"} 같은 dict (같은 name을 label만 바꿔서 여러 번 반환 가능)
+        """
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+
+        described: set[str] = set()
+        for collector in self._collectors:
+            for name, metric_type, description, value, *rest in collector():
+                if name not in described:
+                    described.add(name)
+                    lines.append(f"# HELP {name} {description}")
+                    lines.append(f"# TYPE {name} {metric_type}")
+                labels = rest[0] if rest else {}
+                lines.append(f"{name}{_format_labels(tuple(labels), tuple(labels.values()))} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+# HTTP 요청 메트릭 (RequestPipelineMiddleware에서 기록, route는 경로 템플릿 기준)
+http_request_duration = metrics.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route"),
+)
+http_requests_total = metrics.counter(
+    "http_requests_total",
+    "HTTP requests by route template and status code",
+    ("method", "route", "status"),
+)
+http_requests_in_flight = metrics.gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being processed",
+)
@@ -1,30 +1,17 @@
-import logging
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Optional
 from auth.service import decode_jwt_token
-from common.utils.log_context import user_id_ctx_var
-from common.middleware.error import middleware_error_handler
+from user.schemas.response import TokenPayloadSchema
 
-logger = logging.getLogger(__name__)
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        """사용자 인증을 처리하는 미들웨어"""
-        try:
-            auth_header = request.headers.get("Authorization", "")
+def authenticate_header(auth_header: str) -> Optional[TokenPayloadSchema]:
+    """
+    Authorization 헤더에서 사용자 정보를 추출 (RequestPipelineMiddleware에서 사용)
+    - Basic 토큰이면 무시하고 None 반환
+    - Bearer 토큰이 유효하지 않으면 예외 발생
+    """
+    if auth_header.startswith("Basic "):
+        return None
 
-            # Basic 토큰이면 무시하고 바로 넘김
-            if auth_header.startswith("Basic "):
-                return await call_next(request)
-
-            # Bearer 토큰 처리
-            token = auth_header.replace("Bearer ", "")
-            user = decode_jwt_token(token) if token else None
-
-            user_id_ctx_var.set(user.id if user else None)
-
-            return await call_next(request)
-
-        except Exception as e:
-            logger.warning(f"[AUTH] 인증 실패: {e}")
-            return middleware_error_handler(e) 
\ No newline at end of file
+    # Bearer 토큰 처리
+    token = auth_header.replace("Bearer ", "")
+    return decode_jwt_token(token) if token else None
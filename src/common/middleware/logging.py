@@ -1,44 +1,15 @@
-import uuid
-import time
 import logging
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from common.utils.log_context import request_id_ctx_var, user_id_ctx_var
-from common.middleware.error import middleware_error_handler
 
 logger = logging.getLogger(__name__)
 
-class LogContextMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        """Request ID와 User ID를 컨텍스트에 저장하는 미들웨어"""
-        try:
-            request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
-            request_id_ctx_var.set(request_id)
 
-            response = await call_next(request)
-
-            # user = request.state.user
-            # user_id_ctx_var.set(user.id if user else None)
-
-            response.headers["X-Request-ID"] = request_id
-            return response
-        except Exception as e:
-            logger.warning(f"[LOG_CONTEXT] 처리 실패: {e}")
-            return middleware_error_handler(e)
-
-class RequestLoggerMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        """요청/응답 로깅을 처리하는 미들웨어"""
-        try:
-            start = time.time()
-            response = await call_next(request)
-            duration = round(time.time() - start, 4)
-
-            user = getattr(request.state, "user", None)
-            user_id_ctx_var.set(user.id if user else None)
-
-            logger.info(f"{request.method} {request.url.path} [{response.status_code}] {duration}s")
-            return response
-        except Exception as e:
-            logger.warning(f"[REQUEST_LOGGER] 처리 실패: {e}")
-            return middleware_error_handler(e) 
\ No newline at end of file
+def log_request(method: str, path: str, route: str, status_code: int, duration: float):
+    """
+    요청/응답 접근 로그 (RequestPipelineMiddleware에서 사용)
+    - 샘플링(LOG_SAMPLE_RATES)으로 버려질 수 있으므로 메시지는 %-포맷으로 넘겨서 출력될 때만 만든다.
+    - JSON 로그에서는 extra 필드(method, route, status_code, duration)가 그대로 필드로 출력된다.
+    """
+    logger.info(
+        "%s %s [%s] %ss", method, path, status_code, duration,
+        extra={"method": method, "path": path, "route": route, "status_code": status_code, "duration": duration},
+    )
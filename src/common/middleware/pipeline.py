@@ -0,0 +1,129 @@
+import uuid
+import time
+import logging
+from redis.asyncio import Redis
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from common.utils.log_context import request_id_ctx_var, user_id_ctx_var
+from common.middleware.auth import authenticate_header
+from common.middleware.error import middleware_error_handler
+from common.middleware.logging import log_request
+from common.middleware.session import RedisSessionStore
+from database.dependencies import sticky_primary_cookie_header
+from common.metrics.registry import (
+    http_request_duration,
+    http_requests_total,
+    http_requests_in_flight,
+)
+
+logger = logging.getLogger(__name__)
+
+class RequestPipelineMiddleware:
+    """
+    Request ID / 인증 컨텍스트 / Redis 세션 / 요청 로깅을 한 번에 처리하는 순수 ASGI 미들웨어
+    - BaseHTTPMiddleware를 4단으로 쌓으면 요청마다 task group과 응답 래핑이 4번씩 일어나고
+      스트리밍 응답도 버퍼링되므로, 하나의 __call__에서 send만 감싸서 처리한다.
+    """
+    def __init__(self, app: ASGIApp, redis: Redis, session_cookie: str = "session_redis_id"):
+        self.app = app
+        self.session_store = RedisSessionStore(redis, session_cookie)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+
+        # 1. Request ID 설정
+        request_id = headers.get("X-Request-ID") or str(uuid.uuid4())
+        request_id_ctx_var.set(request_id)
+
+        # 2. 토큰 검증 (User ID 컨텍스트 설정)
+        try:
+            user = authenticate_header(headers.get("Authorization", ""))
+            user_id_ctx_var.set(user.id if user else None)
+        except Exception as e:
+            logger.warning(f"[AUTH] 인증 실패: {e}")
+            await middleware_error_handler(e)(scope, receive, send)
+            return
+
+        # 3. Redis 세션 준비 (request.state.session, 실제 로드는 Depends(get_session)에서 지연 수행)
+        state = scope.setdefault("state", {})
+        session_store = self.session_store
+        session = None
+
+        if session_store.enabled:
+            cookies = cookie_parser(headers.get("cookie", ""))
+            session = session_store.open(cookies.get(session_store.session_cookie))
+            state["session"] = session
+
+        status_code = None
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_headers = MutableHeaders(scope=message)
+                response_headers["X-Request-ID"] = request_id
+
+                # 4. 응답 헤더 전송 직전에 세션 저장 + session_id 쿠키 발급
+                if session is not None:
+                    deleted = False
+                    try:
+                        deleted = await session_store.save(session)
+                    except Exception as e:
+                        logging.critical("error in redis session middleware:" + str(e), exc_info=True)
+                    for cookie in session_store.cookie_headers(session.session_id, deleted):
+                        response_headers.append("set-cookie", cookie)
+
+                # 쓰기가 있었던 요청이면 복제 지연 동안 primary에서 조회하도록 쿠키 발급 (get_db에서 기록)
+                primary_until = state.get("db_primary_until")
+                if primary_until is not None:
+                    response_headers.append("set-cookie", sticky_primary_cookie_header(primary_until))
+
+            await send(message)
+
+        # 5. 요청 처리 + 로깅/메트릭
+        start = time.perf_counter()
+        http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            # 응답이 이미 시작되었다면 더 이상 에러 응답을 보낼 수 없으므로 그대로 전파
+            if status_code is not None:
+                raise
+            logger.warning(f"[REQUEST_LOGGER] 처리 실패: {e}")
+            await middleware_error_handler(e)(scope, receive, send_wrapper)
+            return
+        finally:
+            elapsed = time.perf_counter() - start
+            http_requests_in_flight.dec()
+            self.record_metrics(scope, status_code or 500, elapsed)
+
+        duration = round(elapsed, 4)
+
+        user = state.get("user")
+        user_id_ctx_var.set(user.id if user else None)
+
+        log_request(scope["method"], scope["path"], self.route_template(scope), status_code, duration)
+
+    @staticmethod
+    def route_template(scope: Scope) -> str:
+        """
+        경로 템플릿(/posts/{id}) - path 파라미터 때문에 메트릭 시계열이 늘어나지 않게 한다.
+        - 라우트에 매칭되지 않은 요청은 mount 경로(/public) 또는 "unmatched"로 묶는다.
+        """
+        route = scope.get("route")
+        return getattr(route, "path", None) or scope.get("root_path") or "unmatched"
+
+    @classmethod
+    def record_metrics(cls, scope: Scope, status_code: int, elapsed: float):
+        """경로 템플릿 기준 지연시간 히스토그램 + 상태코드별 요청 수 기록"""
+        template = cls.route_template(scope)
+        method = scope["method"]
+
+        http_request_duration.observe(elapsed, method, template)
+        http_requests_total.inc(method, template, status_code)
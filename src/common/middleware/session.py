@@ -1,101 +1,173 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi import Request, Response, FastAPI
-import uuid, json, logging
-from redis.asyncio import Redis 
+from fastapi import Response
+from typing import Iterator, Optional
+from collections.abc import MutableMapping
+import uuid, json
+from redis.asyncio import Redis
 from common.const.settings import settings
 
-class RedisSessionMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app: FastAPI, redis: Redis, session_cookie: str = "session_redis_id"):
-        super().__init__(app)
+class RedisSession(MutableMapping):
+    """
+    request.state.session에 들어가는 지연 로딩 세션
+    - 미들웨어는 session_id만 정해두고 redis에는 접근하지 않는다.
+    - 세션이 필요한 핸들러/의존성에서 `await session.load()` (Depends(get_session))를 호출할 때 처음 HGETALL 수행
+    - 로드되지 않은 세션은 응답 시 저장도 건너뛴다.
+    - 로드 시점의 필드별 JSON을 스냅샷으로 보관해서, 저장할 때 변경/삭제된 필드만 계산한다.
+    """
+    def __init__(self, store: "RedisSessionStore", session_id: str, is_new: bool):
+        self.store = store
+        self.session_id = session_id
+        self.is_new = is_new
+        self.loaded = False
+        self.initial_session_was_empty = True
+        self._data: dict = {}
+        self._snapshot: dict[str, str] = {}
+
+    async def load(self) -> "RedisSession":
+        if self.loaded:
+            return self
+
+        # 신규 session이면 redis 조회 없이 빈 세션으로 시작
+        if not self.is_new:
+            self._snapshot = await self.store.load(self.session_id)
+            self._data = {k: json.loads(v) for k, v in self._snapshot.items()}
+            self.initial_session_was_empty = not self._snapshot
+        self.loaded = True
+        return self
+
+    def changed_fields(self) -> dict[str, str]:
+        """로드 이후 추가/수정된 필드 (값을 직접 수정한 경우도 포함) -> {field: json}"""
+        changed = {}
+        for field, value in self.data.items():
+            dumped = json.dumps(value)
+            if self._snapshot.get(str(field)) != dumped:
+                changed[str(field)] = dumped
+        return changed
+
+    def deleted_fields(self) -> list[str]:
+        """로드 이후 삭제된 필드"""
+        data = self.data
+        return [field for field in self._snapshot if field not in data]
+
+    @property
+    def data(self) -> dict:
+        if not self.loaded:
+            raise RuntimeError("세션이 로드되지 않았습니다. Depends(get_session)으로 먼저 로드하세요.")
+        return self._data
+
+    def __getitem__(self, key: str):
+        return self.data[key]
+
+    def __setitem__(self, key: str, value):
+        self.data[key] = value
+
+    def __delitem__(self, key: str):
+        del self.data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f"RedisSession({self.session_id!r}, loaded={self.loaded})"
+
+
+class RedisSessionStore:
+    """
+    Redis 해시(session:{session_id})에 세션을 저장/복원하는 저장소
+    - RequestPipelineMiddleware에서 요청 시작 시 open, 응답 헤더 전송 직전에 save 호출
+    """
+    def __init__(self, redis: Redis, session_cookie: str = "session_redis_id"):
         self.redis = redis
         self.session_cookie = session_cookie
         self.max_age = settings.SESSION_MAX_AGE
 
-    # 상세정보는 redis에 들어가는 것을 여기서 구현하는 것
-    async def dispatch(self, request: Request, call_next):
-        redis = self.redis
-
-        response = None
-        # session_id cookie key로 session_id(redis의 key)값을 가져옴. 
-        session_id = request.cookies.get(self.session_cookie)
-        # 신규 session인지 구분. 
-        initial_session_was_empty = True
-        # 만약 cookie에 session_id 값이 있으면
-        if self.max_age is None or self.max_age <= 0: # max_age에는 0보다 작거나 None을 넣으면 안된다.
-            response = await call_next(request)
-            return response
-        try:
-            if session_id:
-                session_data = await redis.hgetall(f"session:{session_id}")
-                if session_data:
-                    request.state.session = {
-                        k.decode("utf-8") if isinstance(k, bytes) else k: json.loads(v)
-                        for k, v in session_data.items()
-                    }
-                    await redis.expire(f"session:{session_id}", self.max_age)
-                    initial_session_was_empty = False
-                else:
-                    request.state.session = {}
-                    # session_id cookie를 가지고 있지 않다면, 이는 신규 session이고, 추후에 response에 set_cookie 호출. 
-                    # new_session = True
-            # cookie에 session_id 값이 없다면. 
-            else:
-                # 새로운 session_id값을 uuid로 생성하고 request.state.session값을 초기화.
-                # 신규 session으로 간주.  
-                session_id = str(uuid.uuid4())
-                request.state.session = {}
-                # new_session = True
-
-            # FastAPI의 미들웨어에서 요청을 다음 미들웨어 또는 최종 API 핸들러로 전달
-            # 최종 API 핸들러로 간다는 것은 로그인하면 @router.post("/login") 여기를 타는데 
-            # response = await call_next(request) 이렇게하면 @router.post("/login") 함수로 넘어가서 
-            # 함수를 실행하고 다시 돌아온다는 뜻이다.
-            response = await call_next(request) 
-
-            # 무조건 session_id 쿠키 발급 (로그인 안 해도)
-            response.set_cookie(
-                self.session_cookie,
-                session_id,
-                max_age=self.max_age,
-                httponly=True,
-                secure=False,          # HTTPS면 True
-                samesite="lax"         # 필요 시 'strict' or 'none'
-            )
-
-            if request.state.session:
-                # logging.info("##### request.state.session:" + str(request.state.session))
-                # 초기 접속은 물론, 지속적으로 접속하면 max_age를 계속 갱신. 
-                # redis에서 해당 session_id를 가지는 값을 hash로 저장. 
-                # request.state.session값의 변경 여부와 관계없이 저장
-                # expiration time을 지속적으로 max_age로 갱신.
-                for field, value in request.state.session.items():
-                    await redis.hset(f"session:{session_id}", str(field), json.dumps(value))
-                await redis.expire(f"session:{session_id}", self.max_age)
-
-                #########################################
-                # 만일 로그아웃을 했을 때, 해당 session_id로 설정된 redis의 데이터는 남아있다
-                # 이유는 여기에는 redis의 데이터를 지우는게 없으니까
-                # 하지만 redis에 만료 기간을 설정해뒀기 때문에 안해도 되고, 로그아웃했을 때 삭제하는 로직을 추가해도 된다.
-                # 보통은 그냥 냅둔다.
-                ############################################
-
-                ###############################################
-                # 서버가 내려가면 redis도 모두 내려가는게 맞다
-                # 하지만 여기에는 로직이 없으므로 추후에 추가할 것
-                # lifespan에 적용하면 된다.
-                #################################################
-
-            else:
-                # request.state.session가 비어있는데, initial_session_was_empty가 False라는 것은
-                # fastapi API 로직에서 request.state.session이 clear() 호출되어서 삭제되었음을 의미. 
-                # logout이므로 redis에서 해당 session_id 값을 삭제하고, 브라우저의 cookie도 삭제. 
-                if not initial_session_was_empty:
-                    # logging.info("##### redis value before deletion:" + str(redis_client.get(session_id)))
-                    await redis.delete(f"session:{session_id}")
-                    # logging.info("##### redis value after deletion:" + str(redis_client.get(session_id)))
-                    response.delete_cookie(self.session_cookie)
-
-        except Exception as e:
-            logging.critical("error in redis session middleware:" + str(e) , exc_info=True)
-        
-        return response
+    @property
+    def enabled(self) -> bool:
+        # max_age에는 0보다 작거나 None을 넣으면 안된다.
+        return self.max_age is not None and self.max_age > 0
+
+    def open(self, session_id: Optional[str]) -> RedisSession:
+        """
+        cookie의 session_id로 지연 로딩 세션을 만든다. (redis 접근 없음)
+        - cookie에 session_id 값이 없다면 새로운 session_id를 uuid로 생성 (신규 session으로 간주)
+        """
+        if not session_id:
+            return RedisSession(self, str(uuid.uuid4()), is_new=True)
+        return RedisSession(self, session_id, is_new=False)
+
+    async def load(self, session_id: str) -> dict[str, str]:
+        """
+        redis에서 세션을 복원한다. (HGETALL + EXPIRE를 한 번의 왕복으로 처리)
+        - 반환값: {field: json 문자열}, 세션이 없으면 빈 dict
+        """
+        key = f"session:{session_id}"
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hgetall(key)
+            pipe.expire(key, self.max_age)
+            session_data, _ = await pipe.execute()
+
+        return {
+            k.decode("utf-8") if isinstance(k, bytes) else k: v.decode("utf-8") if isinstance(v, bytes) else v
+            for k, v in session_data.items()
+        }
+
+    async def save(self, session: RedisSession) -> bool:
+        """
+        변경된 필드만 redis에 저장한다. 로그아웃(세션 clear)으로 삭제된 경우 True 반환
+        - 요청 중에 한 번도 로드되지 않은 세션은 변경될 수 없으므로 저장하지 않는다.
+        - 변경이 없으면 쓰기도 없다. (만료시간은 load 시점에 이미 갱신됨)
+        - 변경이 있으면 HSET(mapping) + HDEL + EXPIRE를 하나의 MULTI 파이프라인으로 전송
+        """
+        if not session.loaded:
+            return False
+
+        key = f"session:{session.session_id}"
+
+        if not session:
+            # request.state.session가 비어있는데, initial_session_was_empty가 False라는 것은
+            # fastapi API 로직에서 request.state.session이 clear() 호출되어서 삭제되었음을 의미.
+            # logout이므로 redis에서 해당 session_id 값을 삭제하고, 브라우저의 cookie도 삭제.
+            if not session.initial_session_was_empty:
+                await self.redis.delete(key)
+                return True
+            return False
+
+        changed = session.changed_fields()
+        deleted = session.deleted_fields()
+        if not changed and not deleted:
+            return False
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            if changed:
+                pipe.hset(key, mapping=changed)
+            if deleted:
+                pipe.hdel(key, *deleted)
+            pipe.expire(key, self.max_age)
+            await pipe.execute()
+
+        return False
+
+    def cookie_headers(self, session_id: str, deleted: bool) -> list[str]:
+        """응답에 추가할 Set-Cookie 헤더 값 목록"""
+        response = Response()
+
+        # 무조건 session_id 쿠키 발급 (로그인 안 해도)
+        response.set_cookie(
+            self.session_cookie,
+            session_id,
+            max_age=self.max_age,
+            httponly=True,
+            secure=False,          # HTTPS면 True
+            samesite="lax"         # 필요 시 'strict' or 'none'
+        )
+        if deleted:
+            response.delete_cookie(self.session_cookie)
+
+        return [
+            value.decode("latin-1")
+            for key, value in response.raw_headers
+            if key == b"set-cookie"
+        ]
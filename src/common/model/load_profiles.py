@@ -0,0 +1,40 @@
+# src/common/model/load_profiles.py
+
+from sqlalchemy.orm import selectinload, joinedload, raiseload
+from post.model import PostModel
+from cart.model import CartModel
+
+# 모델의 관계는 모두 lazy="raise" (기본으로는 아무 관계도 불러오지 않음)
+# 관계가 필요한 조회는 repository에서 용도에 맞는 프로필을 골라서 .options(*load_profile(...))로 지정한다.
+# - 프로필에 없는 관계에 접근하면 쿼리 대신 예외가 발생하므로 N+1 / 불필요한 연쇄 로딩이 바로 드러난다.
+# - many-to-one(게시글 작성자)은 joinedload(같은 쿼리), 컬렉션은 selectinload(IN 쿼리 1번)
+
+LOAD_PROFILES = {
+    # 게시글 목록: PostSchema(user, files) - 이미지는 응답에 없으므로 불러오지 않음
+    "post_list": lambda: (
+        joinedload(PostModel.user),
+        selectinload(PostModel.files),
+    ),
+    # 게시글 상세 / 수정 / 삭제
+    "post_detail": lambda: (
+        joinedload(PostModel.user),
+        selectinload(PostModel.images),
+        selectinload(PostModel.files),
+    ),
+    # 로그인 / 토큰 인증 / 사용자 조회: user 컬럼만
+    "user_auth": lambda: (
+        raiseload("*"),
+    ),
+    # 장바구니 조회/저장: 항목(product_id, quantity)만
+    "cart_view": lambda: (
+        selectinload(CartModel.items),
+    ),
+}
+
+
+def load_profile(name: str) -> tuple:
+    """이름으로 로딩 옵션 목록 조회 (select(...).options(*load_profile("post_list")))"""
+    profile = LOAD_PROFILES.get(name)
+    if profile is None:
+        raise ValueError(f"존재하지 않는 로딩 프로필입니다: {name}")
+    return profile()
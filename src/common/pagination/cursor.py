@@ -0,0 +1,106 @@
+import hmac
+import json
+import base64
+import hashlib
+from datetime import datetime, date
+from decimal import Decimal
+from sqlalchemy import Column, UniqueConstraint
+from common.const.settings import settings
+from common.exceptions.base import AppException
+
+# 커서 토큰 = base64url(payload JSON) + "." + base64url(HMAC-SHA256 서명 앞 16바이트)
+# - payload: {"o": 정렬 컬럼, "s": ASC|DESC, "k": [정렬 컬럼 값, id], "b": 이전 페이지 방향 여부}
+# - 서명이 있으므로 클라이언트가 값을 바꿔서 임의의 위치로 건너뛸 수 없다.
+
+
+class InvalidCursorException(AppException):
+    def __init__(self, message: str = "유효하지 않은 커서입니다."):
+        super().__init__(code="INVALID_CURSOR", message=message, status_code=400)
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _sign(payload: bytes) -> bytes:
+    return hmac.new(settings.SECRET_KEY.encode("utf-8"), payload, hashlib.sha256).digest()[:16]
+
+
+def _dump_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _load_value(column: Column, value):
+    """JSON으로 저장된 키 값을 컬럼 타입(python_type)으로 되돌린다."""
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is Decimal:
+        return Decimal(value)
+    return python_type(value)
+
+
+def encode_cursor(order_by: str, direction: str, keys: list, backward: bool = False) -> str:
+    payload = json.dumps(
+        {"o": order_by, "s": direction, "k": [_dump_value(v) for v in keys], "b": backward},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload))}"
+
+
+def decode_cursor(token: str, order_by: str, direction: str, columns: list[Column]) -> tuple[list, bool]:
+    """
+    서명 확인 후 (정렬 키 값 목록, 이전 페이지 방향 여부) 반환
+    - 커서를 만들 때와 정렬 컬럼/방향이 다르면 위치가 의미 없으므로 거절한다.
+    """
+    try:
+        encoded_payload, encoded_signature = token.split(".", 1)
+        payload = _b64decode(encoded_payload)
+        signature = _b64decode(encoded_signature)
+    except (ValueError, TypeError):
+        raise InvalidCursorException()
+
+    if not hmac.compare_digest(signature, _sign(payload)):
+        raise InvalidCursorException()
+
+    try:
+        data = json.loads(payload)
+        if data["o"] != order_by or data["s"] != direction:
+            raise InvalidCursorException("정렬 조건이 커서와 다릅니다.")
+        if len(data["k"]) != len(columns):
+            raise InvalidCursorException()
+        keys = [_load_value(column, value) for column, value in zip(columns, data["k"])]
+    except (ValueError, KeyError, TypeError):
+        raise InvalidCursorException()
+
+    return keys, bool(data.get("b"))
+
+
+def is_indexed(column: Column) -> bool:
+    """정렬 키로 쓸 수 있는 컬럼인지 (PK / 단일 인덱스 / 해당 컬럼으로 시작하는 복합 인덱스·유니크 제약)"""
+    if column.primary_key or column.index or column.unique:
+        return True
+
+    table = column.table
+    for index in table.indexes:
+        if list(index.columns)[:1] == [column]:
+            return True
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint) and list(constraint.columns)[:1] == [column]:
+            return True
+    return False
@@ -0,0 +1,99 @@
+from datetime import datetime, date
+from decimal import Decimal
+from typing import Callable
+from fastapi import HTTPException
+from starlette import status
+from common.const.filter_mapper import FILTER_MAPPER
+from common.pagination.search import relevance
+
+# where__{컬럼}[__{연산자}] 필터를 (스키마 클래스, 모델) 단위로 한 번만 해석해 둔 실행 계획
+# - 요청마다 model_dump / key split / getattr / FILTER_MAPPER 조회를 반복하지 않는다.
+# - 값은 항상 bind parameter로 들어가므로 같은 필터 조합이면 SQL 구조가 같고,
+#   SQLAlchemy 컴파일 캐시가 요청 간에 컴파일된 SQL을 재사용한다.
+# - 존재하지 않는 컬럼/연산자는 계획을 만들 때(앱 시작 시) ValueError
+# - 요청 값을 컬럼 타입으로 변환할 수 없으면(숫자/날짜 형식, between 값 개수) 400
+
+_plans: dict[tuple[type, type], tuple["FilterStep", ...]] = {}
+
+
+def _coercer(column) -> Callable:
+    """문자열로 들어온 값을 컬럼 타입으로 변환 (between/in 처럼 쉼표로 나눈 값 포함)"""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return lambda v: v
+
+    if python_type is datetime:
+        return lambda v: datetime.fromisoformat(v) if isinstance(v, str) else v
+    if python_type is date:
+        return lambda v: date.fromisoformat(v) if isinstance(v, str) else v
+    if python_type in (int, float, Decimal):
+        return lambda v: python_type(v) if isinstance(v, str) else v
+    return lambda v: v
+
+
+class FilterStep:
+    def __init__(self, field: str, column, op: str | None):
+        self.field = field
+        self.column = column
+        self.op = op
+        self.coerce = _coercer(column)
+        self.operator = FILTER_MAPPER[op] if op else None
+
+    def build(self, value):
+        try:
+            return self._build(value)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"잘못된 필터 값입니다: {self.field}={value}",
+            )
+
+    def _build(self, value):
+        column = self.column
+        if self.op is None:
+            return column == self.coerce(value)
+        if self.op == "between":
+            low, high = [self.coerce(v.strip()) for v in value.split(",")]
+            return column.between(low, high)
+        if self.op == "in":
+            values = value if isinstance(value, list) else value.split(",")
+            return column.in_([self.coerce(v) for v in values])
+        if self.op in ("like", "i_like", "is_null", "search"):
+            return self.operator(column, value)
+        return self.operator(column, self.coerce(value))
+
+    def relevance(self, value):
+        """search 필터의 관련도 점수 (order_by=relevance 정렬 키)"""
+        return relevance(self.column, value)
+
+
+def compile_filter_plan(schema: type, model: type) -> tuple[FilterStep, ...]:
+    steps = []
+    for field in schema.model_fields:
+        if not field.startswith("where__"):
+            continue
+
+        parts = field.split("__")
+        if len(parts) not in (2, 3):
+            raise ValueError(f"잘못된 필터 필드입니다: {schema.__name__}.{field}")
+
+        column = getattr(model, parts[1], None)
+        if column is None:
+            raise ValueError(f"{model.__name__}에 존재하지 않는 컬럼입니다: {schema.__name__}.{field}")
+
+        op = parts[2] if len(parts) == 3 else None
+        if op is not None and op not in FILTER_MAPPER:
+            raise ValueError(f"Unsupported filter operator: {op} ({schema.__name__}.{field})")
+
+        steps.append(FilterStep(field, column, op))
+    return tuple(steps)
+
+
+def get_filter_plan(schema: type, model: type) -> tuple[FilterStep, ...]:
+    """(스키마, 모델)별 필터 계획 (처음 한 번 생성 후 재사용)"""
+    key = (schema, model)
+    plan = _plans.get(key)
+    if plan is None:
+        plan = _plans[key] = compile_filter_plan(schema, model)
+    return plan
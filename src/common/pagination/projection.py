@@ -0,0 +1,136 @@
+from typing import Type, Union, get_args, get_origin
+from pydantic import BaseModel
+from sqlalchemy import select, inspect
+from sqlalchemy.orm import RelationshipDirection
+
+# 페이지네이션 컬럼 프로젝션 (ORM 엔티티 대신 응답 스키마에 필요한 컬럼만 조회)
+# - identity map / ORM 객체 생성 없이 RowMapping → dict로 바로 만든다.
+# - many-to-one 관계(게시글 작성자)는 같은 쿼리에 JOIN, 컬렉션(파일)은 부모 id 목록으로 관계당 IN 쿼리 1번
+
+
+def _unwrap(annotation):
+    """Optional[X] → X, List[X] → (X, True)"""
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else annotation
+    if get_origin(annotation) in (list, tuple, set):
+        return get_args(annotation)[0], True
+    return annotation, False
+
+
+def _is_schema(annotation) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+class ChildProjection:
+    """부모 id 목록으로 한 번에 조회하는 자식 컬렉션 (one-to-many)"""
+    def __init__(self, name: str, parent_key, columns: dict, order_by: tuple = ()):
+        self.name = name
+        self.parent_key = parent_key
+        self.columns = columns
+        self.order_by = order_by
+
+    async def load(self, session, items: list[dict]):
+        parent_ids = [item["id"] for item in items]
+        for item in items:
+            item[self.name] = []
+        if not parent_ids:
+            return
+
+        stmt = (
+            select(self.parent_key.label("_parent_id"), *[col.label(name) for name, col in self.columns.items()])
+            .where(self.parent_key.in_(parent_ids))
+            .order_by(self.parent_key, *self.order_by)
+        )
+        by_parent = {item["id"]: item for item in items}
+        for row in (await session.execute(stmt)).mappings():
+            child = dict(row)
+            by_parent[child.pop("_parent_id")][self.name].append(child)
+
+
+class Projection:
+    """
+    응답 스키마 기준 컬럼 프로젝션
+    - columns: {응답 필드명: 컬럼}
+    - nested: {관계 필드명: (관계 속성, {필드명: 컬럼})} → JOIN 후 "관계__필드" label로 조회해서 중첩 dict로 변환
+    - children: 관계당 배치 IN 쿼리로 채우는 컬렉션
+    """
+    def __init__(self, model, columns: dict, nested: dict | None = None, children: list[ChildProjection] | None = None):
+        self.model = model
+        self.columns = columns
+        self.nested = nested or {}
+        self.children = children or []
+
+    @classmethod
+    def from_schema(cls, model, schema: Type[BaseModel], order_by: dict | None = None) -> "Projection":
+        """
+        스키마 필드로 프로젝션 생성 (앱 시작 시 한 번)
+        - 스칼라 필드 → 모델 컬럼, 스키마 타입 필드 → many-to-one JOIN, List[스키마] 필드 → 자식 컬렉션
+        - order_by: {컬렉션 필드명: (자식 정렬 컬럼명, ...)}
+        """
+        order_by = order_by or {}
+        mapper = inspect(model)
+        columns, nested, children = {}, {}, []
+
+        for name, field in schema.model_fields.items():
+            annotation, many = _unwrap(field.annotation)
+
+            if not _is_schema(annotation):
+                columns[name] = getattr(model, name)
+                continue
+
+            relationship = mapper.relationships[name]
+            target = relationship.mapper.class_
+            target_columns = {
+                child_name: getattr(target, child_name)
+                for child_name, child_field in annotation.model_fields.items()
+                if not _is_schema(_unwrap(child_field.annotation)[0])
+            }
+
+            if relationship.direction is RelationshipDirection.MANYTOONE and not many:
+                nested[name] = (getattr(model, name), target_columns)
+            elif relationship.direction is RelationshipDirection.ONETOMANY and many:
+                parent_key = getattr(target, next(iter(relationship.remote_side)).key)
+                children.append(ChildProjection(
+                    name,
+                    parent_key,
+                    target_columns,
+                    tuple(getattr(target, column) for column in order_by.get(name, ())),
+                ))
+            else:
+                raise ValueError(f"프로젝션에서 지원하지 않는 관계입니다: {model.__name__}.{name}")
+
+        return cls(model, columns, nested, children)
+
+    def select(self, extra_columns: tuple = ()):
+        """프로젝션 select (커서 정렬 키처럼 응답에 없는 컬럼은 extra_columns로 추가)"""
+        labeled = [col.label(name) for name, col in self.columns.items()]
+        for prefix, (_, columns) in self.nested.items():
+            labeled.extend(col.label(f"{prefix}__{name}") for name, col in columns.items())
+
+        names = set(self.columns)
+        for column in extra_columns:
+            if column.key not in names:
+                labeled.append(column.label(column.key))
+                names.add(column.key)
+
+        stmt = select(*labeled).select_from(self.model)
+        for relationship, _ in self.nested.values():
+            stmt = stmt.join(relationship)
+        return stmt
+
+    async def fetch(self, session, stmt) -> list[dict]:
+        items = []
+        for row in (await session.execute(stmt)).mappings():
+            item = {}
+            for key, value in row.items():
+                prefix, separator, name = key.partition("__")
+                if separator and prefix in self.nested:
+                    item.setdefault(prefix, {})[name] = value
+                else:
+                    item[key] = value
+            items.append(item)
+
+        for child in self.children:
+            await child.load(session, items)
+        return items
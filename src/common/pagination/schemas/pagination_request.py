@@ -6,4 +6,6 @@ class BasePaginationSchema(BaseModel):
     take: int = Field(default=20, description="Number of items per request")
     where__id__less_than: Optional[int] = None
     where__id__more_than: Optional[int] = None
-    order__id: Optional[Literal['ASC', 'DESC']] = 'ASC'
\ No newline at end of file
+    order__id: Optional[Literal['ASC', 'DESC']] = 'ASC'
+    order_by: Optional[str] = Field(default=None, description="커서 페이지네이션 정렬 컬럼 (인덱스가 있는 컬럼, id가 tie-breaker / 방향은 order__id, relevance는 search 필터 관련도순)")
+    cursor: Optional[str] = Field(default=None, description="이전 응답의 cursor.after(다음) 또는 cursor.before(이전) 토큰")
\ No newline at end of file
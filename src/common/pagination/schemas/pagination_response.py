@@ -8,7 +8,9 @@ class CursorPaginationResult(BaseModel, Generic[T]):
     count: int
     cursor: Optional[dict]
     next: Optional[str]
+    prev: Optional[str] = None
 
 class PagePaginationResult(BaseModel, Generic[T]):
     data: List[T]
     total: int
+    total_estimated: Optional[bool] = None  # estimated 전략으로 계산된 total이면 True
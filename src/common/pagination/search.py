@@ -0,0 +1,82 @@
+from sqlalchemy import Boolean, Float, case, literal
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ColumnElement
+from sqlalchemy.sql.visitors import InternalTraversal
+
+# where__{컬럼}__search 연산자
+# - MySQL: FULLTEXT(ngram parser) 인덱스 + MATCH ... AGAINST ('"검색어"' IN BOOLEAN MODE)
+#   ngram은 공백 없이 n글자 단위로 토큰을 만들기 때문에 한국어 제목도 부분 검색이 된다.
+#   검색어를 "..." 구문으로 감싸서 ngram 토큰이 연속으로 모두 일치하는 행만 찾는다. (%검색어% 와 비슷한 결과)
+# - 그 외(SQLite 테스트 등): ILIKE '%검색어%' 로 대체, 관련도는 일치 1 / 불일치 0
+
+# ngram_token_size 기본값(2)보다 짧은 검색어는 FULLTEXT로 찾을 수 없으므로 LIKE 사용
+NGRAM_TOKEN_SIZE = 2
+
+
+def _boolean_phrase(term: str) -> str:
+    return '"' + term.replace('"', " ").strip() + '"'
+
+
+class FullTextMatch(ColumnElement):
+    """WHERE 조건: MATCH(col) AGAINST(:phrase IN BOOLEAN MODE) / 그 외 dialect는 col ILIKE :pattern"""
+    inherit_cache = True
+    type = Boolean()
+    # WHERE에 그대로 쓰는 조건식 (Boolean 비교 "= 1"을 덧붙이지 않음)
+    _is_implicitly_boolean = True
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("phrase", InternalTraversal.dp_clauseelement),
+        ("fallback", InternalTraversal.dp_clauseelement),
+    ]
+
+    def __init__(self, column, term: str):
+        self.column = column
+        self.phrase = literal(_boolean_phrase(term))
+        self.fallback = column.ilike(f"%{term}%")
+
+
+class FullTextScore(ColumnElement):
+    """관련도 점수 (정렬/커서 키): MATCH(col) AGAINST(...) / 그 외 dialect는 일치 여부 1, 0"""
+    inherit_cache = True
+    type = Float()
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("phrase", InternalTraversal.dp_clauseelement),
+        ("fallback", InternalTraversal.dp_clauseelement),
+    ]
+
+    def __init__(self, column, term: str):
+        self.column = column
+        self.phrase = literal(_boolean_phrase(term))
+        self.fallback = case((column.ilike(f"%{term}%"), 1.0), else_=0.0)
+
+
+@compiles(FullTextMatch)
+@compiles(FullTextScore)
+def _compile_fallback(element, compiler, **kw):
+    return compiler.process(element.fallback, **kw)
+
+
+@compiles(FullTextMatch, "mysql")
+@compiles(FullTextScore, "mysql")
+def _compile_mysql(element, compiler, **kw):
+    return (
+        f"MATCH ({compiler.process(element.column, **kw)}) "
+        f"AGAINST ({compiler.process(element.phrase, **kw)} IN BOOLEAN MODE)"
+    )
+
+
+def search(column, term: str):
+    """검색 조건 (ngram 토큰보다 짧은 검색어는 LIKE)"""
+    term = term.strip()
+    if len(term) < NGRAM_TOKEN_SIZE:
+        return column.ilike(f"%{term}%")
+    return FullTextMatch(column, term)
+
+
+def relevance(column, term: str):
+    """관련도 점수 (order_by=relevance)"""
+    term = term.strip()
+    if len(term) < NGRAM_TOKEN_SIZE:
+        return case((column.ilike(f"%{term}%"), 1.0), else_=0.0)
+    return FullTextScore(column, term)
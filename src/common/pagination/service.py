@@ -1,10 +1,17 @@
-from typing import Type
+from typing import Type, Optional
+import asyncio
+import hashlib
+import json
+import logging
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, asc, func
+from sqlalchemy import select, desc, asc, func, tuple_, text
 from urllib.parse import urlencode
 from common.pagination.schemas.pagination_request import BasePaginationSchema
 from common.pagination.schemas.pagination_response import PagePaginationResult, CursorPaginationResult
-from common.const.filter_mapper import FILTER_MAPPER
+from common.pagination.filter_plan import get_filter_plan
+from common.pagination.cursor import encode_cursor, decode_cursor, is_indexed
+from common.pagination.projection import Projection
+from common.exceptions.base import AppException
 import os
 import uuid
 from fastapi import UploadFile, HTTPException
@@ -15,11 +22,23 @@ from common.const.file_consts import ALLOWED_IMAGE_EXTENSIONS
 from common.const.path_consts import TEMP_FOLDER_PATH
 import aiofiles
 from cache.redis_connection import redis
+from cache.generation import get_generation
+from cache.single_flight import SingleFlight
+from database.mysql_connection import async_session_maker
 
 
 from common.const.settings import settings  # settings 직접 import
 
 
+logger = logging.getLogger(__name__)
+
+# 검색 관련도순 정렬 (order_by=relevance)
+RELEVANCE = "relevance"
+
+# cached COUNT 전략에서 같은 조건의 동시 COUNT 합치기 (key: count 캐시 key)
+count_flight = SingleFlight("pagination_count")
+
+
 class CommonService:
     async def paginate(
         self,
@@ -28,75 +47,275 @@ class CommonService:
         session: AsyncSession,
         base_query=None,
         path: str = "",
+        count_strategy: Optional[str] = None,
+        concurrent_count: Optional[bool] = None,
+        projection: Optional[Projection] = None,
     ):
+        """
+        - projection을 넘기면 ORM 엔티티 대신 응답 스키마 컬럼만 조회한 dict 목록을 반환 (base_query 무시)
+        """
         if request.page:
-            return await self.page_paginate(request, model, session, base_query)
-        return await self.cursor_paginate(request, model, session, base_query, path)
+            return await self.page_paginate(
+                request, model, session, base_query,
+                count_strategy=count_strategy, concurrent_count=concurrent_count, projection=projection,
+            )
+        return await self.cursor_paginate(request, model, session, base_query, path, projection=projection)
+
+    async def page_paginate(
+        self,
+        request,
+        model,
+        session,
+        base_query=None,
+        count_strategy: Optional[str] = None,
+        concurrent_count: Optional[bool] = None,
+        projection: Optional[Projection] = None,
+    ):
+        """
+        페이지 번호 페이지네이션
+        - count_strategy: exact | cached | estimated (기본값 settings.PAGINATION_COUNT_STRATEGY)
+        - concurrent_count: COUNT를 별도 세션에서 페이지 조회와 동시에 실행 (커넥션 1개 추가 사용)
+        """
+        strategy = count_strategy or settings.PAGINATION_COUNT_STRATEGY
+        if concurrent_count is None:
+            concurrent_count = settings.PAGINATION_CONCURRENT_COUNT
 
-    async def page_paginate(self, request, model, session, base_query=None):
-        query = base_query if base_query is not None else select(model)
+        query = self.base_select(model, base_query, projection)
         query = self.apply_filters(query, model, request)
 
-        total = await session.scalar(select(func.count()).select_from(query.subquery()))
-        query = query.order_by(
+        page_query = query.order_by(
             asc(model.id) if request.order__id == "ASC" else desc(model.id)
         )
-        query = query.limit(request.take).offset(request.take * (request.page - 1))
-        result = await session.execute(query)
-        data = result.scalars().all()
+        page_query = page_query.limit(request.take).offset(request.take * (request.page - 1))
+
+        # cached: 캐시에 있으면 COUNT 없이 페이지만 조회
+        cache_key = None
+        total = None
+        if strategy == "cached":
+            cache_key = await self.count_cache_key(model, query)
+            total = await self.get_cached_count(cache_key)
+
+        if total is not None:
+            data = await self.fetch_page(session, page_query, projection)
+            return PagePaginationResult(data=data, total=total)
+
+        if concurrent_count:
+            (total, estimated), data = await asyncio.gather(
+                self.count_once(cache_key, lambda: self.count_in_new_session(strategy, model, query)),
+                self.fetch_page(session, page_query, projection),
+            )
+        else:
+            total, estimated = await self.count_once(cache_key, lambda: self.count_total(strategy, model, query, session))
+            data = await self.fetch_page(session, page_query, projection)
+
+        return PagePaginationResult(data=data, total=total, total_estimated=True if estimated else None)
+
+    @staticmethod
+    def base_select(model, base_query=None, projection: Optional[Projection] = None, extra_columns: tuple = ()):
+        if projection is not None:
+            return projection.select(extra_columns)
+        return base_query if base_query is not None else select(model)
+
+    @staticmethod
+    async def fetch_page(session, page_query, projection: Optional[Projection] = None) -> list:
+        if projection is not None:
+            return await projection.fetch(session, page_query)
+        result = await session.execute(page_query)
+        return list(result.scalars().all())
+
+    async def count_once(self, cache_key: Optional[str], count) -> tuple[int, bool]:
+        """cached 전략: 같은 조건의 동시 COUNT는 single-flight로 한 번만 실행하고 결과를 캐시에 저장"""
+        if cache_key is None:
+            return await count()
+
+        async def count_and_cache():
+            total, estimated = await count()
+            await self.set_cached_count(cache_key, total)
+            return total, estimated
+
+        async def recheck():
+            total = await self.get_cached_count(cache_key)
+            return (total, False) if total is not None else None
 
-        return PagePaginationResult(data=data, total=total)
+        return await count_flight.do(cache_key, count_and_cache, recheck=recheck)
 
-    async def cursor_paginate(self, request, model, session, base_query=None, path=""):
-        query = base_query if base_query is not None else select(model)
+    async def count_in_new_session(self, strategy: str, model, query) -> tuple[int, bool]:
+        # 하나의 AsyncSession(커넥션)에서는 쿼리를 동시에 실행할 수 없으므로 COUNT는 별도 세션에서 실행
+        async with async_session_maker() as count_session:
+            return await self.count_total(strategy, model, query, count_session)
+
+    async def count_total(self, strategy: str, model, query, session) -> tuple[int, bool]:
+        """(total, 추정치 여부) 반환"""
+        if strategy == "estimated":
+            estimated = await self.estimate_count(model, query, session)
+            if estimated is not None:
+                return estimated, True
+
+        total = await session.scalar(select(func.count()).select_from(query.subquery()))
+        return total, False
+
+    async def estimate_count(self, model, query, session) -> Optional[int]:
+        """
+        MySQL 통계 기반 추정치 (MySQL 외에는 None → exact로 대체)
+        - 필터가 없으면 information_schema.TABLES.TABLE_ROWS
+        - 필터가 있으면 EXPLAIN의 rows * filtered(%)
+        """
+        dialect = session.get_bind().dialect
+        if dialect.name != "mysql":
+            return None
+
+        if query.whereclause is None:
+            rows = await session.scalar(
+                text(
+                    "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"
+                ),
+                {"table": model.__tablename__},
+            )
+            return int(rows or 0)
+
+        # 필터 값은 literal로 넣지 않고 드라이버 파라미터로 전달 (값의 :name, % 가 SQL로 해석되지 않도록)
+        statement = select(model.id).where(query.whereclause)
+        compiled = statement.compile(dialect=dialect, compile_kwargs={"render_postcompile": True})
+        params = compiled.params
+        if compiled.positional:
+            params = tuple(params[name] for name in compiled.positiontup)
+        connection = await session.connection(bind_arguments={"clause": statement})
+        plan = (await connection.exec_driver_sql(f"EXPLAIN {compiled.string}", params)).mappings().first()
+        if not plan or plan.get("rows") is None:
+            return None
+        return int(plan["rows"] * float(plan.get("filtered") or 100) / 100)
+
+    @staticmethod
+    async def count_cache_key(model, query) -> str:
+        """테이블 세대 번호 + 필터가 적용된 COUNT 쿼리(SQL + 파라미터) 해시 → 값이 같은 필터는 같은 key"""
+        compiled = select(func.count()).select_from(query.subquery()).compile()
+        normalized = json.dumps(
+            [str(compiled), sorted(compiled.params.items())], default=str, ensure_ascii=False
+        )
+        digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+        table = model.__tablename__
+        generation = await get_generation(table)
+        return f"count:{table}:{generation}:{digest}"
+
+    @staticmethod
+    async def get_cached_count(cache_key: str) -> Optional[int]:
+        try:
+            value = await redis.get(cache_key)
+        except Exception as e:
+            logger.warning(f" COUNT 캐시 조회 실패: {e}")
+            return None
+        return int(value) if value is not None else None
+
+    @staticmethod
+    async def set_cached_count(cache_key: str, total: int):
+        try:
+            await redis.set(cache_key, total, ex=settings.PAGINATION_COUNT_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f" COUNT 캐시 저장 실패: {e}")
+
+    async def cursor_paginate(self, request, model, session, base_query=None, path="", projection: Optional[Projection] = None):
+        """
+        키셋(커서) 페이지네이션
+        - 정렬 키 = (order_by 컬럼, id) → WHERE (col, id) > (:v1, :v2) ORDER BY col, id LIMIT take + 1
+          행 값 비교로 인덱스 위치에서 바로 시작하므로 깊은 페이지도 첫 페이지와 비용이 같다.
+        - cursor 토큰은 서명된 불투명 값 (encode_cursor), before 토큰으로 이전 페이지 조회
+        - take + 1개를 가져와서 다음(이전) 페이지가 있는지 판단
+        """
+        order_by = request.order_by or "id"
+        if order_by == RELEVANCE:
+            # 관련도순은 항상 높은 점수부터 (점수 → id 내림차순)
+            direction = "DESC"
+            key_columns = self.get_relevance_key_columns(model, request, projection)
+        else:
+            direction = "DESC" if request.order__id == "DESC" else "ASC"
+            key_columns = self.get_cursor_key_columns(model, order_by)
+
+        backward = False
+        query = self.base_select(model, base_query, projection, extra_columns=tuple(key_columns))
         query = self.apply_filters(query, model, request)
 
+        if request.cursor:
+            values, backward = decode_cursor(request.cursor, order_by, direction, [c.expression for c in key_columns])
+            # 이전 페이지는 반대 방향으로 스캔한 뒤 뒤집는다.
+            scan_ascending = (direction == "ASC") != backward
+            row, position = tuple_(*key_columns), tuple_(*values)
+            query = query.where(row > position if scan_ascending else row < position)
+        else:
+            scan_ascending = direction == "ASC"
+
         query = query.order_by(
-            asc(model.id) if request.order__id == "ASC" else desc(model.id)
-        ).limit(request.take)
+            *[asc(column) if scan_ascending else desc(column) for column in key_columns]
+        ).limit(request.take + 1)
 
-        result = await session.execute(query)
-        items = result.scalars().all()
-        last_item = items[-1] if len(items) == request.take else None
+        items = await self.fetch_page(session, query, projection)
 
-        next_url = None
-        if last_item:
-            params = request.model_dump(exclude_none=True)
-            key = "where__id__more_than" if request.order__id == "ASC" else "where__id__less_than"
-            params[key] = last_item.id
+        has_more = len(items) > request.take
+        items = items[:request.take]
+        if backward:
+            items.reverse()
 
-            next_url = f"{settings.PROTOCOL}://{settings.HOST}:{settings.PORT}/{path}?{urlencode(params)}"
+        def cursor_for(item, to_backward: bool) -> str:
+            keys = [
+                item[column.key] if isinstance(item, dict) else getattr(item, column.key)
+                for column in key_columns
+            ]
+            return encode_cursor(order_by, direction, keys, backward=to_backward)
 
+        # 다음 페이지: 정방향이면 더 있을 때, 이전 방향으로 왔다면 항상 존재
+        after = cursor_for(items[-1], False) if items and (has_more if not backward else True) else None
+        # 이전 페이지: 커서로 들어온 정방향 페이지이거나, 이전 방향으로 더 있을 때
+        before = cursor_for(items[0], True) if items and (has_more if backward else bool(request.cursor)) else None
 
         return CursorPaginationResult(
             data=items,
             count=len(items),
-            cursor={"after": last_item.id if last_item else None},
-            next=next_url,
+            cursor={"after": after, "before": before},
+            next=self.build_cursor_url(request, path, after),
+            prev=self.build_cursor_url(request, path, before),
         )
 
+    @staticmethod
+    def get_cursor_key_columns(model, order_by: str) -> list:
+        """정렬 컬럼 + tie-breaker(id) 목록, 인덱스가 없거나 NULL 가능한 컬럼은 거절"""
+        column = getattr(model, order_by, None)
+        table_column = model.__table__.columns.get(order_by)
+        if column is None or table_column is None:
+            raise AppException(code="INVALID_ORDER_BY", message=f"정렬할 수 없는 컬럼입니다: {order_by}")
+        if not is_indexed(table_column) or table_column.nullable:
+            raise AppException(code="INVALID_ORDER_BY", message=f"인덱스가 없는 컬럼으로는 정렬할 수 없습니다: {order_by}")
+
+        if order_by == "id":
+            return [model.id]
+        return [column, model.id]
+
+    @staticmethod
+    def get_relevance_key_columns(model, request, projection: Optional[Projection] = None) -> list:
+        """
+        order_by=relevance: (검색 관련도 점수, id) 를 커서 키로 사용
+        - 점수는 search 필터 값으로 매번 같은 식을 만들기 때문에 같은 검색어면 커서 위치가 유지된다.
+        - 점수는 엔티티 속성이 아니므로 프로젝션(dict) 조회에서만 지원
+        """
+        if projection is None:
+            raise AppException(code="INVALID_ORDER_BY", message="관련도 정렬을 지원하지 않는 목록입니다.")
+        for step in get_filter_plan(type(request), model):
+            value = getattr(request, step.field)
+            if step.op == "search" and value:
+                return [step.relevance(value).label(RELEVANCE), model.id]
+        raise AppException(code="INVALID_ORDER_BY", message="관련도 정렬은 검색어(search 필터)가 있어야 합니다.")
+
+    @staticmethod
+    def build_cursor_url(request, path: str, token) -> str | None:
+        if token is None:
+            return None
+        params = request.model_dump(exclude_none=True)
+        params["cursor"] = token
+        return f"{settings.PROTOCOL}://{settings.HOST}:{settings.PORT}/{path}?{urlencode(params)}"
+
     def apply_filters(self, query, model, dto: BasePaginationSchema):
-        for key, value in dto.model_dump(exclude_none=True).items():
-            if key.startswith("where__"):
-                parts = key.split("__")
-                column = getattr(model, parts[1], None)
-                if not column:
-                    continue
-
-                if len(parts) == 2:
-                    query = query.where(column == value)
-                elif len(parts) == 3:
-                    op = parts[2]
-                    func = FILTER_MAPPER.get(op)
-                    if not func:
-                        raise ValueError(f"Unsupported filter operator: {op}")
-
-                    if op == "between":
-                        # 넘기기만 하고 가공하지 않음
-                        query = query.where(func(column, value))
-                    elif op == "i_like":
-                        query = query.where(func(column, f"%{value}%"))
-                    else:
-                        query = query.where(func(column, value))
+        """(스키마, 모델)별로 미리 만들어 둔 필터 계획에서 값이 있는 필터만 WHERE로 추가"""
+        for step in get_filter_plan(type(dto), model):
+            value = getattr(dto, step.field)
+            if value is not None:
+                query = query.where(step.build(value))
         return query
-    
\ No newline at end of file
@@ -0,0 +1,36 @@
+# src/common/utils/etag.py
+import hashlib
+from typing import Optional
+from fastapi import Response
+from starlette import status
+
+# 조건부 GET (ETag / If-None-Match)
+# - ETag는 응답 내용을 결정하는 값(id, updated_at, 개수 등)의 해시 (strong ETag)
+# - 토큰이 필요한 응답이므로 공유 캐시에는 저장하지 않고(private), 클라이언트는 매번 재검증(no-cache)
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.sha1("|".join(map(str, parts)).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match는 weak 비교 (W/ 접두어 무시), 여러 값(,) / * 허용"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def etag_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
+
+
+def json_response(content: bytes, etag: Optional[str] = None) -> Response:
+    return Response(content=content, media_type="application/json", headers=etag_headers(etag) if etag else None)
@@ -1,21 +1,50 @@
 import os
+import json
+import time
+import random
+import queue
+import atexit
 import logging
 from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+from contextlib import contextmanager
 from dotenv import load_dotenv
 from pathlib import Path
 from common.utils.log_context import request_id_ctx_var, user_id_ctx_var
 
+try:
+    import orjson  # JSON 로그 직렬화 (없으면 표준 json 사용)
+except ImportError:
+    orjson = None
+
+try:
+    import fcntl  # 파일 잠금 (Linux/macOS)
+except ImportError:  # Windows 개발 환경에서는 잠금 없이 동작
+    fcntl = None
+
 load_dotenv()
 
 level = os.getenv("LOG_LEVEL", "INFO").upper()
 LOG_LEVEL = getattr(logging, level, logging.INFO)
 
+#  로그 처리 방식 (queue: 요청 처리 스레드는 큐에 넣기만 하고 별도 스레드가 출력 | sync: 기존 방식)
+LOG_MODE = os.getenv("LOG_MODE", "queue").lower()
+
+#  로그 출력 형식 (text: 사람이 읽는 형식 | json: orjson 기반 구조화 로그)
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+
+#  로거별 INFO 이하 로그 샘플링 비율 (예: "common.middleware.logging=0.1,sqlalchemy=0.5")
+LOG_SAMPLE_RATES = os.getenv("LOG_SAMPLE_RATES", "")
+
 #  logs 폴더를 프로젝트 루트 기준으로 만들기
 BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent  # ex) src/common/utils/logger_config.py → Backend/
 LOGS_DIR = BASE_DIR / "logs"
 LOGS_DIR.mkdir(parents=True, exist_ok=True)  # logs 폴더 없으면 생성
 LOG_FILE_PATH = LOGS_DIR / "app.log"
 
+#  queue 모드에서 콘솔/파일 출력을 담당하는 리스너 스레드
+_listener: QueueListener | None = None
+
 #  요청 단위 request_id, user_id 추적용 필터 클래스
 class RequestContextFilter(logging.Filter):
     def filter(self, record):
@@ -23,7 +52,125 @@ class RequestContextFilter(logging.Filter):
         record.user_id = user_id_ctx_var.get(None)
         return True
 
+
+class SamplingFilter(logging.Filter):
+    """
+    로거별 샘플링 (요청량이 많은 접근 로그 등)
+    - WARNING 이상은 항상 남긴다.
+    - 로거 이름이 가장 길게 일치하는 설정을 사용 (common.middleware → common.middleware.logging에도 적용)
+    - 포맷팅 전에 걸러지므로 버려지는 로그는 문자열 생성 비용도 없다.
+      (queue 모드에서는 QueueHandler에 달아서 큐에 넣기 전, prepare()의 메시지 포맷팅 전에 거른다)
+    """
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        self.rates = rates
+        self._cache: dict[str, float] = {}
+
+    def _rate_for(self, name: str) -> float:
+        rate = self._cache.get(name)
+        if rate is None:
+            matched = [
+                logger_name for logger_name in self.rates
+                if name == logger_name or name.startswith(f"{logger_name}.")
+            ]
+            rate = self.rates[max(matched, key=len)] if matched else 1.0
+            self._cache[name] = rate
+        return rate
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate_for(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+def parse_sample_rates(value: str) -> dict[str, float]:
+    rates = {}
+    for item in value.split(","):
+        if "=" not in item:
+            continue
+        name, rate = item.split("=", 1)
+        rates[name.strip()] = float(rate)
+    return rates
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    orjson 기반 JSON 한 줄 로그
+    - request_id, user_id(RequestContextFilter)와 extra로 넘긴 필드(route, duration 등)를 그대로 필드로 출력
+    """
+    EXTRA_FIELDS = ("method", "route", "path", "status_code", "duration")
+
+    def format(self, record):
+        payload = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", None),
+            "user_id": getattr(record, "user_id", None),
+            "location": f"{record.filename}:{record.lineno}",
+        }
+        for field in self.EXTRA_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                payload[field] = value
+
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+
+        if orjson is not None:
+            return orjson.dumps(payload, default=str).decode("utf-8")
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+class ProcessSafeTimedRotatingFileHandler(TimedRotatingFileHandler):
+    """
+    여러 uvicorn 워커가 같은 app.log를 쓸 때도 안전한 자정 로테이션
+    - 기본 TimedRotatingFileHandler는 워커마다 로테이션을 시도하면서
+      먼저 회전된 app.log.YYYY-MM-DD를 지우고 덮어쓰는 경쟁이 생긴다.
+    - 잠금 파일로 로테이션을 직렬화하고, 이미 다른 워커가 회전했다면 새 파일을 다시 열기만 한다.
+    """
+    @contextmanager
+    def _rollover_lock(self):
+        if fcntl is None:
+            yield
+            return
+
+        with open(f"{self.baseFilename}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def doRollover(self):
+        with self._rollover_lock():
+            t = self.rolloverAt - self.interval
+            time_tuple = time.gmtime(t) if self.utc else time.localtime(t)
+            dfn = self.rotation_filename(f"{self.baseFilename}.{time.strftime(self.suffix, time_tuple)}")
+
+            if not os.path.exists(dfn):
+                super().doRollover()
+                return
+
+            # 다른 워커가 이미 회전함 → 현재 파일을 다시 열고 다음 로테이션 시각만 갱신
+            if self.stream:
+                self.stream.close()
+                self.stream = None
+            self.rolloverAt = self.computeRollover(int(time.time()))
+            if not self.delay:
+                self.stream = self._open()
+
+
 def setup_logging():
+    # 재설정되는 경우 이전 리스너 정리
+    stop_logging()
+
+    formatter = "json" if LOG_FORMAT == "json" else "default"
+
     log_config = {
         "version": 1,
         "disable_existing_loggers": False,
@@ -31,25 +178,32 @@ def setup_logging():
             "default": {
                 "format": "%(asctime)s [%(levelname)s] [req_id:%(request_id)s user:%(user_id)s] %(filename)s:%(lineno)d - %(message)s"
             },
+            "json": {
+                "()": JsonFormatter
+            },
         },
         "filters": {
             "request_context": {
                 '()': RequestContextFilter
             },
+            "sampling": {
+                '()': SamplingFilter,
+                "rates": parse_sample_rates(LOG_SAMPLE_RATES),
+            },
         },
         "handlers": {
             "console": {
                 "class": "logging.StreamHandler",
                 "level": LOG_LEVEL,
-                "formatter": "default",
-                "filters": ["request_context"],
+                "formatter": formatter,
+                "filters": ["sampling", "request_context"],
                 "stream": "ext://sys.stdout",
             },
             "file": {
-                "class": "logging.handlers.TimedRotatingFileHandler",
+                "()": ProcessSafeTimedRotatingFileHandler,
                 "level": LOG_LEVEL,
-                "formatter": "default",
-                "filters": ["request_context"],
+                "formatter": formatter,
+                "filters": ["sampling", "request_context"],
                 "filename": str(LOG_FILE_PATH),
                 "when": "midnight",
                 "interval": 1,
@@ -63,4 +217,52 @@ def setup_logging():
         },
     }
 
-    dictConfig(log_config)
\ No newline at end of file
+    dictConfig(log_config)
+
+    if LOG_MODE == "queue":
+        _use_queue_handler()
+
+
+def _use_queue_handler():
+    """
+    root 로거의 출력 핸들러를 QueueListener 스레드로 옮기고, root에는 QueueHandler만 남긴다.
+    - logger.info()는 큐에 넣기만 하므로 이벤트 루프에서 디스크/콘솔 I/O가 발생하지 않는다.
+    - request_id, user_id는 컨텍스트 변수라서 emit 시점(QueueHandler)에 필터로 기록해야 한다.
+      리스너 스레드에서 다시 필터를 돌리면 None으로 덮어쓰므로 출력 핸들러의 필터는 제거한다.
+    - 샘플링도 QueueHandler로 옮긴다. 버려질 로그가 prepare()에서 포맷팅되고 큐를 거치지 않도록
+      RequestContextFilter보다 먼저 실행한다. (출력 핸들러가 여러 개여도 같은 로그가 남음)
+    """
+    global _listener
+
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    sampling = None
+
+    for handler in handlers:
+        root.removeHandler(handler)
+        for f in [f for f in handler.filters if isinstance(f, (SamplingFilter, RequestContextFilter))]:
+            if isinstance(f, SamplingFilter):
+                sampling = sampling or f
+            handler.removeFilter(f)
+
+    queue_handler = QueueHandler(queue.SimpleQueue())
+    if sampling is not None:
+        queue_handler.addFilter(sampling)
+    queue_handler.addFilter(RequestContextFilter())
+    root.addHandler(queue_handler)
+
+    _listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging():
+    """queue 모드 리스너 종료 (큐에 남은 로그를 모두 출력한 뒤 종료)"""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+# 프로세스 종료 시 큐에 남은 로그 출력
+atexit.register(stop_logging)
@@ -1,13 +1,86 @@
 # src/database/dependencies.py
+import time
 from typing import AsyncGenerator
-from database.mysql_connection import async_session_maker
+from fastapi import Request, Response
+from database.mysql_connection import (
+    async_session_maker,
+    replica_engines,
+    WRITE_FLAG,
+    USE_PRIMARY,
+    HAS_WRITTEN,
+    WRITTEN_TABLES,
+    INVALIDATED_CACHE_KEYS,
+)
+from cache.generation import bump_generations
+from cache.read_through import delete_cache_keys
 from sqlalchemy.ext.asyncio import AsyncSession
+from common.const.settings import settings
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+# 쓰기 이후 같은 클라이언트의 조회를 primary로 고정하는 쿠키 (값: 고정 만료 unix time)
+STICKY_PRIMARY_COOKIE = "db_primary_until"
+
+
+def has_pending_writes(session: AsyncSession) -> bool:
+    """commit이 필요한지 여부 (flush되지 않은 add/변경/삭제 객체 또는 이미 실행된 쓰기)"""
+    return bool(
+        session.info.get(WRITE_FLAG)
+        or session.new
+        or session.dirty
+        or session.deleted
+    )
+
+
+def is_sticky_primary(request: Request) -> bool:
+    """최근에 쓰기를 한 클라이언트인지 (복제 지연 동안 primary에서 조회)"""
+    try:
+        return float(request.cookies.get(STICKY_PRIMARY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+def sticky_primary_cookie_header(until: float) -> str:
+    """응답에 추가할 sticky primary Set-Cookie 헤더 값"""
+    response = Response()
+    response.set_cookie(
+        STICKY_PRIMARY_COOKIE,
+        str(round(until, 3)),
+        max_age=settings.DB_STICKY_PRIMARY_SECONDS,
+        httponly=True,
+        samesite="lax",
+    )
+    return next(value.decode("latin-1") for key, value in response.raw_headers if key == b"set-cookie")
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    요청 단위 DB 세션
+    - AsyncSession은 첫 execute 시점에 풀에서 커넥션을 가져온다.
+      쿼리가 없는 요청은 트랜잭션이 시작되지 않으므로(session.in_transaction() False) DB 왕복이 전혀 없다.
+    - 쓰기가 있었던 경우에만 commit, 조회만 했다면 COMMIT 없이 close
+      단, 조회로 시작된 트랜잭션은 커넥션 반환 시 ROLLBACK으로 끝나므로 왕복 한 번은 그대로 남는다.
+      (InnoDB 스냅샷을 다음 요청에 넘기지 않기 위해 필요, 줄어드는 것은 COMMIT 처리 비용뿐)
+    - 커밋된 쓰기가 있으면 테이블별 캐시 세대 번호를 올려서 관련 캐시(카운트, 목록)를 무효화
+      + 트랜잭션 안에서 무효화한 캐시 key(게시글 상세 등)를 커밋 후 한 번 더 삭제
+    - 복제본이 설정된 경우 조회는 복제본으로 (RoutingSession), 쓰기가 있었던 요청은
+      request.state.db_primary_until을 남겨서 RequestPipelineMiddleware가 sticky primary 쿠키를 발급한다.
+    """
     async with async_session_maker() as session:
+        if replica_engines and is_sticky_primary(request):
+            session.info[USE_PRIMARY] = True
+
         try:
             yield session
-            await session.commit()
+            if has_pending_writes(session):
+                await session.commit()
         except:
             await session.rollback()
-            raise
\ No newline at end of file
+            raise
+        finally:
+            written_tables = session.info.pop(WRITTEN_TABLES, None)
+            if written_tables:
+                await bump_generations(written_tables)
+            invalidated_keys = session.info.pop(INVALIDATED_CACHE_KEYS, None)
+            if invalidated_keys:
+                await delete_cache_keys(invalidated_keys)
+            if replica_engines and session.info.get(HAS_WRITTEN):
+                request.state.db_primary_until = time.time() + settings.DB_STICKY_PRIMARY_SECONDS
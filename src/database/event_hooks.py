@@ -1,17 +1,127 @@
 # src/database/event_hooks.py
 
-from sqlalchemy import event
+import time
+import logging
+from sqlalchemy import event, exc
 from sqlalchemy.ext.asyncio import AsyncEngine
-from database.mysql_connection import async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from common.metrics.registry import metrics
 
-# @event.listens_for(async_engine.sync_engine, "begin")
-# def before_transaction_begin(conn):
-#     print("🔥 [트랜잭션 시작] conn:", conn)
+logger = logging.getLogger(__name__)
 
-# @event.listens_for(async_engine.sync_engine, "commit")
-# def before_transaction_commit(conn):
-#     print("✅ [트랜잭션 커밋] conn:", conn)
+# 커넥션 풀 메트릭 (pool label = 엔진 생성 시 지정한 pool_logging_name: primary, replica0, ...)
+pool_checkout_wait = metrics.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled DB connection",
+    ("pool",),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0),
+)
+pool_checkout_timeouts = metrics.counter(
+    "db_pool_checkout_timeouts_total",
+    "DB connection checkouts that hit pool_timeout",
+    ("pool",),
+)
+pool_connections_created = metrics.counter(
+    "db_pool_connections_created_total",
+    "New DBAPI connections opened by the pool",
+    ("pool",),
+)
+pool_invalidations = metrics.counter(
+    "db_pool_invalidations_total",
+    "Invalidated DB connections (pre_ping = pool_pre_ping failure)",
+    ("pool", "reason"),
+)
+pool_connection_lifetime = metrics.histogram(
+    "db_pool_connection_lifetime_seconds",
+    "Lifetime of DBAPI connections from connect to close",
+    ("pool",),
+    buckets=(1, 10, 60, 300, 600, 1200, 1800, 3600, 7200),
+)
 
-# @event.listens_for(async_engine.sync_engine, "rollback")
-# def before_transaction_rollback(conn):
-#     print("❌ [트랜잭션 롤백] conn:", conn)
+# 상태 조회(/metrics, 시작 로그)용 엔진 목록 (dispose 시 풀 객체가 새로 만들어지므로 엔진을 보관)
+_engines: dict[str, AsyncEngine] = {}
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    checkout 대기 시간을 기록하는 커넥션 풀
+    - 풀 이벤트에는 대기 시작 시점이 없으므로 _do_get(빈 커넥션을 기다리는 구간)을 직접 측정한다.
+    - pool_timeout 초과는 TimeoutError로 올라오므로 별도 카운트
+    """
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            pool_checkout_timeouts.inc(self.logging_name)
+            raise
+        finally:
+            pool_checkout_wait.observe(time.perf_counter() - start, self.logging_name)
+
+
+def register_pool_listeners(engine: AsyncEngine):
+    """엔진 풀에 연결 생성/무효화/종료 이벤트 리스너 등록 (mysql_connection에서 엔진 생성 직후 호출)"""
+    pool = engine.sync_engine.pool
+    name = pool.logging_name
+    _engines[name] = engine
+
+    @event.listens_for(pool, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        connection_record.info["connected_at"] = time.monotonic()
+        pool_connections_created.inc(name)
+
+    @event.listens_for(pool, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        # pool_pre_ping 실패는 InvalidatePoolError로 무효화된다.
+        reason = "pre_ping" if isinstance(exception, exc.InvalidatePoolError) else "error"
+        pool_invalidations.inc(name, reason)
+
+    @event.listens_for(pool, "soft_invalidate")
+    def on_soft_invalidate(dbapi_connection, connection_record, exception):
+        pool_invalidations.inc(name, "soft")
+
+    @event.listens_for(pool, "close")
+    def on_close(dbapi_connection, connection_record):
+        connected_at = connection_record.info.pop("connected_at", None)
+        if connected_at is not None:
+            pool_connection_lifetime.observe(time.monotonic() - connected_at, name)
+
+
+def pool_status() -> dict[str, dict]:
+    """풀별 현재 상태 (size: 설정된 pool_size, overflow: max_overflow 사용량, 음수면 아직 pool_size만큼 열리지 않음)"""
+    pools = {name: engine.sync_engine.pool for name, engine in _engines.items()}
+    return {
+        name: {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+        }
+        for name, pool in pools.items()
+    }
+
+
+def collect_pool_metrics():
+    status = pool_status()
+    for field, description in (
+        ("checked_out", "DB connections currently checked out"),
+        ("checked_in", "Idle DB connections in the pool"),
+        ("overflow", "DB connections opened beyond pool_size"),
+        ("size", "Configured pool_size"),
+    ):
+        for name, values in status.items():
+            yield f"db_pool_{field}", "gauge", description, values[field], {"pool": name}
+
+
+def log_pool_status():
+    """시작 로그에 풀 설정/상태 출력"""
+    for name, values in pool_status().items():
+        logger.info(
+            f" DB pool[{name}] size={values['size']} max_overflow={values['max_overflow']} "
+            f"timeout={values['timeout']}s checked_out={values['checked_out']} checked_in={values['checked_in']}"
+        )
+
+
+metrics.register_collector(collect_pool_metrics)
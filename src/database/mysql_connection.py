@@ -1,33 +1,128 @@
+import random
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, Session, SessionTransactionOrigin
 from common.model.base_model import Base
 from fastapi.exceptions import HTTPException
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import status
 from common.const.settings import settings  # 환경 변수 로드
 from sqlalchemy.pool import NullPool  # NullPool 사용
+from database.event_hooks import InstrumentedAsyncQueuePool, register_pool_listeners
 
 #(환경변수에서 가져오기)
 DATABASE_CONN = settings.DATABASE_CONN
+DATABASE_REPLICA_CONNS = [url.strip() for url in settings.DATABASE_REPLICA_CONNS.split(",") if url.strip()]
 
-# 비동기 엔진 생성
-async_engine = create_async_engine(
-    DATABASE_CONN,
+ENGINE_OPTIONS = dict(
     echo=False,
     pool_size=10,
     max_overflow=20,
-     pool_timeout=3,  
+    pool_timeout=3,
     pool_recycle=1800,
     pool_pre_ping=True,
-    # poolclass 생략! 기본값으로 AsyncAdaptedQueuePool 사용
+    poolclass=InstrumentedAsyncQueuePool,  # AsyncAdaptedQueuePool + checkout 대기 시간 측정
 )
 
+# 비동기 엔진 생성 (primary: 쓰기 + 트랜잭션)
+async_engine = create_async_engine(DATABASE_CONN, pool_logging_name="primary", **ENGINE_OPTIONS)
+
+# 읽기 복제본 엔진 (설정이 없으면 빈 목록 → 모든 쿼리가 primary)
+replica_engines = [
+    create_async_engine(url, pool_logging_name=f"replica{i}", **ENGINE_OPTIONS)
+    for i, url in enumerate(DATABASE_REPLICA_CONNS)
+]
+
+# 풀 메트릭 리스너 등록 (checkout 대기, 연결 생성/수명, pre_ping 실패)
+for engine in (async_engine, *replica_engines):
+    register_pool_listeners(engine)
+
+# 현재 트랜잭션에서 쓰기(flush 또는 INSERT/UPDATE/DELETE 실행)가 있었는지 표시하는 session.info 키
+WRITE_FLAG = "has_writes"
+# 세션의 이후 쿼리를 모두 primary로 보내도록 지정하는 session.info 키 (쓰기 이후 sticky primary)
+USE_PRIMARY = "use_primary"
+# 세션에서 쓰기가 한 번이라도 있었는지 (요청 종료 후 sticky primary 쿠키 발급 판단용)
+HAS_WRITTEN = "has_written"
+# 현재 트랜잭션에서 쓰기가 발생한 테이블 / 커밋된 쓰기의 테이블 (캐시 세대 갱신용)
+PENDING_TABLES = "pending_tables"
+WRITTEN_TABLES = "written_tables"
+# 현재 트랜잭션에서 무효화한 캐시 key / 커밋 후 한 번 더 삭제할 캐시 key (cache/read_through.py)
+PENDING_CACHE_KEYS = "pending_cache_keys"
+INVALIDATED_CACHE_KEYS = "invalidated_cache_keys"
+
+
+class RoutingSession(Session):
+    """
+    조회는 복제본으로, 나머지는 primary로 보내는 세션
+    - primary 고정: db.begin() 블록 안, 쓰기(flush/DML) 이후, SELECT ... FOR UPDATE, text() 쿼리, info[USE_PRIMARY]
+    - 같은 트랜잭션에서 쓰기 이후의 조회도 primary로 보내므로 방금 쓴 데이터를 다시 읽을 수 있다.
+    """
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if replica_engines and self._is_replica_read(clause):
+            return random.choice(replica_engines).sync_engine
+        return async_engine.sync_engine
+
+    def _is_replica_read(self, clause) -> bool:
+        if self._flushing or self.info.get(USE_PRIMARY) or self.info.get(WRITE_FLAG):
+            return False
+        if clause is None or not getattr(clause, "is_select", False):
+            return False
+        if getattr(clause, "_for_update_arg", None) is not None:
+            return False
+
+        transaction = self.get_transaction()
+        return transaction is None or transaction.origin is SessionTransactionOrigin.AUTOBEGIN
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_flushed(session, flush_context):
+    session.info[WRITE_FLAG] = True
+    # after_flush 시점에도 new/dirty/deleted는 flush 이전 상태를 보여준다.
+    tables = session.info.setdefault(PENDING_TABLES, set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table:
+            tables.add(table)
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _mark_write_statement(orm_execute_state):
+    # select가 아닌 문장(insert/update/delete/text)은 쓰기로 간주
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[WRITE_FLAG] = True
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None:
+            orm_execute_state.session.info.setdefault(PENDING_TABLES, set()).add(table.name)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _collect_written_tables(session):
+    tables = session.info.pop(PENDING_TABLES, None)
+    if tables:
+        session.info.setdefault(WRITTEN_TABLES, set()).update(tables)
+    keys = session.info.pop(PENDING_CACHE_KEYS, None)
+    if keys:
+        session.info.setdefault(INVALIDATED_CACHE_KEYS, set()).update(keys)
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _clear_write_flag(session, transaction):
+    # 최상위 트랜잭션이 끝나면(commit/rollback, db.begin() 블록 종료 포함) 표시 초기화
+    # 쓰기가 있었다면 복제 지연 동안 이 세션의 이후 조회는 primary에서 읽는다.
+    if transaction.parent is None:
+        session.info.pop(PENDING_TABLES, None)
+        session.info.pop(PENDING_CACHE_KEYS, None)
+    if transaction.parent is None and session.info.pop(WRITE_FLAG, None):
+        session.info[USE_PRIMARY] = True
+        session.info[HAS_WRITTEN] = True
+
+
 # 비동기 세션 팩토리 생성
 async_session_maker  = sessionmaker(
     bind=async_engine,
     expire_on_commit= False,  # commit 후 세션 내 ORM 객체가 만료되도록 설정(즉, API 요청마다 로직 과정에서 데이터가 변경될 수 있으므로 마지막에 다시 최종 데이터를 한번 더 가져옴)
     autoflush=False,  # 자동 flush 비활성화 (flush()를 직접 호출)
     autocommit=False,  # commit()을 자동으로 수행하지 않음 (수동 처리)
-    class_=AsyncSession  # 비동기 세션 사용
+    class_=AsyncSession,  # 비동기 세션 사용
+    sync_session_class=RoutingSession,  # 조회는 복제본, 쓰기는 primary로 라우팅
 )
-
@@ -0,0 +1,121 @@
+# src/database/query_plan.py
+import json
+from contextlib import contextmanager
+from sqlalchemy import event, select, func
+from database.mysql_connection import async_engine, replica_engines
+
+# 저장소(repository) 쿼리 실행 계획 점검 (MySQL 전용)
+# - 저장소 메서드를 실제로 실행하면서 나간 SELECT를 모아 EXPLAIN FORMAT=JSON으로 계획을 확인한다.
+# - 기준 행 수를 넘는 풀 스캔(access_type=ALL) / filesort를 문제로 보고한다.
+# - 데이터가 충분히 있어야 의미가 있다. (행 수가 적으면 옵티마이저가 풀 스캔을 고른다)
+# - 실행: tests/test_query_plans.py (MySQL에 데이터를 채운 트랜잭션 안에서 점검 후 rollback)
+
+DEFAULT_MAX_ROWS = 1000
+
+
+def _rows(node: dict) -> int:
+    """계획 노드 아래 테이블들의 스캔 행 수 중 최댓값"""
+    rows = node.get("rows_examined_per_scan") or 0
+    for value in node.values():
+        children = value if isinstance(value, list) else [value]
+        for child in children:
+            if isinstance(child, dict):
+                rows = max(rows, _rows(child))
+    return rows
+
+
+def find_plan_problems(plan: dict, max_rows: int = DEFAULT_MAX_ROWS) -> list[str]:
+    """EXPLAIN FORMAT=JSON 결과에서 기준 행 수를 넘는 풀 스캔 / filesort 목록"""
+    problems = []
+
+    def walk(node: dict):
+        if node.get("access_type") == "ALL" and (node.get("rows_examined_per_scan") or 0) > max_rows:
+            problems.append(f"full scan: {node.get('table_name')} ({node['rows_examined_per_scan']} rows)")
+        if node.get("using_filesort") and _rows(node) > max_rows:
+            problems.append(f"filesort: {_rows(node)} rows")
+        for value in node.values():
+            children = value if isinstance(value, list) else [value]
+            for child in children:
+                if isinstance(child, dict):
+                    walk(child)
+
+    walk(plan)
+    return problems
+
+
+@contextmanager
+def capture_selects(engines=None):
+    """블록 안에서 실행된 SELECT (SQL, 파라미터) 수집 (기본값: primary / replica 엔진 모두)"""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    if engines is None:
+        engines = [async_engine.sync_engine, *[engine.sync_engine for engine in replica_engines]]
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield captured
+    finally:
+        for engine in engines:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def explain(session, statement: str, parameters) -> dict:
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN FORMAT=JSON {statement}", parameters)
+    return json.loads(result.scalar_one())
+
+
+async def _sample_ids(session) -> dict:
+    from post.model import PostModel
+    from user.model import UserModel
+    return {
+        "post_id": await session.scalar(select(func.max(PostModel.id))) or 1,
+        "user_id": await session.scalar(select(func.min(UserModel.id))) or 1,
+    }
+
+
+def repository_queries(ids: dict) -> dict:
+    """점검할 저장소 쿼리 {이름: session을 받아 실행하는 함수} (전체 조회가 목적인 get_posts / get_all_file_paths 제외)"""
+    from post.repository import PostRepository
+    from post.schemas.request import PaginatePostSchema
+    from user.repository import UserRepository
+    from cart.repository import CartRepository
+    from common.file.repository import FileRepository
+
+    post_id, user_id = ids["post_id"], ids["user_id"]
+    return {
+        "post.get_post_by_id": lambda s: PostRepository(s).get_post_by_id(post_id),
+        "post.paginate.cursor": lambda s: PostRepository(s).get_posts_paginated(PaginatePostSchema(take=20)),
+        "post.paginate.cursor_desc": lambda s: PostRepository(s).get_posts_paginated(
+            PaginatePostSchema(take=20, order__id="DESC")
+        ),
+        "post.paginate.likeCount": lambda s: PostRepository(s).get_posts_paginated(
+            PaginatePostSchema(take=20, order_by="likeCount", order__id="DESC")
+        ),
+        "post.paginate.search": lambda s: PostRepository(s).get_posts_paginated(
+            PaginatePostSchema(take=20, where__title__search="검색어", order_by="relevance")
+        ),
+        "user.get_user_by_id": lambda s: UserRepository(s).get_user_by_id(user_id),
+        "user.get_user_by_email": lambda s: UserRepository(s).get_user_by_email("plan@example.com"),
+        "cart.get_cart_by_user_id": lambda s: CartRepository(s).get_cart_by_user_id(user_id),
+        "file.get_files_by_owner": lambda s: FileRepository(s).get_files_by_owner("post", post_id),
+        "file.get_file_by_uuid": lambda s: FileRepository(s).get_file_by_uuid("00000000-0000-0000-0000-000000000000"),
+    }
+
+
+async def check_repository_queries(session, max_rows: int = DEFAULT_MAX_ROWS, engines=None) -> dict[str, list[str]]:
+    """{쿼리 이름: 문제 목록} (문제가 없는 쿼리는 빈 목록, 트랜잭션 정리는 호출한 쪽에서)"""
+    report = {}
+    ids = await _sample_ids(session)
+    for name, run in repository_queries(ids).items():
+        with capture_selects(engines) as captured:
+            await run(session)
+        problems = []
+        for statement, parameters in captured:
+            problems.extend(find_plan_problems(await explain(session, statement, parameters), max_rows))
+        report[name] = problems
+    return report
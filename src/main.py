@@ -5,12 +5,7 @@ from common.lifecycle.lifespan import lifespan
 from fastapi.staticfiles import StaticFiles
 from common.const.settings import settings
 from common.const.path_consts import PUBLIC_FOLDER_PATH
-from common.middleware.logging import (
-    RequestLoggerMiddleware,
-    LogContextMiddleware
-)
-from common.middleware.auth import AuthMiddleware
-from common.middleware.session import RedisSessionMiddleware
+from common.middleware.pipeline import RequestPipelineMiddleware
 from cache.redis_connection import redis
 
 
@@ -38,6 +33,7 @@ from auth.route import router as auth_router
 from cart.router import router as cart_router
 from common.image.router import router as common_image_router
 from common.file.router import router as common_file_router
+from common.metrics.router import router as metrics_router
 
 app = FastAPI(lifespan=lifespan)
 
@@ -49,11 +45,9 @@ app.add_middleware(
     allow_headers=["Authorization", "Content-Type", "Accept"],
 )
 
-# 미들웨어 등록
-app.add_middleware(RequestLoggerMiddleware)  # 가장 바깥
-app.add_middleware(LogContextMiddleware)     # 로그 ID 설정
-app.add_middleware(RedisSessionMiddleware, redis=redis)   # Redis 세션 사용
-app.add_middleware(AuthMiddleware)           # 토큰 검증
+# 미들웨어 등록 (가장 바깥)
+# Request ID 설정 → 토큰 검증 → Redis 세션 → 요청 로깅을 하나의 순수 ASGI 미들웨어에서 처리
+app.add_middleware(RequestPipelineMiddleware, redis=redis)
 
 
 # 예외 핸들러 등록
@@ -74,6 +68,10 @@ app.include_router(user_router)
 app.include_router(auth_router)
 app.include_router(cart_router)
 
+# 메트릭 엔드포인트 (opt-in)
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
+
 
 # 헬스체크
 @app.get("/")
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from sqlalchemy import Enum as SqlEnum
 from sqlalchemy import String, Integer, Numeric, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, backref
 from sqlalchemy import ForeignKey
 from common.model.base_model import Base
 from typing import Optional, List, TYPE_CHECKING
@@ -24,8 +24,8 @@ class OrderModel(Base):
     status: Mapped[OrderStatus] = mapped_column(SqlEnum(OrderStatus), default=OrderStatus.PENDING)
     total_amount: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
 
-    user = relationship("UserModel", backref="orders", lazy="selectin")
-    items: Mapped[List["OrderItemModel"]] = relationship(back_populates="order", cascade="all, delete-orphan", lazy="selectin")
+    user = relationship("UserModel", backref=backref("orders", lazy="raise"), lazy="raise")
+    items: Mapped[List["OrderItemModel"]] = relationship(back_populates="order", cascade="all, delete-orphan", lazy="raise")
 
 
 class OrderItemModel(Base):
@@ -36,5 +36,5 @@ class OrderItemModel(Base):
     quantity: Mapped[int] = mapped_column(Integer, nullable=False)
     price_at_time: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
 
-    order: Mapped["OrderModel"] = relationship("OrderModel", back_populates="items", lazy="selectin")
-    product: Mapped["ProductModel"] = relationship("ProductModel", back_populates="order_items", lazy="selectin")
+    order: Mapped["OrderModel"] = relationship("OrderModel", back_populates="items", lazy="raise")
+    product: Mapped["ProductModel"] = relationship("ProductModel", back_populates="order_items", lazy="raise")
@@ -0,0 +1,114 @@
+# src/post/cache.py
+import json
+import hashlib
+import logging
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from cache.read_through import ReadThroughCache, Loader, Entry
+from cache.generation import get_generations
+from common.const.settings import settings
+from common.utils.etag import make_etag
+from database.mysql_connection import async_session_maker
+from post.repository import PostRepository
+from post.schemas.request import PaginatePostSchema
+from post.schemas.response import PostSchema
+
+logger = logging.getLogger(__name__)
+
+# 게시글 상세 캐시 (key: post:{id}, 값: PostSchema JSON + ETag)
+# - 게시글 수정/삭제/파일 변경 시 invalidate_post로 무효화
+# - 작성자 정보(user)가 바뀌는 경우는 TTL로 반영
+# - ETag는 조회한 게시글/작성자/파일의 updated_at으로 만들어 JSON과 같이 저장 (hit이면 DB 없이 304 판단)
+post_detail_cache = ReadThroughCache(
+    "post",
+    ttl=settings.POST_CACHE_TTL,
+    stale_ttl=settings.POST_CACHE_STALE_TTL,
+    enabled=settings.POST_CACHE_ENABLED,
+)
+
+
+def post_detail_key(post_id: int) -> str:
+    return post_detail_cache.key(post_id)
+
+
+def post_etag(post) -> str:
+    """상세 응답(PostSchema)을 결정하는 값의 버전 (작성자/파일 변경은 post.updated_at에 남지 않으므로 같이 포함)"""
+    return make_etag(
+        "post",
+        post.id,
+        post.updated_at,
+        post.user.updated_at,
+        len(post.files),
+        max((file.updated_at for file in post.files), default=None),
+    )
+
+
+async def load_post_entry(session: AsyncSession, post_id: int) -> Optional[Entry]:
+    post = await PostRepository(session).get_post_by_id(post_id)
+    if post is None:
+        return None
+    return PostSchema.model_validate(post).model_dump_json().encode("utf-8"), post_etag(post)
+
+
+async def refresh_post_entry(post_id: int) -> Optional[Entry]:
+    """stale 갱신용 (요청 세션이 아닌 별도 세션)"""
+    async with async_session_maker() as session:
+        return await load_post_entry(session, post_id)
+
+
+async def get_post_entry(session: AsyncSession, post_id: int) -> Optional[Entry]:
+    """(PostSchema JSON, ETag), 게시글이 없으면 None"""
+    return await post_detail_cache.get_entry(
+        post_detail_key(post_id),
+        lambda: load_post_entry(session, post_id),
+        refresh=lambda: refresh_post_entry(post_id),
+    )
+
+
+async def invalidate_post(session: AsyncSession, post_id: int):
+    await post_detail_cache.invalidate_after_commit(session, post_detail_key(post_id))
+
+
+# 게시글 목록 페이지 캐시 (key: post_list:{post 세대}.{user 세대}.{file 세대}:{요청 해시}, 값: PaginatedPostSchema JSON + ETag)
+# - 목록 응답에 작성자(user), 파일(file)이 포함되므로 세 테이블 중 하나라도 쓰기가 커밋되면
+#   get_db의 세대 번호 증가로 모든 페이지가 O(1)로 무효화된다. (이전 세대 key는 TTL로 만료)
+# - 같은 요청이면 next/prev URL도 같은 요청 값으로 만들어지므로 캐시된 응답과 동일
+# - ETag도 같은 key(세대 + 요청 해시)로 만들기 때문에 304 판단에 DB 조회가 없다.
+POST_LIST_TABLES = ("post", "user", "file")
+
+post_list_cache = ReadThroughCache(
+    "post_list",
+    ttl=settings.POST_LIST_CACHE_TTL,
+    enabled=settings.POST_LIST_CACHE_ENABLED,
+)
+
+
+def post_list_request_hash(request: PaginatePostSchema) -> str:
+    """기본값을 포함한 요청 값을 key 순서와 무관하게 정규화한 해시"""
+    normalized = json.dumps(request.model_dump(exclude_none=True), sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+async def get_post_list_key(request: PaginatePostSchema) -> Optional[str]:
+    """세대 번호를 읽지 못하면 None (캐시/ETag 없이 응답)"""
+    try:
+        generations = await get_generations(POST_LIST_TABLES)
+    except Exception as e:
+        logger.warning(f" 게시글 목록 캐시 세대 조회 실패: {e}")
+        return None
+    return post_list_cache.key(".".join(map(str, generations)), post_list_request_hash(request))
+
+
+def post_list_etag(key: str) -> str:
+    return make_etag(key)
+
+
+async def get_post_list_entry(key: Optional[str], load: Loader) -> Entry:
+    """(PaginatedPostSchema JSON, ETag), key가 None이면 ETag는 빈 문자열"""
+    if key is None:
+        return await load(), ""
+
+    async def load_entry() -> Entry:
+        return await load(), post_list_etag(key)
+
+    return await post_list_cache.get_entry(key, load_entry)
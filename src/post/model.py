@@ -1,5 +1,5 @@
 from __future__ import annotations
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from common.model.base_model import Base
 from post.schemas.request import CreatePostSchema, UpdatePostSchema
@@ -12,6 +12,13 @@ from user.model import UserModel
 
 class PostModel(Base):
     __tablename__ = "post"
+    __table_args__ = (
+        # 커서 페이지네이션 정렬 키 (order_by=likeCount | created_at, id가 tie-breaker)
+        Index("ix_post_likeCount_id", "likeCount", "id"),
+        Index("ix_post_created_at_id", "created_at", "id"),
+        # where__title__search 전문 검색 (한국어 제목은 공백 토큰화가 안 되므로 ngram parser)
+        Index("ft_post_title", "title", mysql_prefix="FULLTEXT", mysql_with_parser="ngram"),
+    )
 
     author_id: Mapped[int] = mapped_column(ForeignKey("user.id"), nullable=False)
     title: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -19,14 +26,14 @@ class PostModel(Base):
     likeCount: Mapped[int] = mapped_column(default=0, nullable=False)
     commentCount: Mapped[int] = mapped_column(default=0, nullable=False)
 
-    user: Mapped[UserModel] = relationship("UserModel", back_populates="posts", lazy="selectin")
+    user: Mapped[UserModel] = relationship("UserModel", back_populates="posts", lazy="raise")
 
     # image Model 관계 생성
     images: Mapped[List["ImageModel"]] = relationship(
         "ImageModel",
         back_populates="post",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy="raise"
     )
 
     # file Model 관계 생성성
@@ -34,7 +41,7 @@ class PostModel(Base):
         "FileModel",
         back_populates="post",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy="raise"
     )
 
     # pydantic 클래스로 받은 부분을 sqlalchemy.orm으로 변환해주는 작업
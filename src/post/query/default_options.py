@@ -1,17 +1,33 @@
 from sqlalchemy.orm import selectinload, joinedload
 from sqlalchemy import select
 from post.model import PostModel
+from common.model.load_profiles import load_profile
+from common.pagination.projection import Projection
+from post.schemas.response import PostSchema
+from post.schemas.request import PaginatePostSchema
+from common.pagination.filter_plan import get_filter_plan
 
 # 예를들어서 user, post의 모델이 서로 관계과 연동되어 있을 경우,
 # 반드시 selectinload으로 불러와야 한다.
 # 이유는 SQLAlchemy는 기본적으로 lazy-loading 이기 때문이다.
 # lazy-loading -> 연관된 테이블의 데이터를 가져온다.
 # 참고로 모델에 lazy="raise" 되어 있어서 반드시 selectinload을 통해서 관계를 설정해야 한다.
+# 관계별 로딩 옵션은 common/model/load_profiles.py의 프로필로 관리
 
 
 def get_default_post_query():
-    return select(PostModel).options(
-        selectinload(PostModel.user),
-        selectinload(PostModel.images),
-        selectinload(PostModel.files)
-    )
\ No newline at end of file
+    """게시글 상세 조회용 (user, images, files)"""
+    return select(PostModel).options(*load_profile("post_detail"))
+
+
+def get_post_list_query():
+    """게시글 목록 조회용 (user, files)"""
+    return select(PostModel).options(*load_profile("post_list"))
+
+
+# 게시글 목록 페이지네이션용 컬럼 프로젝션 (PostSchema 필드만, user는 JOIN / files는 IN 쿼리 1번)
+POST_LIST_PROJECTION = Projection.from_schema(PostModel, PostSchema, order_by={"files": ("order", "id")})
+
+# 게시글 목록 필터 계획을 앱 시작(import) 시 미리 컴파일해서 캐시에 넣어 둔다.
+# (잘못된 where__ 필드/연산자는 요청 시점이 아니라 앱 시작 시 에러, 요청에서는 get_filter_plan이 캐시를 사용)
+get_filter_plan(PaginatePostSchema, PostModel)
@@ -2,7 +2,7 @@ from sqlalchemy import select, delete, insert
 from fastapi import HTTPException, status
 from post.model import PostModel
 from post.schemas.request import PaginatePostSchema, CreatePostSchema, UpdatePostSchema
-from post.query.default_options import get_default_post_query
+from post.query.default_options import get_default_post_query, get_post_list_query, POST_LIST_PROJECTION
 from typing import List
 from sqlalchemy.ext.asyncio import AsyncSession
 from common.pagination.service import CommonService
@@ -15,22 +15,18 @@ class PostRepository:
         self.common_service = CommonService()
 
     async def get_posts(self) -> List[PostModel]:
-        result = await self.db.scalars(select(PostModel))
+        result = await self.db.scalars(get_post_list_query())
         return list(result)
 
     async def get_posts_paginated(self, request: PaginatePostSchema):
 
-        # 조인이 필요한 경우
-        # 단, 모델간의 관계가 lazy="selectin" 인 경우는 필요없음
-        # 단, lazy="raise" 인 경우는 반드시 selectinload로 관계설정으로 select 해오는게 필요함
-        #     그러므로  lazy="raise"면 query를 같이 보내야 한다.
-        query = get_default_post_query()
-
+        # ORM 엔티티 대신 PostSchema에 필요한 컬럼만 조회 (dict 목록)
+        # ORM 엔티티가 필요하면 projection 대신 base_query=get_post_list_query() (post_list 프로필)
         return await self.common_service.paginate(
             request,
             PostModel,
             self.db,
-            base_query=None,  # 또는 query,
+            projection=POST_LIST_PROJECTION,
             path="posts"
         )
 
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Response
 from post.schemas.request import CreatePostSchema, UpdatePostSchema, PaginatePostSchema, CreatePostForm
 from auth.tokens.access_token import access_token
 from post.service import PostService
@@ -10,6 +11,7 @@ from user.const.roles import RolesEnum
 from post.dependencies.owner_or_admin import is_post_owner_or_admin
 from database.dependencies import get_db
 from cache.dependencies import get_redis
+from common.utils.etag import etag_matches, json_response, not_modified
 from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
 
@@ -30,9 +32,17 @@ async def get_paginated_posts(
     request: PaginatePostSchema = Depends(),
     db: AsyncSession = Depends(get_db),
     _: None = Depends(access_token), # 토큰이 있는 사람만 접근 가능
+    if_none_match: Optional[str] = Header(default=None),
 ):
     service = PostService(db)
-    return await service.get_paginated_posts(request)
+    # ETag는 세대 번호 + 요청 해시로 계산 → 목록이 바뀌지 않았으면 DB 조회 없이 304
+    key = await service.get_paginated_posts_key(request)
+    if key is not None:
+        etag = service.get_paginated_posts_etag(key)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+    content, etag = await service.get_paginated_posts_entry(request, key)
+    return json_response(content, etag or None)
 
 
 @router.get("/{id}")
@@ -44,10 +54,15 @@ async def get_post_by_id(
     user: UserModel = Depends(get_current_user),     # user 필요시 request.state.user 꺼내쓰거나, 세션(get_current_user)에서 꺼내쓰기
     cart: dict[int, int] = Depends(get_current_cart),
     db: AsyncSession = Depends(get_db), 
+    if_none_match: Optional[str] = Header(default=None),
 ):
 
     service = PostService(db)
-    return await service.get_post_by_id(id)
+    # 캐시된 PostSchema JSON을 그대로 응답 (재직렬화 없음), ETag도 캐시에 같이 저장되어 있어 hit이면 DB 조회 없이 304
+    content, etag = await service.get_post_entry(id)
+    if etag and etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return json_response(content, etag or None)
 
 
 @router.post("")
@@ -62,7 +77,8 @@ async def create_post(
     async with db.begin():
         post_id = await post_service.create_post_with_schema(user.id, request)
 
-    return await post_service.get_post_by_id(post_id)  # 트랜잭션 밖에서 안전하게 조회
+    # 트랜잭션 밖 조회 (캐시는 다음 GET 때 채워짐)
+    return Response(content=await post_service.read_post_json(post_id), media_type="application/json")
 
 
 @router.post("/form")
@@ -83,7 +99,8 @@ async def create_post_form(
             db = db,
         )
 
-    return await post_service.get_post_by_id(post_id)  # 트랜잭션 밖 조회
+    # 트랜잭션 밖 조회 (캐시는 다음 GET 때 채워짐)
+    return Response(content=await post_service.read_post_json(post_id), media_type="application/json")
 
 
 @router.patch("/{id}")
@@ -99,7 +116,8 @@ async def update_post(
     async with db.begin():
         post_id = await post_service.update_post_with_schema(user.id, id, request)
 
-    return await post_service.get_post_by_id(post_id)  # 최신 상태 반환
+    # 최신 상태 반환 (캐시는 get_db가 커밋 후 무효화하므로 DB에서 바로 조회)
+    return Response(content=await post_service.read_post_json(post_id), media_type="application/json")
 
 
 @router.delete("/{id}")
@@ -36,4 +36,5 @@ class PaginatePostSchema(BasePaginationSchema):
     # 이유는 i_like의 경우 %i_like% 이러한 변형이 필요하기 때문이다.
     where__likeCount__more_than: Optional[int] = Field(default=None, description="좋아요 개수 최소값")
     where__title__i_like: Optional[str] = Field(default=None, description="제목 검색")
+    where__title__search: Optional[str] = Field(default=None, description="제목 전문 검색 (FULLTEXT ngram, order_by=relevance로 관련도순 정렬)")
     where__id__between: Optional[str] = Field(default=None, description="ID 범위 (예: 10,20)")
\ No newline at end of file
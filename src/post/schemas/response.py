@@ -26,7 +26,9 @@ class PostListSchema(BaseModel):
 class PaginatedPostSchema(BaseModel):
     posts: List[PostSchema]
     total: Optional[int] = None
+    total_estimated: Optional[bool] = None
     count: Optional[int] = None
     cursor: Optional[dict] = None
     next: Optional[str] = None
+    prev: Optional[str] = None
 
@@ -5,6 +5,7 @@ from post.schemas.response import PostSchema, PaginatedPostSchema
 from post.repository import PostRepository
 from post.image.service import PostImageService
 from post.file.file_service import PostFileService
+from post.cache import get_post_entry, load_post_entry, get_post_list_key, get_post_list_entry, post_list_etag, invalidate_post
 from common.const.path_consts import FILE_UPLOAD_PATH
 from common.file.file_service import FileService
 from common.file.upload_service import UploadService
@@ -29,24 +30,62 @@ class PostService:
         return True
 
     async def get_paginated_posts(self, request: PaginatePostSchema) -> dict:
+        response = await self.build_paginated_posts(request)
+        return response.model_dump(exclude_none=True)
+
+    async def get_paginated_posts_key(self, request: PaginatePostSchema) -> Optional[str]:
+        """목록 캐시 key (세대 번호 + 요청 해시), 세대를 읽지 못하면 None"""
+        return await get_post_list_key(request)
+
+    @staticmethod
+    def get_paginated_posts_etag(key: str) -> str:
+        """목록 ETag (캐시 key로 계산하므로 DB 조회 없음)"""
+        return post_list_etag(key)
+
+    async def get_paginated_posts_entry(self, request: PaginatePostSchema, key: Optional[str]) -> tuple[bytes, str]:
+        """(게시글 목록 JSON, ETag) - 요청별 페이지 캐시, 게시글/작성자/파일 쓰기 시 세대 번호로 무효화"""
+        async def load() -> bytes:
+            response = await self.build_paginated_posts(request)
+            return response.model_dump_json(exclude_none=True).encode("utf-8")
+
+        return await get_post_list_entry(key, load)
+
+    async def build_paginated_posts(self, request: PaginatePostSchema) -> PaginatedPostSchema:
         result = await self.post_repo.get_posts_paginated(request)
 
-        response = PaginatedPostSchema(
+        return PaginatedPostSchema(
             posts=[PostSchema.model_validate(post) for post in result.data],
             total=getattr(result, "total", None),
+            total_estimated=getattr(result, "total_estimated", None),
             count=getattr(result, "count", None),
             cursor=getattr(result, "cursor", None),
             next=getattr(result, "next", None),
+            prev=getattr(result, "prev", None),
         )
 
-        return response.model_dump(exclude_none=True)
-
     async def get_post_by_id(self, post_id: int) -> PostSchema:
         post = await self.post_repo.get_post_by_id(post_id)
         if not post:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="post not found")
         return PostSchema.model_validate(post)
 
+    async def get_post_entry(self, post_id: int) -> tuple[bytes, str]:
+        """(게시글 상세 JSON, ETag) - Redis read-through 캐시, hit이면 DB 조회 없음"""
+        entry = await get_post_entry(self.db, post_id)
+        if entry is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="post not found")
+        return entry
+
+    async def read_post_json(self, post_id: int) -> bytes:
+        """
+        쓰기 직후 응답용 게시글 상세 JSON (캐시를 거치지 않음)
+        - 쓰기에서 무효화한 상세 캐시 key는 응답 후 get_db에서 한 번 더 삭제되므로 여기서 채워도 소용없다.
+        """
+        entry = await load_post_entry(self.db, post_id)
+        if entry is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="post not found")
+        return entry[0]
+
     async def create_post_with_schema(self, user_id: int, request: CreatePostSchema) -> int:
         post = await self.post_repo.create_post(user_id, request)
 
@@ -89,6 +128,7 @@ class PostService:
             raise HTTPException(status_code=403, detail="수정 권한이 없습니다.")
 
         await self.post_repo.update_post(post, request)
+        await invalidate_post(self.db, post.id)
 
         if request.files is not None:
             await self.post_file_service.update_files(post.id, request.files)
@@ -103,6 +143,7 @@ class PostService:
         deleted_file_paths = await self.file_service.collect_file_paths("post", post_id)
 
         await self.post_repo.delete_post(post_id)
+        await invalidate_post(self.db, post_id)
 
         for path in deleted_file_paths:
             if os.path.exists(path):
@@ -18,8 +18,8 @@ class ProductModel(Base):
     sku: Mapped[Optional[str]] = mapped_column(String(50), unique=True)
 
     cart_items: Mapped[List["CartItemModel"]] = relationship(
-        "CartItemModel", back_populates="product", cascade="all, delete-orphan", lazy="selectin"
+        "CartItemModel", back_populates="product", cascade="all, delete-orphan", lazy="raise"
     )
     order_items: Mapped[List["OrderItemModel"]] = relationship(
-        "OrderItemModel", back_populates="product", cascade="all, delete-orphan", lazy="selectin"
+        "OrderItemModel", back_populates="product", cascade="all, delete-orphan", lazy="raise"
     )
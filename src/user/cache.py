@@ -0,0 +1,169 @@
+# src/user/cache.py
+import logging
+from datetime import datetime
+from typing import Any, Optional
+from pydantic import BaseModel
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import object_session
+from sqlalchemy.ext.asyncio import AsyncSession
+from cache.two_tier import TwoTierCache
+from cache.single_flight import SingleFlight
+from common.const.settings import settings
+from common.metrics.registry import metrics
+from database.mysql_connection import PENDING_CACHE_KEYS
+from auth.const.fields import UNIQUE_USER_FIELDS
+from user.const.roles import RolesEnum
+from user.model import UserModel
+from user.repository import UserRepository
+
+logger = logging.getLogger(__name__)
+
+# 사용자 레코드 캐시 (토큰 인증의 DB 조회 / 사용자 조회 API)
+# - key: user:id:{id}, user:{email|login_id|phone|nickname}:{값(소문자)} → 모두 같은 레코드 JSON
+# - UserSchema 필드만 보관 (password 해시는 Redis/워커 local에 두지 않고, 로그인 검증은 DB 조회)
+#   어느 key로 miss가 나도 DB 조회 한 번으로 모든 key를 채운다.
+# - 없는 사용자는 빈 값으로 짧게 캐싱 (negative cache)
+# - 2단 캐시(워커 local → Redis)라서 자주 쓰는 사용자는 토큰 인증 시 Redis 왕복도 없음
+# - 같은 key의 동시 miss는 single-flight로 DB 조회 한 번만 (토큰 만료 직후 몰리는 인증 요청 등)
+# - UserModel insert/update/delete 시 이전 값/새 값의 key를 모아 커밋 후 get_db에서 삭제
+USER_CACHE_FIELDS = ("id", *UNIQUE_USER_FIELDS)
+NEGATIVE = b""
+# single-flight recheck에서 "없는 사용자로 캐싱됨"과 "아직 값 없음(None)"을 구분하기 위한 값
+NOT_FOUND = object()
+
+
+class UserRecord(BaseModel):
+    """캐시에 보관하는 사용자 컬럼 (UserSchema 필드 + ETag용 updated_at)"""
+    id: int
+    nickname: Optional[str] = None
+    email: Optional[str] = None
+    login_id: Optional[str] = None
+    phone: Optional[str] = None
+    role: RolesEnum
+    # 조회 API ETag용 (이 필드가 추가되기 전에 캐싱된 값은 None)
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+def user_cache_key(field: str, value: Any) -> str:
+    # MySQL 기본 collation은 대소문자를 구분하지 않으므로 key도 소문자로 통일
+    return f"user:{field}:{str(value).lower()}"
+
+
+def user_cache_keys(values: dict) -> list[str]:
+    return [user_cache_key(field, value) for field, value in values.items() if field in USER_CACHE_FIELDS and value is not None]
+
+
+class UserCache:
+    def __init__(self, ttl: int, negative_ttl: int, enabled: bool = True):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.enabled = enabled
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.store = TwoTierCache("user", prefix="user:")
+        self.flight = SingleFlight("user")
+
+    async def get_user(self, session: AsyncSession, field: str, value: Any) -> Optional[UserRecord]:
+        """field(id 또는 유니크 로그인 필드)로 사용자 조회 (캐시 → DB)"""
+        if field not in USER_CACHE_FIELDS:
+            raise ValueError(f"캐시할 수 없는 사용자 필드입니다: {field}")
+        if not self.enabled:
+            return await self._load(session, field, value)
+
+        key = user_cache_key(field, value)
+        try:
+            cached = await self.store.get(key)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f" 사용자 캐시 조회 실패 {key}: {e}")
+            return await self._load(session, field, value)
+
+        if cached == NEGATIVE:
+            self.negative_hits += 1
+            return None
+        if cached is not None:
+            self.hits += 1
+            return UserRecord.model_validate_json(cached)
+
+        self.misses += 1
+        record = await self.flight.do(
+            key,
+            lambda: self._load_and_store(session, field, value, key),
+            recheck=lambda: self._get_cached(key),
+        )
+        return None if record is NOT_FOUND else record
+
+    async def _load_and_store(self, session: AsyncSession, field: str, value: Any, key: str) -> Optional[UserRecord]:
+        record = await self._load(session, field, value)
+        await self._store(key, record)
+        return record
+
+    async def _get_cached(self, key: str):
+        """다른 워커가 채운 값 확인용 (single-flight lock 대기 중)"""
+        try:
+            cached = await self.store.get(key)
+        except Exception:
+            return None
+        if cached == NEGATIVE:
+            return NOT_FOUND
+        return UserRecord.model_validate_json(cached) if cached is not None else None
+
+    @staticmethod
+    async def _load(session: AsyncSession, field: str, value: Any) -> Optional[UserRecord]:
+        repository = UserRepository(session)
+        user = await (repository.get_user_by_id(int(value)) if field == "id" else repository.get_user_by_field(field, value))
+        return UserRecord.model_validate(user) if user else None
+
+    async def _store(self, key: str, record: Optional[UserRecord]):
+        try:
+            if record is None:
+                await self.store.set(key, NEGATIVE, ex=self.negative_ttl)
+                return
+            data = record.model_dump_json().encode("utf-8")
+            await self.store.set_many({record_key: data for record_key in user_cache_keys(record.model_dump())}, ex=self.ttl)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f" 사용자 캐시 저장 실패 {key}: {e}")
+
+    def collect(self):
+        """/metrics용 값"""
+        lookups = self.hits + self.negative_hits + self.misses
+        return [
+            ("user_cache_hits_total", "counter", "User record cache hits", self.hits),
+            ("user_cache_negative_hits_total", "counter", "User record cache negative (not found) hits", self.negative_hits),
+            ("user_cache_misses_total", "counter", "User record cache misses", self.misses),
+            ("user_cache_errors_total", "counter", "User record cache Redis errors", self.errors),
+            ("user_cache_hit_ratio", "gauge", "User record cache hit ratio since start",
+             (self.hits + self.negative_hits) / lookups if lookups else 0.0),
+        ]
+
+
+user_cache = UserCache(
+    ttl=settings.USER_CACHE_TTL,
+    negative_ttl=settings.USER_CACHE_NEGATIVE_TTL,
+    enabled=settings.USER_CACHE_ENABLED,
+)
+metrics.register_collector(user_cache.collect)
+
+
+@event.listens_for(UserModel, "after_insert")
+@event.listens_for(UserModel, "after_update")
+@event.listens_for(UserModel, "after_delete")
+def _invalidate_user_keys(mapper, connection, target):
+    """변경 전/후 값의 key를 모두 모아둔다. (새 사용자의 negative cache, 바뀐 이메일의 이전 key 포함)"""
+    session = object_session(target)
+    if session is None or not user_cache.enabled:
+        return
+
+    state = inspect(target)
+    values = []
+    for field in USER_CACHE_FIELDS:
+        history = state.attrs[field].history
+        values.extend((field, value) for value in (*history.unchanged, *history.added, *history.deleted))
+    keys = [user_cache_key(field, value) for field, value in values if value is not None]
+    session.info.setdefault(PENDING_CACHE_KEYS, set()).update(keys)
@@ -1,15 +1,16 @@
-from fastapi import Request, HTTPException
+from fastapi import Depends, HTTPException
+from cache.dependencies import get_session
+from common.middleware.session import RedisSession
 import logging
 
 logger = logging.getLogger(__name__)
 
-async def get_current_cart(request: Request) -> dict[int, int]:
+async def get_current_cart(session: RedisSession = Depends(get_session)) -> dict[int, int]:
     """
      Redis 세션에서 현재 사용자의 장바구니(cart)를 꺼내는 의존성 함수
     - 세션에 'cart'가 없으면 빈 dict 반환
     - 구조: {product_id: quantity}
     """
-    session = getattr(request.state, "session", {})
     cart_data = session.get("cart")
 
     if cart_data is None:
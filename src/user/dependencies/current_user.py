@@ -1,15 +1,16 @@
-from fastapi import Request, HTTPException
+from fastapi import Depends, HTTPException
+from cache.dependencies import get_session
+from common.middleware.session import RedisSession
 from user.schemas.response import UserSchema
 import logging
 
 logger = logging.getLogger(__name__)
 
-async def get_current_user(request: Request) -> UserSchema:
+async def get_current_user(session: RedisSession = Depends(get_session)) -> UserSchema:
     """
     request.state.session에서 인증된 사용자 정보를 꺼내는 공통 의존성
     - 세션이 없거나 손상되었을 경우 로깅 포함
     """
-    session = getattr(request.state, "session", {})
     user_data = session.get("user")
 
     if not user_data:
@@ -1,10 +1,11 @@
 # user/dependencies/optional_user.py
-from fastapi import Request
+from fastapi import Depends
+from cache.dependencies import get_session
+from common.middleware.session import RedisSession
 from typing import Optional
 from user.schemas.response import UserSchema
 
-async def get_optional_user(request: Request) -> Optional[UserSchema]:
-    session = getattr(request.state, "session", {})
+async def get_optional_user(session: RedisSession = Depends(get_session)) -> Optional[UserSchema]:
     user_data = session.get("user")
 
     if not user_data:
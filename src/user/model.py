@@ -17,7 +17,7 @@ class UserModel(Base):
     role = Column(Enum(RolesEnum), default=RolesEnum.USER)  # 기본값 USER
 
     # 관계 설정 (문자열 참조로 순환 참조 방지)
-    posts = relationship("PostModel", back_populates="user", cascade="all, delete", lazy="selectin")
+    posts = relationship("PostModel", back_populates="user", cascade="all, delete", lazy="raise")
 
 
     # pydantic 클래스로 받은 부분을 sqlalchemy.orm으로 변환해주는 작업
@@ -3,26 +3,32 @@ from sqlalchemy import select, delete
 from user.model import UserModel
 from typing import Any
 from sqlalchemy.ext.asyncio import AsyncSession
+from common.model.load_profiles import load_profile
+
+def _user_query():
+    """사용자 조회 쿼리 (로그인/토큰 인증/사용자 API 모두 user 컬럼만 필요 → 관계는 불러오지 않음)"""
+    return select(UserModel).options(*load_profile("user_auth"))
+
 
 class UserRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
     async def get_users(self) -> List[UserModel]:
-        result = await self.db.scalars(select(UserModel))
+        result = await self.db.scalars(_user_query())
         return list(result)
 
     async def get_user_by_email(self, email: str) -> UserModel | None:
-        return await self.db.scalar(select(UserModel).where(UserModel.email == email))
+        return await self.db.scalar(_user_query().where(UserModel.email == email))
 
     async def get_user_by_field(self, field: str, value: Any) -> UserModel | None:
         if not hasattr(UserModel, field):
             raise ValueError(f"UserModel에 존재하지 않는 필드입니다: {field}")
         column = getattr(UserModel, field)
-        return await self.db.scalar(select(UserModel).where(column == value))
+        return await self.db.scalar(_user_query().where(column == value))
 
     async def get_user_by_id(self, id: int) -> UserModel | None:
-        return await self.db.scalar(select(UserModel).where(UserModel.id == id))
+        return await self.db.scalar(_user_query().where(UserModel.id == id))
 
     async def create_user(self, new_user: UserModel) -> UserModel:
         self.db.add(new_user)
@@ -1,10 +1,12 @@
-from fastapi import APIRouter,Request, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter,Request, Depends, HTTPException, Header, Response, status
+from typing import List, Optional
 from user.repository import UserRepository
+from user.cache import user_cache
 from user.model import UserModel
 from user.schemas.response import UserSchema, UserListSchema
 from database.dependencies import get_db
 from cache.dependencies import get_redis
+from common.utils.etag import make_etag, etag_matches, etag_headers, not_modified
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
@@ -27,27 +29,35 @@ async def get_users(
 @router.get("/email/{email}")
 async def get_user_by_email(
     email: str,
+    response: Response,
     db: AsyncSession = Depends(get_db),
+    if_none_match: Optional[str] = Header(default=None),
 ):
-    userRepository = UserRepository(db)
-
-    user : UserModel = await userRepository.get_user_by_email(email)
+    user = await user_cache.get_user(db, "email", email)
 
     if user:
-        return UserSchema.model_validate(user)
+        etag = make_etag("user", user.id, user.updated_at)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        response.headers.update(etag_headers(etag))
+        return UserSchema.model_validate(user.model_dump())
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
                         detail="존재하지 않는 User 입니다.")
 
 @router.get("/id/{id}")
 async def get_user_by_id(
     id: int,
+    response: Response,
     db: AsyncSession = Depends(get_db),
+    if_none_match: Optional[str] = Header(default=None),
 ):
-    userRepository = UserRepository(db)
-
-    user : UserModel = await userRepository.get_user_by_id(id)
+    user = await user_cache.get_user(db, "id", id)
 
     if user:
-        return UserSchema.model_validate(user)
+        etag = make_etag("user", user.id, user.updated_at)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        response.headers.update(etag_headers(etag))
+        return UserSchema.model_validate(user.model_dump())
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
                         detail="존재하지 않는 User2 입니다.")
@@ -0,0 +1,6 @@
+# tests/conftest.py
+import sys
+from pathlib import Path
+
+# 앱 코드는 src를 기준으로 import (python -m pytest를 repo 루트에서 실행, settings는 루트의 .env 사용)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
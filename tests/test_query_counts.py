@@ -0,0 +1,195 @@
+# tests/test_query_counts.py
+import asyncio
+from contextlib import contextmanager
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+import common.model.models_registry  # noqa: F401 (모든 모델 등록)
+import database.mysql_connection as mysql_connection
+from common.model.base_model import Base
+from common.file.file_model import FileModel
+from common.file.enums.file_model_type_enum import FileModelType
+from common.image.model import ImageModel
+from common.image.enums.image_type_enum import ImageModelType
+from cart.model import CartModel, CartItemModel
+from cart.repository import CartRepository
+from product.model import ProductModel
+from post.model import PostModel
+from post.repository import PostRepository
+from post.schemas.request import PaginatePostSchema
+from post.schemas.response import PostSchema
+from user.model import UserModel
+from user.repository import UserRepository
+from user.schemas.response import UserSchema
+
+# 엔드포인트별 SQL 문장 수 (로딩 프로필 회귀 테스트)
+# - SQLite에서 before_cursor_execute로 실행된 문장을 센다.
+# - 행 수(1, 5)를 바꿔도 문장 수가 같아야 한다. → 관계별 N+1이 생기면 실패
+# - 응답 스키마 변환까지 포함 (프로필에 없는 관계에 접근하면 lazy="raise"로 실패)
+ROW_COUNTS = (1, 5)
+
+
+class StatementCounter:
+    def __init__(self):
+        self.statements: list[str] = []
+        self.active = False
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if self.active:
+            self.statements.append(statement)
+
+    @contextmanager
+    def count(self):
+        self.statements.clear()
+        self.active = True
+        try:
+            yield self.statements
+        finally:
+            self.active = False
+
+
+def run_with_db(tmp_path, monkeypatch, rows: int, scenario):
+    """rows개씩 데이터를 넣은 SQLite DB에서 scenario(session_maker, counter) 실행"""
+    async def main():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'query_counts.db'}")
+        # RoutingSession.get_bind가 쓰는 primary 엔진을 SQLite로
+        monkeypatch.setattr(mysql_connection, "async_engine", engine)
+        session_maker = sessionmaker(
+            bind=engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+            sync_session_class=mysql_connection.RoutingSession,
+        )
+        counter = StatementCounter()
+        event.listen(engine.sync_engine, "before_cursor_execute", counter)
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            async with session_maker() as session:
+                await seed(session, rows)
+            await scenario(session_maker, counter)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(main())
+
+
+async def seed(session: AsyncSession, rows: int):
+    users = [UserModel(nickname=f"user{i}", email=f"user{i}@test.com", password="hashed") for i in range(rows)]
+    products = [ProductModel(name=f"product{i}", price=1000, stock=10) for i in range(rows)]
+    session.add_all([*users, *products])
+    await session.flush()
+
+    for i, user in enumerate(users):
+        post = PostModel(title=f"title{i}", content="content", author_id=user.id, likeCount=i, commentCount=0)
+        session.add(post)
+        await session.flush()
+        session.add_all([
+            FileModel(path=f"/files/{i}-{order}", original_name=f"{order}.pdf", size=1,
+                      type=FileModelType.PDF, order=order, post_id=post.id)
+            for order in range(2)
+        ])
+        session.add(ImageModel(path=f"/images/{i}", type=ImageModelType.POST_IMAGE, post_id=post.id))
+
+    cart = CartModel(user_id=users[0].id)
+    cart.items = [CartItemModel(product_id=product.id, quantity=1) for product in products]
+    session.add(cart)
+    await session.commit()
+
+
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def test_post_detail_profile(tmp_path, monkeypatch, rows):
+    """GET /posts/{id} (post_detail): post + user JOIN, images IN, files IN"""
+    async def scenario(session_maker, counter):
+        async with session_maker() as session:
+            with counter.count() as statements:
+                post = await PostRepository(session).get_post_by_id(1)
+                PostSchema.model_validate(post)
+        assert len(statements) == 3, statements
+
+    run_with_db(tmp_path, monkeypatch, rows, scenario)
+
+
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def test_post_list_profile(tmp_path, monkeypatch, rows):
+    """게시글 전체 목록 (post_list): post + user JOIN, files IN"""
+    async def scenario(session_maker, counter):
+        async with session_maker() as session:
+            with counter.count() as statements:
+                posts = await PostRepository(session).get_posts()
+                [PostSchema.model_validate(post) for post in posts]
+        assert len(posts) == rows
+        assert len(statements) == 2, statements
+
+    run_with_db(tmp_path, monkeypatch, rows, scenario)
+
+
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def test_post_cursor_page(tmp_path, monkeypatch, rows):
+    """GET /posts (커서, 컬럼 프로젝션): 페이지 + files IN"""
+    async def scenario(session_maker, counter):
+        async with session_maker() as session:
+            with counter.count() as statements:
+                result = await PostRepository(session).get_posts_paginated(PaginatePostSchema())
+                [PostSchema.model_validate(post) for post in result.data]
+        assert len(result.data) == rows
+        assert len(statements) == 2, statements
+
+    run_with_db(tmp_path, monkeypatch, rows, scenario)
+
+
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def test_post_numbered_page(tmp_path, monkeypatch, rows):
+    """GET /posts?page=1 (exact COUNT, 같은 세션): COUNT + 페이지 + files IN"""
+    async def scenario(session_maker, counter):
+        async with session_maker() as session:
+            with counter.count() as statements:
+                result = await PostRepository(session).get_posts_paginated(PaginatePostSchema(page=1))
+                [PostSchema.model_validate(post) for post in result.data]
+        assert result.total == rows
+        assert len(statements) == 3, statements
+
+    monkeypatch.setattr("common.const.settings.settings.PAGINATION_COUNT_STRATEGY", "exact")
+    monkeypatch.setattr("common.const.settings.settings.PAGINATION_CONCURRENT_COUNT", False)
+    run_with_db(tmp_path, monkeypatch, rows, scenario)
+
+
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def test_user_auth_profile(tmp_path, monkeypatch, rows):
+    """토큰 인증 / GET /users/id/{id} / GET /users (user_auth): user 컬럼만, 게시글 등 연쇄 로딩 없음"""
+    async def scenario(session_maker, counter):
+        async with session_maker() as session:
+            repository = UserRepository(session)
+            with counter.count() as statements:
+                UserSchema.model_validate(await repository.get_user_by_id(1))
+            assert len(statements) == 1, statements
+
+            with counter.count() as statements:
+                UserSchema.model_validate(await repository.get_user_by_field("email", "user0@test.com"))
+            assert len(statements) == 1, statements
+
+            with counter.count() as statements:
+                users = await repository.get_users()
+                [UserSchema.model_validate(user) for user in users]
+            assert len(users) == rows
+            assert len(statements) == 1, statements
+
+    run_with_db(tmp_path, monkeypatch, rows, scenario)
+
+
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def test_cart_view_profile(tmp_path, monkeypatch, rows):
+    """장바구니 조회 (cart_view): cart + items IN"""
+    async def scenario(session_maker, counter):
+        async with session_maker() as session:
+            repository = CartRepository(session)
+            with counter.count() as statements:
+                cart = await repository.get_cart_by_user_id(1)
+                items = await repository.get_user_cart_dict(cart)
+        assert len(items) == rows
+        assert len(statements) == 2, statements
+
+    run_with_db(tmp_path, monkeypatch, rows, scenario)
@@ -0,0 +1,80 @@
+# tests/test_query_plans.py
+import os
+import asyncio
+import uuid
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+import common.model.models_registry  # noqa: F401 (모든 모델 등록)
+from common.model.base_model import Base
+from common.file.file_model import FileModel
+from common.file.enums.file_model_type_enum import FileModelType
+from cart.model import CartModel
+from post.model import PostModel
+from user.model import UserModel
+from database.query_plan import check_repository_queries
+
+# 저장소 쿼리 실행 계획 점검 (database/query_plan.py)
+# - QUERY_PLAN_MYSQL_URL(mysql+aiomysql://...)이 없으면 건너뛴다. 점검 전용 스키마를 지정할 것
+#   (테이블이 없으면 create_all로 만든다. DDL은 암묵적 commit이라 트랜잭션 밖에서 실행)
+# - 수천 건의 user/post/file을 트랜잭션 안에서 넣고 EXPLAIN FORMAT=JSON으로 확인한 뒤 rollback
+MYSQL_URL = os.environ.get("QUERY_PLAN_MYSQL_URL")
+USERS = 2000
+POSTS = 4000
+FILES_PER_POST = 2
+
+pytestmark = pytest.mark.skipif(not MYSQL_URL, reason="QUERY_PLAN_MYSQL_URL이 설정되지 않음")
+
+
+async def seed(session: AsyncSession):
+    # 기존 데이터와 unique 컬럼(nickname, email)이 겹치지 않도록 접두어 사용
+    prefix = uuid.uuid4().hex[:8]
+    await session.execute(insert(UserModel), [
+        {"nickname": f"{prefix}-{i}", "email": f"{prefix}-{i}@plan.test", "password": "hashed"}
+        for i in range(USERS)
+    ])
+    user_ids = (await session.scalars(
+        select(UserModel.id).where(UserModel.email.like(f"{prefix}-%")).order_by(UserModel.id)
+    )).all()
+
+    await session.execute(insert(PostModel), [
+        {"title": f"{prefix} 게시글 {i}", "content": "content", "author_id": user_ids[i % USERS],
+         "likeCount": i % 97, "commentCount": 0}
+        for i in range(POSTS)
+    ])
+    post_ids = (await session.scalars(
+        select(PostModel.id).where(PostModel.title.like(f"{prefix} %")).order_by(PostModel.id)
+    )).all()
+
+    await session.execute(insert(FileModel), [
+        {"path": f"/files/{prefix}/{post_id}-{order}", "original_name": f"{uuid.uuid4().hex}.pdf", "size": 1,
+         "type": FileModelType.PDF, "order": order, "owner_type": "post", "owner_id": post_id, "post_id": post_id}
+        for post_id in post_ids
+        for order in range(FILES_PER_POST)
+    ])
+    await session.execute(insert(CartModel), [{"user_id": user_id} for user_id in user_ids[: USERS // 2]])
+
+
+def test_repository_query_plans():
+    async def main():
+        engine = create_async_engine(MYSQL_URL, poolclass=NullPool)
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+            async with engine.connect() as conn:
+                transaction = await conn.begin()
+                try:
+                    async with AsyncSession(bind=conn, join_transaction_mode="create_savepoint") as session:
+                        await seed(session)
+                        return await check_repository_queries(session, engines=[engine.sync_engine])
+                finally:
+                    await transaction.rollback()
+        finally:
+            await engine.dispose()
+
+    report = asyncio.run(main())
+    assert report
+    assert {name: problems for name, problems in report.items() if problems} == {}